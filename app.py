@@ -1,7 +1,6 @@
 import streamlit as st
 import cmn_auth
 from streamlit.web.server.websocket_headers import _get_websocket_headers
-import boto3
 from botocore.exceptions import ClientError
 
 import jwt
@@ -9,6 +8,18 @@ from typing import Any, Dict
 import json
 import random
 
+import cmn_settings
+from cmn.bedrock.client_registry import ClientRegistry
+
+# Pre-open TLS connections for the shared clients once per server process,
+# so the first page visit does not pay client construction + handshake.
+@st.cache_resource
+def warm_up_shared_clients():
+   ClientRegistry.default().warm_up([("bedrock-runtime", cmn_settings.AWS_REGION)])
+   return True
+
+warm_up_shared_clients()
+
 ###### Get Name from OIDC
 
 #def _decode_access_token(access_token: str) -> Dict[str, Any]:
@@ -150,7 +161,7 @@ if st.button('Save Settings'):
 # Add a new section for listing Bedrock Foundation models
 st.header("Bedrock Foundation Models")
 # Initialize Bedrock client
-bedrock = boto3.client('bedrock', region_name='us-east-1')
+bedrock = ClientRegistry.default().get('bedrock', 'us-east-1')
 
 def list_bedrock_models():
     try:
@@ -1,11 +1,11 @@
 import os
-import boto3
 from typing import List
 import cmn_settings
+from cmn.bedrock.client_registry import ClientRegistry
 
 AWS_REGION = cmn_settings.AWS_REGION
 
-bedrock_agent = boto3.client('bedrock-agent', region_name=AWS_REGION)
+bedrock_agent = ClientRegistry.default().get('bedrock-agent', AWS_REGION)
 
 def list_knowledge_bases() -> List[str]:
 
@@ -0,0 +1,139 @@
+"""
+benchmarks/bench_converse.py
+============================
+Offline benchmark for the converse engine (cmn/bedrock/converse).
+
+Runs entirely against ReplayBedrockClient — no AWS credentials needed.
+
+Scenarios
+---------
+process_stream   : events/sec through the stream parser (no replay delays)
+turn latency     : end-to-end ConversationManager.run() turns with a tool
+                   loop — sequential vs concurrent vs speculative tools
+
+Usage (from the repository root)
+--------------------------------
+    python -m benchmarks.bench_converse
+    python -m benchmarks.bench_converse --recording turns.jsonl --speed 5
+"""
+
+import argparse
+import statistics
+import time
+
+from cmn.bedrock.converse import ConversationManager, process_stream
+from cmn.bedrock.converse.replay import (
+    ReplayBedrockClient,
+    load_recordings,
+    synthetic_recording,
+)
+
+
+################################################################################
+# SECTION: Fixtures
+################################################################################
+
+class _SleepToolRegistry:
+    """
+    Minimal ToolRegistry stand-in: every tool sleeps for args['sleep_s'].
+    Avoids importing cmn.tools.tool (pandas, duckdb, ...) into the benchmark.
+    """
+
+    tool_config = {"tools": []}
+
+    def invoke(self, tool_name: str, tool_args: dict):
+        time.sleep(tool_args.get("sleep_s", 0))
+        return {"tool": tool_name, "ok": True}
+
+    def for_model(self, model_id: str) -> "_SleepToolRegistry":
+        return self
+
+    def content(self, result) -> list[dict]:
+        return [{"json": {"result": result}}]
+
+
+def _tool_turn(tool_sleep_s: float) -> list[dict]:
+    """Two LLM calls: three tool requests after a preamble, then an answer."""
+    tools = [
+        ("web_search",         {"sleep_s": tool_sleep_s}),
+        ("url_content_loader", {"sleep_s": tool_sleep_s}),
+        ("sales_data",         {"sleep_s": tool_sleep_s}),
+    ]
+    return [
+        synthetic_recording(text_chunks=60, tool_calls=tools),
+        synthetic_recording(text_chunks=200),
+    ]
+
+
+################################################################################
+# SECTION: Scenarios
+################################################################################
+
+def bench_process_stream(recordings: list[dict], repeats: int) -> None:
+    client = ReplayBedrockClient(recordings, speed=0)
+    events = repeats * sum(len(r["events"]) for r in recordings)
+    start  = time.perf_counter()
+
+    for _ in range(repeats * len(recordings)):
+        process_stream(client.converse_stream()["stream"])
+
+    elapsed = time.perf_counter() - start
+    print(f"process_stream    : {events / elapsed:>12,.0f} events/sec "
+          f"({events:,} events in {elapsed:.3f}s)")
+
+
+def bench_turns(recordings: list[dict], speed: float, turns: int) -> None:
+    variants = {
+        "sequential":  dict(),
+        "concurrent":  dict(max_tool_workers=4),
+        "speculative": dict(max_tool_workers=4, speculative_tools=True),
+    }
+
+    for label, options in variants.items():
+        durations = []
+        for _ in range(turns):
+            manager = ConversationManager(
+                bedrock_client   = ReplayBedrockClient(recordings, speed=speed),
+                tool_registry    = _SleepToolRegistry(),
+                model_id         = "synthetic",
+                inference_config = {},
+                system_prompts   = [],
+                **options,
+            )
+            result = manager.run([{"role": "user", "content": [{"text": "go"}]}])
+            durations.append(result.turn_metrics.duration_ms)
+
+        durations.sort()
+        p95 = durations[min(len(durations) - 1, int(0.95 * len(durations)))]
+        print(f"turn {label:<12} : p50={statistics.median(durations):>8.1f}ms "
+              f"p95={p95:>8.1f}ms  (n={turns}, speed={speed})")
+
+
+################################################################################
+# SECTION: Main
+################################################################################
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--recording", help="JSONL file from RecordingBedrockClient")
+    parser.add_argument("--speed",   type=float, default=1.0,
+                        help="replay speed for turn latency (0 = no delays)")
+    parser.add_argument("--turns",   type=int,   default=5)
+    parser.add_argument("--repeats", type=int,   default=50)
+    parser.add_argument("--tool-sleep", type=float, default=0.3,
+                        help="seconds each synthetic tool call takes")
+    args = parser.parse_args()
+
+    if args.recording:
+        turn_recordings   = load_recordings(args.recording)
+        stream_recordings = turn_recordings
+    else:
+        turn_recordings   = _tool_turn(args.tool_sleep)
+        stream_recordings = [synthetic_recording(text_chunks=5_000)]
+
+    bench_process_stream(stream_recordings, args.repeats)
+    bench_turns(turn_recordings, args.speed, args.turns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+benchmarks/bench_imports.py
+===========================
+Cold-start cost of the converse tools per page: eager vs lazy loading.
+
+Each measurement runs in a fresh interpreter, so nothing is cached in
+sys.modules (the OS file cache is warm after the first repeat; the median
+is reported).
+
+Scenarios
+---------
+eager  : import every tool module in catalog.TOOLS — what importing
+         cmn.tools.tool used to cost every page
+lazy   : import cmn.tools.tool, then ToolRegistry.from_names(page tools)
+         — only the modules of the tools the page registers
+
+Tools whose third-party dependencies are not installed are skipped in
+both scenarios and listed, so the numbers compare the same set of modules.
+A missing cmn.* module is a broken catalog entry and fails the run.
+
+Usage (from the repository root)
+--------------------------------
+    python -m benchmarks.bench_imports
+    python -m benchmarks.bench_imports --repeats 9 --page calculator
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Tools each page registers (pages/*.py get_tool_registry)
+PAGES = {
+    "calculator":  ["expr_evaluator"],
+    "mantle":      ["url_content_loader", "web_search"],
+    "converse_v3": [
+        "expr_evaluator", "acronym_evaluator", "url_content_loader",
+        "wikipedia_loader", "aws_docs", "datetime_tool", "sales_data",
+        "product_query", "render_chart", "render_sales_kpi", "sales_forecast",
+        "sales_anomaly_detector", "create_pptx", "create_pdf",
+    ],
+    "converse_v2": [
+        "expr_evaluator", "acronym_evaluator", "url_content_loader",
+        "wikipedia_loader", "datetime_tool", "sales_data", "product_query",
+        "render_chart", "render_sales_kpi", "sales_anomaly_detector",
+        "sales_forecast", "holiday_checker", "aws_docs", "eda_profile",
+        "eda_correlation", "eda_group", "create_pptx", "create_pdf",
+    ],
+}
+
+# Runs in the child interpreter; argv[1] = "eager" | "lazy", argv[2] = JSON tool names
+_CHILD = r"""
+import importlib, json, sys, time
+
+scenario, names = sys.argv[1], json.loads(sys.argv[2])
+start = time.perf_counter()
+
+
+def missing_dependency(exc):
+    # Only a third-party package may be absent; our own modules must import
+    return exc.name is not None and exc.name.split(".")[0] != "cmn"
+
+
+from cmn.tools.tool import ToolRegistry
+from cmn.tools.tool.catalog import TOOLS, tool_class
+
+skipped, tools = [], []
+if scenario == "eager":
+    for name, (module, _) in TOOLS.items():
+        try:
+            importlib.import_module(module)
+        except ImportError as exc:
+            if not missing_dependency(exc):
+                raise
+            skipped.append(name)
+names = [n for n in names if n not in skipped]
+for name in names:
+    try:
+        tools.append(tool_class(name)())
+    except ImportError as exc:
+        if not missing_dependency(exc):
+            raise
+        skipped.append(name)
+ToolRegistry(tools)
+
+print(json.dumps({
+    "ms":      1000 * (time.perf_counter() - start),
+    "modules": len(sys.modules),
+    "skipped": sorted(set(skipped)),
+}))
+"""
+
+
+################################################################################
+# SECTION: Measurement
+################################################################################
+
+def _run(scenario: str, names: list[str]) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, scenario, json.dumps(names)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def bench_page(page: str, names: list[str], repeats: int) -> None:
+    runs = {scenario: [_run(scenario, names) for _ in range(repeats)]
+            for scenario in ("eager", "lazy")}
+    ms   = {scenario: statistics.median(r["ms"] for r in rows) for scenario, rows in runs.items()}
+    mods = {scenario: rows[0]["modules"] for scenario, rows in runs.items()}
+
+    print(f"{page:<12} : eager={ms['eager']:>7.1f}ms ({mods['eager']:>4} modules)  "
+          f"lazy={ms['lazy']:>7.1f}ms ({mods['lazy']:>4} modules)  "
+          f"saved={ms['eager'] - ms['lazy']:>7.1f}ms ({100 * (1 - ms['lazy'] / ms['eager']):.0f}%)")
+    skipped = runs["eager"][0]["skipped"]
+    if skipped:
+        print(f"{'':<12}   not installed, skipped: {', '.join(skipped)}")
+
+
+################################################################################
+# SECTION: Main
+################################################################################
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--page", choices=sorted(PAGES), help="only this page")
+    args = parser.parse_args()
+
+    for page, names in PAGES.items():
+        if args.page in (None, page):
+            bench_page(page, names, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
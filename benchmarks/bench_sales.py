@@ -0,0 +1,114 @@
+"""
+benchmarks/bench_sales.py
+=========================
+Offline benchmark for the Parquet-backed sales store
+(cmn/tools/tool/sales/store.py).
+
+Generates Hive-partitioned sales data with cmn/tools/tool/sales/generate.py
+(once per size, reused on later runs) and times the store queries behind
+sales_data and sales_anomaly_detector, once aggregating the raw Parquet
+rows (rollup=False) and once answered from the rollup cube.
+
+Scenarios
+---------
+setup            : store construction (cube: full build) + first query
+monthly          : get_monthly_sales, one year, no filters
+monthly_region   : get_monthly_sales, one year, region filter
+by_month         : get_sales_by_month, one year / month (partition pruned)
+series           : sales_anomaly_detector input, every metric per region × category
+
+Usage (from the repository root)
+--------------------------------
+    python -m benchmarks.bench_sales
+    python -m benchmarks.bench_sales --rows 1M 10M 100M --data /tmp/sales_bench
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from cmn.tools.tool.sales.generate import generate_sales_parquet
+from cmn.tools.tool.sales.store import ParquetSalesStore
+
+_SUFFIXES = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+
+def _parse_rows(value: str) -> int:
+    value = value.upper().replace("_", "")
+    if value[-1] in _SUFFIXES:
+        return int(float(value[:-1]) * _SUFFIXES[value[-1]])
+    return int(value)
+
+
+################################################################################
+# SECTION: Fixtures
+################################################################################
+
+def _dataset(data_dir: str, rows: int, regenerate: bool) -> str:
+    """Root of a generated dataset with `rows` rows (generated if missing)."""
+    root = os.path.join(data_dir, f"rows_{rows}")
+    if regenerate or not os.path.isdir(os.path.join(root, "sales")):
+        start = time.perf_counter()
+        generate_sales_parquet(root, rows)
+        print(f"generate {rows:>13,} rows : {time.perf_counter() - start:8.1f}s")
+    return root
+
+
+################################################################################
+# SECTION: Scenarios
+################################################################################
+
+def _time_ms(fn, repeats: int) -> list[float]:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return sorted(durations)
+
+
+def bench_store(root: str, rows: int, repeats: int) -> None:
+    for mode, rollup in (("raw", False), ("cube", True)):
+        start = time.perf_counter()
+        store = ParquetSalesStore(root, rollup=rollup)
+        store.monthly(2024)
+        print(f"{rows:>13,} rows  {mode:<4} setup          : "
+              f"{(time.perf_counter() - start) * 1000:8.1f}ms")
+
+        scenarios = {
+            "monthly":        lambda: store.monthly(2024),
+            "monthly_region": lambda: store.monthly(2024, region="North"),
+            "by_month":       lambda: store.by_month(2024, 6),
+            "series":         lambda: store.monthly_series(2024, group_by=("region", "category")),
+        }
+        for label, fn in scenarios.items():
+            durations = _time_ms(fn, repeats)
+            p95 = durations[min(len(durations) - 1, int(0.95 * len(durations)))]
+            print(f"{rows:>13,} rows  {mode:<4} {label:<14} : "
+                  f"p50={statistics.median(durations):>8.2f}ms "
+                  f"p95={p95:>8.2f}ms  (n={repeats})")
+
+
+################################################################################
+# SECTION: Main
+################################################################################
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", nargs="+", default=["1M"],
+                        help="dataset sizes, e.g. 1M 10M 100M")
+    parser.add_argument("--data", default="data/sales_bench",
+                        help="directory for generated datasets (reused across runs)")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--regenerate", action="store_true",
+                        help="rewrite datasets even if they exist")
+    args = parser.parse_args()
+
+    for rows in map(_parse_rows, args.rows):
+        root = _dataset(args.data, rows, args.regenerate)
+        bench_store(root, rows, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
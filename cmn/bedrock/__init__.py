@@ -6,11 +6,17 @@ Bedrock client management and conversation utilities.
 Typical imports
 ---------------
     from cmn.bedrock.client_manager import BedrockClientFactory
+    from cmn.bedrock.client_registry import ClientRegistry
+    from cmn.bedrock.rate_limiter import RateLimiter
     from cmn.bedrock.converse import ConversationManager, StreamResult
 """
 
 from cmn.bedrock.client_manager import BedrockClientFactory
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.bedrock.rate_limiter import RateLimiter
 
 __all__ = [
     'BedrockClientFactory',
+    'ClientRegistry',
+    'RateLimiter',
 ]
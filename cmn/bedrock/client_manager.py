@@ -7,7 +7,7 @@ Usage
 -----
     from cmn.bedrock.client_manager import BedrockClientFactory
     
-    # Create a bedrock-runtime client
+    # Shared bedrock-runtime client (one per process, see client_registry.py)
     bedrock_client = BedrockClientFactory.bedrock_runtime(region='us-east-1')
     
     # Use in a cached Streamlit function
@@ -16,22 +16,24 @@ Usage
     @st.cache_resource
     def get_bedrock_client(region):
         return BedrockClientFactory.bedrock_runtime(region)
+
+    # Multi-region client with failover (and optional hedging)
+    pool_client = BedrockClientFactory.bedrock_runtime_pool(
+        regions=['us-east-1', 'us-west-2'],
+    )
 """
 
 import boto3
 from botocore.config import Config
 
+from cmn.bedrock.client_registry import ClientRegistry
+
 
 class BedrockClientFactory:
-    """Factory for creating Bedrock boto3 clients with production-ready configuration."""
-
-    # Default configuration for all Bedrock clients
-    _DEFAULT_CONFIG = Config(
-        max_pool_connections=10,
-        retries={'max_attempts': 3, 'mode': 'adaptive'},
-        connect_timeout=5,
-        read_timeout=60,
-    )
+    """
+    Factory for creating Bedrock boto3 clients with production-ready configuration.
+    Shared clients use the retry / timeout base config in client_registry.py.
+    """
 
     @classmethod
     def bedrock_runtime(cls, region: str, config: Config = None) -> object:
@@ -43,18 +45,20 @@ class BedrockClientFactory:
         region : str
             AWS region (e.g., 'us-east-1', 'us-west-2')
         config : botocore.config.Config, optional
-            Custom Config object. Defaults to production-ready settings.
+            Custom Config object — returns a new, unshared client.
+            Defaults to the process-wide shared client.
 
         Returns
         -------
         boto3.client
             A bedrock-runtime client with:
-            - Connection pooling (max 10 connections)
+            - Connection pool sized to the expected concurrency (min 10),
+              shared across the process (ClientRegistry)
             - Adaptive retry strategy (3 attempts)
             - 5s connect timeout, 60s read timeout
         """
         if config is None:
-            config = cls._DEFAULT_CONFIG
+            return ClientRegistry.default().get('bedrock-runtime', region)
 
         return boto3.client(
             'bedrock-runtime',
@@ -62,6 +66,50 @@ class BedrockClientFactory:
             config=config,
         )
 
+    @classmethod
+    def bedrock_runtime_pool(
+        cls,
+        regions:           list[str],
+        config:            Config = None,
+        failure_threshold: int = 3,
+        cooldown_s:        float = 30.0,
+        hedge:             bool = False,
+        hedge_after_s:     float = None,
+    ) -> object:
+        """
+        Create a multi-region Bedrock runtime client.
+
+        Parameters
+        ----------
+        regions : list[str]
+            Regions in preference order (first = primary)
+        config : botocore.config.Config, optional
+            Custom Config object applied to every regional client.
+        failure_threshold : int
+            Consecutive retryable failures before a region's breaker opens
+        cooldown_s : float
+            Seconds an open breaker waits before letting calls through again
+        hedge : bool
+            Send a duplicate converse_stream to the next region when the
+            first event is slow
+        hedge_after_s : float, optional
+            Fixed hedge delay; None = rolling p95 of first-event latency
+
+        Returns
+        -------
+        RegionPoolClient
+            Drop-in bedrock-runtime client — see cmn/bedrock/region_pool.py
+        """
+        from cmn.bedrock.region_pool import RegionPoolClient
+
+        return RegionPoolClient(
+            {region: cls.bedrock_runtime(region, config) for region in regions},
+            failure_threshold = failure_threshold,
+            cooldown_s        = cooldown_s,
+            hedge             = hedge,
+            hedge_after_s     = hedge_after_s,
+        )
+
     @classmethod
     def bedrock_agents_runtime(cls, region: str, config: Config = None) -> object:
         """
@@ -72,15 +120,15 @@ class BedrockClientFactory:
         region : str
             AWS region
         config : botocore.config.Config, optional
-            Custom Config object.
+            Custom Config object — returns a new, unshared client.
 
         Returns
         -------
         boto3.client
-            A bedrock-agents-runtime client
+            A bedrock-agents-runtime client (shared when config is None)
         """
         if config is None:
-            config = cls._DEFAULT_CONFIG
+            return ClientRegistry.default().get('bedrock-agent-runtime', region)
 
         return boto3.client(
             'bedrock-agent-runtime',
@@ -98,15 +146,15 @@ class BedrockClientFactory:
         region : str
             AWS region
         config : botocore.config.Config, optional
-            Custom Config object.
+            Custom Config object — returns a new, unshared client.
 
         Returns
         -------
         boto3.client
-            A bedrock client (for model management)
+            A bedrock client (for model management, shared when config is None)
         """
         if config is None:
-            config = cls._DEFAULT_CONFIG
+            return ClientRegistry.default().get('bedrock', region)
 
         return boto3.client(
             'bedrock',
@@ -0,0 +1,171 @@
+"""
+cmn/bedrock/client_registry.py
+==============================
+Process-wide registry of shared boto3 clients.
+
+boto3 clients are thread-safe, so every page, session and thread can share
+one client per (service, region, config) instead of building its own at
+import time. Sharing also shares the urllib3 connection pool, so TLS
+connections opened by one visitor are reused by the next.
+
+Features
+--------
+- get(service, region, **config)  : cached client, created once under a lock
+                                    from a dedicated boto3 Session
+- pool size                       : max_pool_connections defaults to the
+                                    expected concurrency (env
+                                    AWS_CLIENT_EXPECTED_CONCURRENCY, min 10)
+- warm_up(...)                    : pre-opens TLS connections so the first
+                                    page visit skips the handshake
+- stats()                         : pool saturation per client
+
+Usage
+-----
+    from cmn.bedrock.client_registry import ClientRegistry
+
+    clients = ClientRegistry.default()
+    bedrock_runtime = clients.get('bedrock-runtime', 'us-east-1')
+
+    # Once at server start (app.py)
+    clients.warm_up([('bedrock-runtime', 'us-east-1')])
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+_BASE_CONFIG = Config(
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+
+class ClientRegistry:
+    """Shared, lazily created boto3 clients keyed by (service, region, config)."""
+
+    _default      = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, expected_concurrency: int = 10, base_config: Config = _BASE_CONFIG):
+        self.expected_concurrency = expected_concurrency
+        self.base_config          = base_config
+        self._session             = boto3.session.Session()
+        self._clients             = {}
+        self._lock                = threading.Lock()
+        self._warmed              = set()
+
+    @classmethod
+    def default(cls) -> "ClientRegistry":
+        """The process-wide registry (created on first use)."""
+        with cls._default_lock:
+            if cls._default is None:
+                concurrency = int(os.environ.get("AWS_CLIENT_EXPECTED_CONCURRENCY", "10"))
+                cls._default = cls(expected_concurrency=max(10, concurrency))
+            return cls._default
+
+    # ── Clients ───────────────────────────────────────────────────────────────
+
+    def get(self, service: str, region: Optional[str] = None, **config_overrides):
+        """
+        Shared client for (service, region, config_overrides).
+
+        config_overrides are botocore Config options (e.g. read_timeout=300);
+        max_pool_connections defaults to the expected concurrency.
+        """
+        config_overrides.setdefault('max_pool_connections', self.expected_concurrency)
+        key = (service, region, repr(sorted(config_overrides.items())))
+
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._session.client(
+                    service,
+                    region_name = region,
+                    config      = self.base_config.merge(Config(**config_overrides)),
+                )
+                self._clients[key] = client
+                logger.info("Created shared client: service=%s region=%s pool=%s",
+                            service, region, config_overrides['max_pool_connections'])
+            return client
+
+    # ── Warm-up ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _connection_pool(client):
+        """
+        urllib3 connection pool behind a client's endpoint.
+        Relies on botocore internals — returns None if they change.
+        """
+        try:
+            endpoint = client._endpoint
+            manager  = endpoint.http_session._manager
+            return manager.connection_from_url(endpoint.host)
+        except Exception as err:
+            logger.debug("Connection pool not reachable: %s", err)
+            return None
+
+    def warm_up(self, targets: list[tuple[str, str]], connections: int = 2) -> None:
+        """
+        Create the clients in targets and pre-open `connections` TLS
+        connections each. Idempotent — already-warmed clients are skipped.
+        Failures are logged, never raised: warm-up must not break startup.
+        """
+        for service, region in targets:
+            if (service, region) in self._warmed:
+                continue
+            self._warmed.add((service, region))
+
+            pool = self._connection_pool(self.get(service, region))
+            if pool is None:
+                continue
+
+            opened = []
+            try:
+                for _ in range(min(connections, pool.pool.maxsize)):
+                    conn = pool._get_conn()
+                    conn.connect()
+                    opened.append(conn)
+            except Exception as err:
+                logger.warning("Warm-up failed for %s/%s: %s", service, region, err)
+            finally:
+                for conn in opened:
+                    pool._put_conn(conn)
+            logger.info("Warmed %d connection(s) for %s/%s", len(opened), service, region)
+
+    # ── Metrics ───────────────────────────────────────────────────────────────
+
+    def stats(self) -> list[dict]:
+        """
+        Pool usage per client:
+            max_pool    : configured pool size
+            in_use      : connections currently checked out
+            saturation  : in_use / max_pool (1.0 = requests start waiting)
+            requests    : requests served by the pool
+        """
+        rows = []
+        for (service, region, _), client in list(self._clients.items()):
+            pool = self._connection_pool(client)
+            if pool is None:
+                continue
+            max_pool = pool.pool.maxsize
+            in_use   = max_pool - pool.pool.qsize()
+            rows.append({
+                "service":    service,
+                "region":     region,
+                "max_pool":   max_pool,
+                "in_use":     in_use,
+                "saturation": round(in_use / max_pool, 2) if max_pool else 0.0,
+                "requests":   pool.num_requests,
+            })
+        return rows
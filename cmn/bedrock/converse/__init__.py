@@ -6,14 +6,20 @@ Public API for the Bedrock converse streaming package.
 Typical import
 --------------
     from cmn.bedrock.converse import ConversationManager, StreamResult
+    from cmn.bedrock.converse import AsyncConversationManager
 """
 
 from cmn.bedrock.converse.models import (
     ToolInvocation,
     StreamMetrics,
+    TurnMetrics,
     StreamResult,
     STOP_REASON_MESSAGES,
     _EXCEPTION_EVENTS,
 )
 from cmn.bedrock.converse.stream_processor import process_stream
-from cmn.bedrock.converse.conversation_manager import ConversationManager
\ No newline at end of file
+from cmn.bedrock.converse.cache_planner import PromptCachePlanner
+from cmn.bedrock.converse.context_window import ContextWindowManager
+from cmn.bedrock.converse.async_stream_processor import process_stream_async
+from cmn.bedrock.converse.conversation_manager import ConversationManager
+from cmn.bedrock.converse.async_conversation_manager import AsyncConversationManager
\ No newline at end of file
@@ -0,0 +1,317 @@
+"""
+cmn/bedrock/converse/async_conversation_manager.py
+===================================================
+asyncio-native counterpart of ConversationManager.
+
+Many conversations can share one event loop per process instead of each
+holding a Streamlit script thread for the whole converse_stream + tool loop.
+
+Same constructor, same request shape (ConversationManager._build_request),
+same callbacks — which may be plain callables or coroutine functions:
+
+    on_text_delta(chunk: str)
+    on_stream_result(result: StreamResult)
+    on_tool_invoked(tool_name: str, tool_args: dict, tool_result: Any)
+
+Clients
+-------
+An async client (e.g. aiobotocore) is awaited directly. A regular boto3
+client is driven from worker threads, one blocking call at a time, so the
+event loop itself never blocks.
+
+Tools are awaited through ToolRegistry.ainvoke → AbstractBedrockConverseTool
+.ainvoke, which defaults to running invoke() in a worker thread.
+
+Usage
+-----
+    # Inside a coroutine
+    manager = AsyncConversationManager(bedrock_client, registry, ...)
+    result  = await manager.run(message_history, on_text_delta=...)
+
+    # From a Streamlit page (blocking; runs on the shared process loop and
+    # fires callbacks on the calling thread)
+    result  = manager.run_sync(message_history, on_text_delta=...)
+"""
+
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from botocore.exceptions import ClientError
+
+from cmn.bedrock.converse.async_stream_processor import (
+    _maybe_await,
+    process_stream_async,
+)
+from cmn.bedrock.converse.conversation_manager import ConversationManager
+from cmn.bedrock.converse.models import StreamResult, ToolInvocation, TurnMetrics
+from cmn.bedrock.rate_limiter import RateLimitTimeout
+
+logger = logging.getLogger(__name__)
+
+
+################################################################################
+# SECTION: Shared Event Loop
+################################################################################
+
+_LOOP:      Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK: threading.Lock                      = threading.Lock()
+
+
+def get_shared_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the process-wide event loop, starting its daemon thread on
+    first use. All run_sync() calls schedule their coroutine here.
+    """
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target = loop.run_forever,
+                name   = "converse-event-loop",
+                daemon = True,
+            ).start()
+            _LOOP = loop
+        return _LOOP
+
+
+################################################################################
+# SECTION: AsyncConversationManager
+################################################################################
+
+class AsyncConversationManager(ConversationManager):
+    """
+    Orchestrates multi-turn conversations on asyncio.
+    converse_stream is called ONLY inside _call_llm().
+
+    max_tool_workers bounds how many tools of one turn run at once,
+    tool_timeout caps each tool, and speculative_tools dispatches tools on
+    contentBlockStop — all with the same meaning as in ConversationManager.
+    """
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    async def run(
+        self,
+        message_history:  list,
+        on_text_delta:    Optional[Callable] = None,
+        on_stream_result: Optional[Callable] = None,
+        on_tool_invoked:  Optional[Callable] = None,
+    ) -> StreamResult:
+        """
+        Run a full conversation turn, including any tool-use loops.
+
+        Appends to a local copy of message_history — the caller's list
+        is never mutated.
+
+        Returns
+        -------
+        StreamResult from the final LLM response, with turn_metrics set
+        """
+        messages     = message_history.copy()
+        semaphore    = asyncio.Semaphore(self.max_tool_workers)
+        turn_start   = time.monotonic()
+        turn_metrics = TurnMetrics()
+
+        while True:
+            # toolUseId → Task for tools dispatched during the stream
+            prefetched = {}
+            on_tool_ready = None
+            if self.speculative_tools:
+                def on_tool_ready(tool_inv: ToolInvocation) -> None:
+                    prefetched[tool_inv.tool_use_id] = asyncio.create_task(
+                        self._run_tool(tool_inv, semaphore)
+                    )
+
+            result = await self._call_llm(messages, on_text_delta, on_tool_ready)
+            turn_metrics.iterations.append(result.metrics)
+
+            if on_stream_result:
+                await _maybe_await(on_stream_result(result))
+
+            if not result.has_tool_call:
+                for task in prefetched.values():
+                    task.cancel()
+                turn_metrics.duration_ms = round(
+                    (time.monotonic() - turn_start) * 1000, 1)
+                result.turn_metrics = turn_metrics
+                return result
+
+            # ── Build assistant message for ALL tool calls ────────────────────
+            assistant_content = [
+                {
+                    "toolUse": {
+                        "toolUseId": tool_inv.tool_use_id,
+                        "name":      tool_inv.tool_name,
+                        "input":     tool_inv.tool_arguments,
+                    }
+                }
+                for tool_inv in result.tool_invocations
+            ]
+            messages.append({"role": "assistant", "content": assistant_content})
+
+            # ── Execute tools concurrently, collect results in order ──────────
+            tools_start = time.monotonic()
+            tasks = [
+                prefetched.get(tool_inv.tool_use_id)
+                or asyncio.create_task(self._run_tool(tool_inv, semaphore))
+                for tool_inv in result.tool_invocations
+            ]
+
+            tool_results_content = []
+            try:
+                for tool_inv, task in zip(result.tool_invocations, tasks):
+                    tool_result = await task
+
+                    if on_tool_invoked:
+                        await _maybe_await(on_tool_invoked(
+                            tool_inv.tool_name,
+                            tool_inv.tool_arguments,
+                            tool_result,
+                        ))
+
+                    tool_results_content.append({
+                        "toolResult": {
+                            "toolUseId": tool_inv.tool_use_id,
+                            "content":   self.registry.content(tool_result),
+                        }
+                    })
+            finally:
+                for task in tasks:
+                    task.cancel()
+            turn_metrics.tool_ms.append(
+                round((time.monotonic() - tools_start) * 1000, 1))
+
+            # ── Single user message with all tool results ─────────────────────
+            messages.append({"role": "user", "content": tool_results_content})
+            # loop → model sees all tool results and continues
+
+    def run_sync(
+        self,
+        message_history:  list,
+        on_text_delta:    Optional[Callable] = None,
+        on_stream_result: Optional[Callable] = None,
+        on_tool_invoked:  Optional[Callable] = None,
+    ) -> StreamResult:
+        """
+        Blocking wrapper for existing (sync) pages.
+
+        The coroutine runs on the shared process event loop. Sync callbacks
+        are queued back to — and executed on — the calling thread, so
+        Streamlit calls inside them keep their script run context.
+        """
+        calls = queue.Queue()
+
+        def _marshal(fn: Optional[Callable]) -> Optional[Callable]:
+            if fn is None or inspect.iscoroutinefunction(fn):
+                return fn
+            return lambda *args: calls.put((fn, args))
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.run(
+                message_history,
+                on_text_delta    = _marshal(on_text_delta),
+                on_stream_result = _marshal(on_stream_result),
+                on_tool_invoked  = _marshal(on_tool_invoked),
+            ),
+            get_shared_event_loop(),
+        )
+
+        while not (future.done() and calls.empty()):
+            try:
+                fn, args = calls.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            fn(*args)
+
+        return future.result()
+
+    # ── Private ───────────────────────────────────────────────────────────────
+
+    async def _run_tool(
+        self,
+        tool_inv:  ToolInvocation,
+        semaphore: asyncio.Semaphore,
+    ) -> Any:
+        """
+        Await one tool, bounded by max_tool_workers and tool_timeout.
+        A timeout becomes an error result the model can reason about.
+        """
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    self.registry.ainvoke(
+                        tool_inv.tool_name,
+                        tool_inv.tool_arguments,
+                    ),
+                    timeout=self.tool_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Tool '%s' (id=%s) timed out after %ss",
+                               tool_inv.tool_name, tool_inv.tool_use_id,
+                               self.tool_timeout)
+                return {
+                    "error": f"Tool '{tool_inv.tool_name}' timed out "
+                             f"after {self.tool_timeout}s",
+                }
+
+    async def _call_llm(
+        self,
+        messages:      list,
+        on_text_delta: Optional[Callable],
+        on_tool_ready: Optional[Callable] = None,
+    ) -> StreamResult:
+        """
+        Single converse_stream call.
+        Every LLM call in this session goes through here.
+
+        Returns
+        -------
+        StreamResult — errors list populated on ClientError
+        """
+        reservation = result = None
+        try:
+            kwargs        = self._build_request(messages)
+            reservation   = await asyncio.to_thread(self._acquire, kwargs)
+            request_start = time.monotonic()
+
+            if inspect.iscoroutinefunction(self.client.converse_stream):
+                response = await self.client.converse_stream(**kwargs)
+            else:
+                response = await asyncio.to_thread(
+                    self.client.converse_stream, **kwargs
+                )
+
+            stream = response['stream']
+            try:
+                result = await process_stream_async(stream, on_text_delta, on_tool_ready,
+                                                    request_start)
+                self._observe(result)
+                return result
+            finally:
+                if hasattr(stream, 'close'):
+                    try:
+                        await _maybe_await(stream.close())
+                    except Exception as close_err:
+                        logger.warning("Error closing stream: %s", close_err)
+
+        except ClientError as err:
+            msg = err.response["Error"]["Message"]
+            logger.error("ClientError in _call_llm: %s", msg)
+            r = StreamResult()
+            r.errors.append(msg)
+            return r
+
+        except RateLimitTimeout as err:
+            logger.error("Rate limit in _call_llm: %s", err)
+            r = StreamResult()
+            r.errors.append(str(err))
+            return r
+
+        finally:
+            self._settle(reservation, result)
@@ -0,0 +1,103 @@
+"""
+cmn/bedrock/converse/async_stream_processor.py
+===============================================
+asyncio counterpart of stream_processor.process_stream.
+
+No boto3 client calls, no streamlit, no tool execution.
+Event parsing is delegated to stream_processor._EventParser so the sync
+and async paths can never drift apart.
+
+Functions
+---------
+process_stream_async(stream, on_text_delta, on_tool_ready)
+                          : main entry point — async iteration over events
+aiter_events(stream)      : adapts a sync or async event stream to an
+                            async iterator
+
+Callbacks
+---------
+on_text_delta and on_tool_ready may be plain callables or coroutine
+functions — the result is awaited when it is awaitable.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import AsyncIterator, Callable, Optional
+
+from cmn.bedrock.converse.models import StreamResult
+from cmn.bedrock.converse.stream_processor import _EventParser
+
+logger = logging.getLogger(__name__)
+
+_STREAM_END = object()
+
+
+################################################################################
+# SECTION: Internal Helpers
+################################################################################
+
+async def _maybe_await(value) -> None:
+    """Await value if a callback returned a coroutine / awaitable."""
+    if inspect.isawaitable(value):
+        await value
+
+
+async def aiter_events(stream) -> AsyncIterator[dict]:
+    """
+    Yield events from either an async stream (e.g. aiobotocore) or a
+    blocking boto3 EventStream.
+
+    A blocking stream is advanced one event at a time in the default
+    executor, so the event loop keeps serving other conversations while
+    this one waits on the network.
+    """
+    if hasattr(stream, '__aiter__'):
+        async for event in stream:
+            yield event
+        return
+
+    iterator = iter(stream)
+    while True:
+        event = await asyncio.to_thread(next, iterator, _STREAM_END)
+        if event is _STREAM_END:
+            return
+        yield event
+
+
+################################################################################
+# SECTION: Main Entry Point
+################################################################################
+
+async def process_stream_async(
+    stream,
+    on_text_delta: Optional[Callable] = None,
+    on_tool_ready: Optional[Callable] = None,
+    request_start: Optional[float] = None,
+) -> StreamResult:
+    """
+    Async iterate a converse_stream event stream and return a StreamResult.
+
+    Parameters
+    ----------
+    stream        : response['stream'] — async iterable or boto3 EventStream
+    on_text_delta : optional callback (sync or async) for each text chunk
+    on_tool_ready : optional callback (sync or async) fired with each
+                    ToolInvocation as soon as its arguments are finalized
+    request_start : time.monotonic() taken before converse_stream was called
+
+    Returns
+    -------
+    StreamResult  : fully populated after all events consumed
+    """
+    parser = _EventParser(request_start)
+
+    async for event in aiter_events(stream):
+        chunk, tool = parser.feed(event)
+
+        if chunk is not None and on_text_delta:
+            await _maybe_await(on_text_delta(chunk))
+        if tool is not None and on_tool_ready:
+            await _maybe_await(on_tool_ready(tool))
+
+    return parser.finish()
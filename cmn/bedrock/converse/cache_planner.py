@@ -0,0 +1,121 @@
+"""
+cmn/bedrock/converse/cache_planner.py
+======================================
+Places Bedrock prompt-cache checkpoints (cachePoint blocks) on a
+converse_stream request.
+
+Tool-use loops resend the same system prompt, toolConfig and growing
+history on every iteration. Marking those prefixes with cachePoint lets
+Bedrock serve them from cache on the next call instead of re-reading them.
+
+Checkpoints (Bedrock allows at most 4 per request)
+--------------------------------------------------
+1. after the system prompt
+2. after the tool definitions        (models with prompt_caching_tools)
+3. on the latest user message        — sliding; written this call
+4. on the previous user message      — sliding; read back from the
+                                        checkpoint written one call earlier
+
+Model support is read from cmn/bedrock_models.py feature flags
+('prompt_caching', 'prompt_caching_tools'). Unknown model IDs are left
+untouched.
+
+Usage
+-----
+    planner = PromptCachePlanner.for_model(model_id)   # None if unsupported
+    if planner:
+        kwargs = planner.apply(kwargs)
+"""
+
+import logging
+from typing import Optional
+
+from cmn.bedrock_models import FoundationModel
+
+logger = logging.getLogger(__name__)
+
+CACHE_POINT       = {"cachePoint": {"type": "default"}}
+MAX_CACHE_POINTS  = 4
+
+
+class PromptCachePlanner:
+    """
+    Inserts cachePoint blocks into converse_stream kwargs.
+    Never mutates the caller's system prompts, tool config or messages —
+    only the containers it touches are copied.
+    """
+
+    def __init__(
+        self,
+        cache_system:        bool = True,
+        cache_tools:         bool = True,
+        history_checkpoints: int  = 2,
+    ):
+        self.cache_system        = cache_system
+        self.cache_tools         = cache_tools
+        self.history_checkpoints = history_checkpoints
+
+    @classmethod
+    def for_model(cls, model_id: str, **kwargs) -> Optional["PromptCachePlanner"]:
+        """
+        Planner configured for model_id, or None if the model does not
+        support prompt caching (or is not listed in bedrock_models).
+        """
+        model = FoundationModel.find(model_id)
+        if model is None or not model.isFeatureSupported('prompt_caching'):
+            return None
+        kwargs.setdefault('cache_tools', model.isFeatureSupported('prompt_caching_tools'))
+        return cls(**kwargs)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def apply(self, kwargs: dict) -> dict:
+        """Return a copy of converse_stream kwargs with cachePoints inserted."""
+        kwargs = dict(kwargs)
+        budget = MAX_CACHE_POINTS
+
+        if self.cache_system and kwargs.get('system'):
+            kwargs['system'] = list(kwargs['system']) + [CACHE_POINT]
+            budget -= 1
+
+        tool_config = kwargs.get('toolConfig')
+        if self.cache_tools and tool_config and tool_config.get('tools'):
+            kwargs['toolConfig'] = {
+                **tool_config,
+                'tools': list(tool_config['tools']) + [CACHE_POINT],
+            }
+            budget -= 1
+
+        if kwargs.get('messages'):
+            kwargs['messages'] = self._mark_history(
+                kwargs['messages'],
+                min(self.history_checkpoints, budget),
+            )
+
+        return kwargs
+
+    # ── Private ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _mark_history(messages: list, count: int) -> list:
+        """
+        Append a cachePoint to the last `count` user messages.
+        User turns end every loop iteration (prompt or toolResults), so the
+        checkpoint slides forward as the history grows.
+        """
+        if count <= 0:
+            return messages
+
+        messages = list(messages)
+        marked   = 0
+
+        for idx in range(len(messages) - 1, -1, -1):
+            if marked >= count:
+                break
+            msg = messages[idx]
+            if msg.get('role') != 'user' or not msg.get('content'):
+                continue
+            messages[idx] = {**msg, 'content': list(msg['content']) + [CACHE_POINT]}
+            marked += 1
+
+        return messages
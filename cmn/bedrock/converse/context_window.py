@@ -0,0 +1,235 @@
+"""
+cmn/bedrock/converse/context_window.py
+=======================================
+Token-budgeted context window for long conversations.
+
+Pages used to trim history by message count (MAX_MESSAGES), which ignores
+how large each message is — one pasted document or sales_data result can
+outweigh a hundred short turns. ContextWindowManager keeps the request
+under an input-token budget instead.
+
+How it works
+------------
+- Every message gets a token estimate (characters / chars_per_token, with
+  fixed costs for images). Estimates are cached per message object, so each
+  fit() only estimates messages it has not seen before.
+- The estimate is calibrated after each response from the input tokens
+  Bedrock reports in the metadata event (observe(), called by
+  ConversationManager) — no extra API call on the request path.
+  calibrate() can still measure against the count_tokens API (same call
+  as pages/1_count_token.py), e.g. from a background thread.
+- When over budget, the oldest *turns* are evicted. A turn starts at a user
+  prompt and runs until the next one, so toolUse / toolResult pairs are
+  never split and the history always starts with a user message.
+- Optionally, evicted turns are condensed by a summarizer callable and the
+  summary is prepended to the first kept user message.
+
+Usage
+-----
+    window = ContextWindowManager(
+        max_input_tokens = 100_000,
+        client           = bedrock_client,      # optional — calibrate()
+        model_id         = model_id,
+    )
+    ConversationManager(..., context_window=window)
+"""
+
+import json
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+IMAGE_TOKENS = 1_600    # Claude: ~ (w × h) / 750, capped around 1.6k
+
+
+################################################################################
+# SECTION: Estimation Helpers
+################################################################################
+
+def _block_chars(block: dict) -> int:
+    """Approximate character size of one content block (images excluded)."""
+    if 'text' in block:
+        return len(block['text'])
+    if 'toolUse' in block:
+        return len(json.dumps(block['toolUse'].get('input', {}), default=str)) + 32
+    if 'toolResult' in block:
+        return sum(_block_chars(b) for b in block['toolResult'].get('content', [])) + 16
+    if 'json' in block:
+        return len(json.dumps(block['json'], default=str))
+    if 'document' in block:
+        return len(block['document'].get('source', {}).get('bytes', b''))
+    if 'reasoningContent' in block:
+        return len(block['reasoningContent'].get('reasoningText', {}).get('text', ''))
+    return 0
+
+
+def _count_images(block: dict) -> int:
+    if 'image' in block:
+        return 1
+    if 'toolResult' in block:
+        return sum(_count_images(b) for b in block['toolResult'].get('content', []))
+    return 0
+
+
+def _is_turn_start(message: dict) -> bool:
+    """A user message that is not purely tool results starts a new turn."""
+    if message.get('role') != 'user':
+        return False
+    return not all('toolResult' in b for b in message.get('content', []))
+
+
+################################################################################
+# SECTION: ContextWindowManager
+################################################################################
+
+class ContextWindowManager:
+    """
+    Keeps converse requests under max_input_tokens by evicting (and
+    optionally summarizing) the oldest turns. Thread-compatible, not
+    thread-safe: use one instance per conversation / session.
+    """
+
+    def __init__(
+        self,
+        max_input_tokens: int,
+        client                                        = None,
+        model_id:         Optional[str]               = None,
+        chars_per_token:  float                       = 4.0,
+        summarizer:       Optional[Callable[[list], str]] = None,
+    ):
+        self.max_input_tokens = max_input_tokens
+        self.client           = client
+        self.model_id         = model_id
+        self.chars_per_token  = chars_per_token
+        self.summarizer       = summarizer
+
+        self._scale           = 1.0     # reported input tokens / raw estimate
+        self._last_raw        = 0       # raw estimate of the last fit() request
+        self._counts          = {}      # id(message) → (message, raw tokens)
+        self._summary_cache   = {}      # id(last evicted message) → summary
+
+    # ── Estimation ────────────────────────────────────────────────────────────
+
+    def _raw_estimate(self, message: dict) -> int:
+        """Uncalibrated estimate for one message, cached per object."""
+        cached = self._counts.get(id(message))
+        if cached is not None and cached[0] is message:
+            return cached[1]
+
+        blocks = message.get('content', [])
+        chars  = sum(_block_chars(b) for b in blocks)
+        tokens = (int(chars / self.chars_per_token)
+                  + sum(_count_images(b) for b in blocks) * IMAGE_TOKENS
+                  + 4)                                  # role / framing
+        self._counts[id(message)] = (message, tokens)
+        return tokens
+
+    def estimate(self, message: dict) -> int:
+        """Calibrated token estimate for one message."""
+        return int(self._raw_estimate(message) * self._scale)
+
+    def _raw_prefix(self, system: Optional[list], tool_config: Optional[dict]) -> int:
+        chars = sum(len(b.get('text', '')) for b in system or [])
+        if tool_config:
+            chars += len(json.dumps(tool_config, default=str))
+        return int(chars / self.chars_per_token)
+
+    def estimate_prefix(self, system: Optional[list], tool_config: Optional[dict]) -> int:
+        """Calibrated estimate for the system prompt + tool definitions."""
+        return int(self._raw_prefix(system, tool_config) * self._scale)
+
+    def _rescale(self, actual: int, raw: int) -> None:
+        if actual > 0 and raw > 0:
+            # Blend with the previous scale so one odd sample cannot swing it
+            self._scale = 0.5 * self._scale + 0.5 * (actual / raw)
+
+    def observe(self, input_tokens: int) -> None:
+        """
+        Calibrate from the input tokens Bedrock reported for the request
+        built by the last fit() (inputTokens + cache read / write tokens).
+        """
+        self._rescale(input_tokens, self._last_raw)
+        logger.debug("Context window observed: actual=%d raw=%d scale=%.3f",
+                     input_tokens, self._last_raw, self._scale)
+
+    def calibrate(self, messages: list, system: Optional[list] = None) -> Optional[int]:
+        """
+        Measure messages with the count_tokens API and rescale estimates.
+        Returns the measured count, or None if no client / the call failed.
+        A blocking API round trip — keep it off the request path.
+        """
+        if self.client is None or not messages:
+            return None
+
+        request = {"messages": messages}
+        if system:
+            request["system"] = system
+        try:
+            response = self.client.count_tokens(
+                modelId = self.model_id,
+                input   = {"converse": request},
+            )
+        except Exception as err:
+            logger.warning("count_tokens calibration failed: %s", err)
+            return None
+
+        actual = response["inputTokens"]
+        raw    = sum(self._raw_estimate(m) for m in messages) + self._raw_prefix(system, None)
+        self._rescale(actual, raw)
+        logger.info("Context window calibrated: actual=%d raw=%d scale=%.3f",
+                    actual, raw, self._scale)
+        return actual
+
+    # ── Fitting ───────────────────────────────────────────────────────────────
+
+    def fit(
+        self,
+        messages:    list,
+        system:      Optional[list] = None,
+        tool_config: Optional[dict] = None,
+    ) -> list:
+        """
+        Return a copy of messages that fits the input-token budget.
+        The latest turn is always kept, even if it alone exceeds the budget.
+        """
+        live_ids     = {id(m) for m in messages}
+        self._counts = {k: v for k, v in self._counts.items() if k in live_ids}
+
+        raw_prefix = self._raw_prefix(system, tool_config)
+        budget     = self.max_input_tokens - int(raw_prefix * self._scale)
+        sizes      = [self.estimate(m) for m in messages]
+        total      = sum(sizes)
+        if total <= budget:
+            self._last_raw = raw_prefix + sum(self._raw_estimate(m) for m in messages)
+            return list(messages)
+
+        turn_starts = [i for i, m in enumerate(messages) if _is_turn_start(m)]
+        cut = 0
+        for start in turn_starts[1:]:
+            if total <= budget:
+                break
+            total -= sum(sizes[cut:start])
+            cut    = start
+
+        kept = list(messages[cut:])
+        logger.info("Context window: evicted %d of %d messages (~%d tokens kept, budget %d)",
+                    cut, len(messages), total, budget)
+
+        if cut and self.summarizer and kept:
+            kept[0] = self._with_summary(kept[0], messages[:cut])
+        self._last_raw = raw_prefix + sum(self._raw_estimate(m) for m in kept)
+        return kept
+
+    def _with_summary(self, first: dict, evicted: list) -> dict:
+        """Prepend a summary of the evicted turns to the first kept message."""
+        key     = id(evicted[-1])
+        summary = self._summary_cache.get(key)
+        if summary is None:
+            summary = self.summarizer(evicted)
+            self._summary_cache = {key: summary}
+        return {
+            **first,
+            'content': [{"text": f"[Summary of earlier conversation]\n{summary}"}]
+                       + list(first.get('content', [])),
+        }
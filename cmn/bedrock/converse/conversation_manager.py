@@ -18,6 +18,56 @@ completely UI-agnostic:
 
     on_tool_invoked(tool_name: str, tool_args: dict, tool_result: Any)
         Fired after each individual tool execution.
+        Always fired on the calling thread, in toolUseId order — even
+        when tools run concurrently — so Streamlit callbacks stay safe.
+
+Concurrent tools
+----------------
+When the model requests several tools in one turn they run sequentially
+by default. Pass max_tool_workers > 1 to run them on a bounded thread
+pool; tool_timeout (seconds) caps each tool, counted from the moment it
+starts running (at once, unless every worker is busy). All tools of a
+turn are awaited together, so the turn waits for the slowest tool, not
+the sum. A timed-out tool returns an {"error": ...} result to the model
+and gives up its worker slot, so tools queued behind it still run.
+
+Pass speculative_tools=True to dispatch each tool as soon as its
+contentBlockStop arrives, so network-bound tools overlap with the rest
+of the stream. If the response does not end with stopReason "tool_use"
+the speculative results are discarded. Only enable this for registries
+whose tools are safe to run without being committed to (no side effects).
+
+Prompt caching
+--------------
+Opt-in: pass prompt_caching=True and, for models that support it
+(cmn/bedrock_models.py), every request gets cachePoint blocks after the
+system prompt, after the tool definitions and on the latest user turns
+(see cache_planner.py). Cache writes are billed above the normal input
+rate and pay off only when the prefix is re-read within the cache TTL —
+multi-turn chats and tool loops. Cache hits / writes are reported in
+StreamMetrics.
+
+Tool result encoding
+--------------------
+Tool results go back to the model through tool_registry.content(). By
+default the registry is switched to its for_model(model_id) view, whose
+ResultEncoder sends tables as columnar JSON or CSV text whenever that is
+smaller than row records (see ResultEncoder in
+cmn/tools/tool/bedrock_converse_tools_tool.py). on_tool_invoked still
+receives the raw result. Pass result_encoding=False to send plain JSON.
+
+Context window
+--------------
+Pass context_window=ContextWindowManager(max_input_tokens=...) to keep
+every request under a token budget: the oldest turns are evicted (or
+summarized) before each call — see context_window.py.
+
+Rate limiting
+-------------
+Pass rate_limiter=RateLimiter.default() to pace converse_stream calls
+against the model's configured RPM / TPM (cmn/bedrock/rate_limiter.py).
+Each call acquires before sending — at rate_priority, "interactive" by
+default — and settles the estimate with the reported usage afterwards.
 
 Usage
 -----
@@ -27,21 +77,101 @@ Usage
         model_id         = "anthropic.claude...",
         inference_config = {"temperature": 0.1, "maxTokens": 4096},
         system_prompts   = [{"text": "You are ..."}],
+        max_tool_workers = 4,       # optional — run tool calls concurrently
+        tool_timeout     = 30,      # optional — seconds per tool
     )
     result = manager.run(message_history, on_text_delta=..., ...)
 """
 
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from typing import Any, Callable, Optional
 
 from botocore.exceptions import ClientError
 
-from cmn.bedrock.converse.models import StreamResult
+from cmn.bedrock.converse.cache_planner import PromptCachePlanner
+from cmn.bedrock.converse.context_window import ContextWindowManager
+from cmn.bedrock.converse.models import StreamResult, ToolInvocation, TurnMetrics
 from cmn.bedrock.converse.stream_processor import process_stream
+from cmn.bedrock.rate_limiter import (
+    INTERACTIVE,
+    RateLimiter,
+    RateLimitTimeout,
+    estimate_converse_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _ToolPool:
+    """
+    Bounded pool for tool calls, one thread per running call. Unlike a
+    ThreadPoolExecutor, a call that is given up on (abandon()) releases
+    its slot at once — the hung thread finishes in the background and no
+    longer holds back the calls queued behind it.
+    """
+
+    def __init__(self, max_workers: int):
+        self._lock    = threading.Lock()
+        self._free    = max_workers
+        self._queue   = deque()                     # (future, fn, args) waiting for a slot
+        self._started = {}                          # running future → monotonic start
+
+    def submit(self, fn: Callable, *args) -> Future:
+        future = Future()
+        with self._lock:
+            self._queue.append((future, fn, args))
+            self._dispatch()
+        return future
+
+    def started_at(self, future: Future) -> Optional[float]:
+        """When the call started running; None while queued (or once finished)."""
+        with self._lock:
+            return self._started.get(future)
+
+    def abandon(self, future: Future) -> None:
+        """Stop waiting for a running call: its slot goes to the next queued call."""
+        self._release(future)
+
+    def shutdown(self) -> None:
+        """Cancel queued calls; running ones finish in the background."""
+        with self._lock:
+            while self._queue:
+                self._queue.popleft()[0].cancel()
+
+    def _dispatch(self) -> None:
+        # Caller holds self._lock
+        while self._free and self._queue:
+            future, fn, args = self._queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue                            # cancelled while queued
+            self._free -= 1
+            self._started[future] = time.monotonic()
+            threading.Thread(
+                target = self._run,
+                args   = (future, fn, args),
+                name   = "converse-tool",
+                daemon = True,
+            ).start()
+
+    def _run(self, future: Future, fn: Callable, args: tuple) -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            self._release(future)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            if self._started.pop(future, None) is not None:
+                self._free += 1
+                self._dispatch()
+
+
 class ConversationManager:
     """
     Orchestrates multi-turn conversations including tool-use loops.
@@ -56,13 +186,33 @@ class ConversationManager:
         inference_config:        dict,
         system_prompts:          list,
         additional_model_fields: Optional[dict] = None,
+        max_tool_workers:        int = 1,
+        tool_timeout:            Optional[float] = None,
+        speculative_tools:       bool = False,
+        prompt_caching:          bool = False,
+        context_window:          Optional[ContextWindowManager] = None,
+        rate_limiter:            Optional[RateLimiter] = None,
+        rate_priority:           str = INTERACTIVE,
+        result_encoding:         bool = True,
     ):
+        if result_encoding:
+            tool_registry = tool_registry.for_model(model_id)
+
         self.client                  = bedrock_client
         self.registry                = tool_registry
         self.model_id                = model_id
         self.inference_config        = inference_config
         self.system_prompts          = system_prompts
         self.additional_model_fields = additional_model_fields
+        self.max_tool_workers        = max(1, max_tool_workers)
+        self.tool_timeout            = tool_timeout
+        self.speculative_tools       = speculative_tools
+        self.context_window          = context_window
+        self.rate_limiter            = rate_limiter
+        self.rate_priority           = rate_priority
+        self.cache_planner           = (
+            PromptCachePlanner.for_model(model_id) if prompt_caching else None
+        )
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -88,65 +238,246 @@ class ConversationManager:
 
         Returns
         -------
-        StreamResult from the final LLM response
+        StreamResult from the final LLM response, with turn_metrics set to
+        the per-iteration and per-turn timings of the whole loop
         """
-        messages = message_history.copy()
+        messages     = message_history.copy()
+        executor     = self._new_tool_executor()
+        turn_start   = time.monotonic()
+        turn_metrics = TurnMetrics()
 
-        while True:
-            result = self._call_llm(messages, on_text_delta)
+        try:
+            while True:
+                # toolUseId → Future for tools dispatched during the stream
+                prefetched = {}
+                on_tool_ready = None
+                if self.speculative_tools:
+                    def on_tool_ready(tool_inv: ToolInvocation) -> None:
+                        prefetched[tool_inv.tool_use_id] = self._submit_tool(
+                            executor, tool_inv,
+                        )
+
+                result = self._call_llm(messages, on_text_delta, on_tool_ready)
+                turn_metrics.iterations.append(result.metrics)
+
+                if on_stream_result:
+                    on_stream_result(result)
+
+                if not result.has_tool_call:
+                    self._discard_prefetched(prefetched)
+                    turn_metrics.duration_ms = round(
+                        (time.monotonic() - turn_start) * 1000, 1)
+                    result.turn_metrics = turn_metrics
+                    return result
+
+                # ── Build assistant message for ALL tool calls ────────────────
+                assistant_content = [
+                    {
+                        "toolUse": {
+                            "toolUseId": tool_inv.tool_use_id,
+                            "name":      tool_inv.tool_name,
+                            "input":     tool_inv.tool_arguments,
+                        }
+                    }
+                    for tool_inv in result.tool_invocations
+                ]
+                messages.append({"role": "assistant", "content": assistant_content})
+
+                # ── Execute each tool + collect results ───────────────────────
+                tools_start = time.monotonic()
+                tool_results_content = self._execute_tools(
+                    result.tool_invocations,
+                    executor,
+                    on_tool_invoked,
+                    prefetched,
+                )
+                turn_metrics.tool_ms.append(
+                    round((time.monotonic() - tools_start) * 1000, 1))
+
+                # ── Single user message with all tool results ─────────────────
+                messages.append({"role": "user", "content": tool_results_content})
+                # loop → model sees all tool results and continues
+        finally:
+            if executor is not None:
+                # Do not wait on hung (timed-out) tools — their threads finish
+                # in the background and their results are discarded.
+                executor.shutdown()
 
-            if on_stream_result:
-                on_stream_result(result)
+    # ── Private ───────────────────────────────────────────────────────────────
 
-            if not result.has_tool_call:
-                return result
+    def _new_tool_executor(self) -> Optional[_ToolPool]:
+        """
+        Bounded pool for concurrent tool execution, or None for the
+        sequential (inline) path. A pool is also needed when only a
+        timeout is configured — an inline call cannot be abandoned.
+        """
+        if (self.max_tool_workers <= 1
+                and self.tool_timeout is None
+                and not self.speculative_tools):
+            return None
+        return _ToolPool(self.max_tool_workers)
 
-            # ── Build assistant message for ALL tool calls ────────────────────
-            assistant_content = [
-                {
-                    "toolUse": {
-                        "toolUseId": tool_inv.tool_use_id,
-                        "name":      tool_inv.tool_name,
-                        "input":     tool_inv.tool_arguments,
-                    }
-                }
-                for tool_inv in result.tool_invocations
+    def _execute_tools(
+        self,
+        tool_invocations: list[ToolInvocation],
+        executor:         Optional[_ToolPool],
+        on_tool_invoked:  Optional[Callable[[str, dict, Any], None]],
+        prefetched:       Optional[dict] = None,
+    ) -> list[dict]:
+        """
+        Run every requested tool and return toolResult blocks in the
+        original toolUseId order.
+
+        With an executor all tools are submitted up front and awaited
+        together (_await_tools); on_tool_invoked is fired here on the
+        calling thread, never from a worker thread. Exceptions raised by a
+        tool propagate as in the sequential path. Tools already dispatched
+        speculatively (prefetched, keyed by toolUseId) are reused, not re-run.
+        """
+        prefetched = prefetched or {}
+
+        if executor is None:
+            pending = [
+                (tool_inv, None) for tool_inv in tool_invocations
+            ]
+        else:
+            pending = [
+                (
+                    tool_inv,
+                    prefetched.get(tool_inv.tool_use_id)
+                    or self._submit_tool(executor, tool_inv),
+                )
+                for tool_inv in tool_invocations
             ]
-            messages.append({"role": "assistant", "content": assistant_content})
 
-            # ── Execute each tool + collect results ───────────────────────────
-            tool_results_content = []
+        timed_out = self._await_tools(executor, pending) if executor else {}
 
-            for tool_inv in result.tool_invocations:
+        tool_results_content = []
+
+        for tool_inv, future in pending:
+            if future is None:
                 tool_result = self.registry.invoke(
                     tool_inv.tool_name,
                     tool_inv.tool_arguments,
                 )
+            elif future in timed_out:
+                tool_result = timed_out[future]
+            else:
+                tool_result = future.result()
 
-                if on_tool_invoked:
-                    on_tool_invoked(
-                        tool_inv.tool_name,
-                        tool_inv.tool_arguments,
-                        tool_result,
-                    )
-
-                tool_results_content.append({
-                    "toolResult": {
-                        "toolUseId": tool_inv.tool_use_id,
-                        "content":   [{"json": {"result": tool_result}}],
-                    }
-                })
+            if on_tool_invoked:
+                on_tool_invoked(
+                    tool_inv.tool_name,
+                    tool_inv.tool_arguments,
+                    tool_result,
+                )
 
-            # ── Single user message with all tool results ─────────────────────
-            messages.append({"role": "user", "content": tool_results_content})
-            # loop → model sees all tool results and continues
+            tool_results_content.append({
+                "toolResult": {
+                    "toolUseId": tool_inv.tool_use_id,
+                    "content":   self.registry.content(tool_result),
+                }
+            })
 
-    # ── Private ───────────────────────────────────────────────────────────────
+        return tool_results_content
+
+    def _submit_tool(self, executor: _ToolPool, tool_inv: ToolInvocation) -> Future:
+        """Submit one tool call to the pool and return its Future."""
+        return executor.submit(
+            self.registry.invoke,
+            tool_inv.tool_name,
+            tool_inv.tool_arguments,
+        )
+
+    @staticmethod
+    def _discard_prefetched(prefetched: dict) -> None:
+        """
+        Drop speculative tool calls from a response that did not end in
+        tool_use. Queued calls are cancelled; running ones finish in the
+        background and their results are ignored.
+        """
+        for tool_use_id, future in prefetched.items():
+            if not future.done():
+                future.cancel()
+            logger.info("Discarded speculative tool result: id=%s", tool_use_id)
+
+    def _await_tools(self, executor: _ToolPool, pending: list[tuple]) -> dict:
+        """
+        Wait for every submitted tool call at once. Each call has its own
+        deadline, tool_timeout after it started running; a call past its
+        deadline is abandoned (its slot goes to the next queued call) and
+        gets an error result the model can reason about.
+
+        Returns {future: error result} for the timed-out calls; every other
+        future is done when this returns.
+        """
+        waiting   = {future: tool_inv for tool_inv, future in pending}
+        timed_out = {}
+
+        while waiting:
+            timeout = None
+            if self.tool_timeout is not None:
+                now       = time.monotonic()
+                deadlines = []
+                for future, tool_inv in list(waiting.items()):
+                    started = executor.started_at(future)
+                    if started is None or future.done():
+                        continue                    # queued, or finished just now
+                    if now - started >= self.tool_timeout:
+                        executor.abandon(future)
+                        timed_out[future] = self._timeout_result(tool_inv)
+                        del waiting[future]
+                    else:
+                        deadlines.append(started + self.tool_timeout)
+                if not waiting:
+                    break
+                # Only queued calls left: re-check once one could have timed out
+                timeout = max(0.0, min(deadlines) - now) if deadlines else self.tool_timeout
+
+            done, _ = wait(waiting, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                del waiting[future]
+
+        return timed_out
+
+    def _timeout_result(self, tool_inv: ToolInvocation) -> dict:
+        logger.warning("Tool '%s' (id=%s) timed out after %ss",
+                       tool_inv.tool_name, tool_inv.tool_use_id,
+                       self.tool_timeout)
+        return {
+            "error": f"Tool '{tool_inv.tool_name}' timed out "
+                     f"after {self.tool_timeout}s",
+        }
+
+    def _build_request(self, messages: list) -> dict:
+        """
+        converse_stream keyword arguments for one LLM call.
+        Shared with AsyncConversationManager so both send identical requests.
+        """
+        tool_config = self.registry.tool_config
+        if self.context_window:
+            messages = self.context_window.fit(
+                messages, self.system_prompts, tool_config,
+            )
+
+        kwargs = dict(
+            modelId         = self.model_id,
+            messages        = messages,
+            system          = self.system_prompts,
+            toolConfig      = tool_config,
+            inferenceConfig = self.inference_config,
+        )
+        if self.additional_model_fields:
+            kwargs['additionalModelRequestFields'] = self.additional_model_fields
+        if self.cache_planner:
+            kwargs = self.cache_planner.apply(kwargs)
+        return kwargs
 
     def _call_llm(
         self,
         messages:      list,
         on_text_delta: Optional[Callable[[str], None]],
+        on_tool_ready: Optional[Callable[[ToolInvocation], None]] = None,
     ) -> StreamResult:
         """
         Single converse_stream call.
@@ -156,26 +487,24 @@ class ConversationManager:
         ----------
         messages      : full conversation history for this call
         on_text_delta : forwarded to process_stream for live streaming
+        on_tool_ready : forwarded to process_stream for speculative dispatch
 
         Returns
         -------
         StreamResult — errors list populated on ClientError
         """
+        reservation = result = None
         try:
-            kwargs = dict(
-                modelId         = self.model_id,
-                messages        = messages,
-                system          = self.system_prompts,
-                toolConfig      = self.registry.tool_config,
-                inferenceConfig = self.inference_config,
-            )
-            if self.additional_model_fields:
-                kwargs['additionalModelRequestFields'] = self.additional_model_fields
-
-            response = self.client.converse_stream(**kwargs)
+            kwargs        = self._build_request(messages)
+            reservation   = self._acquire(kwargs)
+            request_start = time.monotonic()
+            response      = self.client.converse_stream(**kwargs)
             stream = response['stream']
             try:
-                return process_stream(stream, on_text_delta)
+                result = process_stream(stream, on_text_delta, on_tool_ready,
+                                        request_start)
+                self._observe(result)
+                return result
             finally:
                 # Ensure stream is fully consumed and closed
                 if hasattr(stream, 'close'):
@@ -189,4 +518,38 @@ class ConversationManager:
             logger.error("ClientError in _call_llm: %s", msg)
             r = StreamResult()
             r.errors.append(msg)
-            return r
\ No newline at end of file
+            return r
+
+        except RateLimitTimeout as err:
+            logger.error("Rate limit in _call_llm: %s", err)
+            r = StreamResult()
+            r.errors.append(str(err))
+            return r
+
+        finally:
+            self._settle(reservation, result)
+
+    def _acquire(self, kwargs: dict):
+        """Reserve rate-limit capacity for one request (None if unlimited)."""
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.acquire(
+            self.model_id, estimate_converse_tokens(kwargs), self.rate_priority,
+        )
+
+    def _settle(self, reservation, result: Optional[StreamResult]) -> None:
+        """
+        Correct the reservation with the reported usage. A failed call or a
+        stream without usage settles with 0 so the estimate is refunded.
+        """
+        if reservation is not None:
+            self.rate_limiter.settle(
+                reservation, result.metrics.total_tokens if result else 0)
+
+    def _observe(self, result: StreamResult) -> None:
+        """Calibrate the context window from the input tokens Bedrock reported."""
+        m = result.metrics
+        if self.context_window and m.input_tokens:
+            self.context_window.observe(
+                m.input_tokens + m.cache_read_input_tokens + m.cache_write_input_tokens
+            )
\ No newline at end of file
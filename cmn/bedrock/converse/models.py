@@ -9,7 +9,9 @@ Only stdlib imports: dataclasses, typing, json.
 Classes
 -------
 ToolInvocation  : captures a single tool call from the model stream
-StreamMetrics   : token counts and latency from the metadata event
+StreamMetrics   : token counts (incl. prompt cache) and latency from the metadata
+                  event, plus client-side timings measured by process_stream
+TurnMetrics     : StreamMetrics for every LLM call of one turn + tool time
 StreamResult    : everything extracted from one converse_stream call
 
 Constants
@@ -86,13 +88,86 @@ class ToolInvocation:
 @dataclass
 class StreamMetrics:
     """
-    Token usage and latency extracted from the metadata event.
-    Populated by stream_processor._handle_metadata().
+    Token usage and latency for one converse_stream call.
+
+    Server side (metadata event, stream_processor._handle_metadata):
+        token counts and latency_ms as reported by Bedrock.
+
+    Client side (monotonic clock, stream_processor._EventParser):
+        measured from request start, so network and queueing delay are
+        included — compare with latency_ms to separate them from model time.
+    """
+    input_tokens:              int = 0
+    output_tokens:             int = 0
+    total_tokens:              int = 0
+    latency_ms:                int = 0
+    cache_read_input_tokens:   int = 0    # prompt-cache hits
+    cache_write_input_tokens:  int = 0    # prompt-cache writes
+
+    # ── Client-side timings (milliseconds) ────────────────────────────────────
+    message_start_ms:      float = 0.0    # request start → messageStart
+    ttft_ms:               float = 0.0    # request start → first text delta (0 if no text)
+    duration_ms:           float = 0.0    # request start → last event
+    chunk_gap_p50_ms:      float = 0.0    # inter-chunk gap percentiles
+    chunk_gap_p95_ms:      float = 0.0
+    chunk_gap_max_ms:      float = 0.0
+    output_tokens_per_sec: float = 0.0    # output_tokens / generation window
+
+
+################################################################################
+# SECTION: TurnMetrics
+################################################################################
+
+@dataclass
+class TurnMetrics:
+    """
+    Aggregated metrics for one ConversationManager.run() turn.
+
+    iterations[i] holds the StreamMetrics of the i-th LLM call;
+    tool_ms[i] the wall time spent executing the tools it requested
+    (the final, tool-free iteration has no entry).
     """
-    input_tokens:  int = 0
-    output_tokens: int = 0
-    total_tokens:  int = 0
-    latency_ms:    int = 0
+    iterations:  list  = field(default_factory=list)
+    tool_ms:     list  = field(default_factory=list)
+    duration_ms: float = 0.0
+
+    @property
+    def llm_calls(self) -> int:
+        return len(self.iterations)
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(m.input_tokens for m in self.iterations)
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(m.output_tokens for m in self.iterations)
+
+    @property
+    def ttft_ms(self) -> float:
+        """
+        Time to the first text of the turn — what the user waits for. When
+        the first calls only request tools, their duration and tool time
+        count towards it. 0 if the turn produced no text.
+        """
+        waited = 0.0
+        for i, m in enumerate(self.iterations):
+            if m.ttft_ms:
+                return round(waited + m.ttft_ms, 1)
+            waited += m.duration_ms + (self.tool_ms[i] if i < len(self.tool_ms) else 0.0)
+        return 0.0
+
+    @property
+    def llm_ms(self) -> float:
+        return sum(m.duration_ms for m in self.iterations)
+
+    @property
+    def server_latency_ms(self) -> int:
+        return sum(m.latency_ms for m in self.iterations)
+
+    @property
+    def total_tool_ms(self) -> float:
+        return sum(self.tool_ms)
 
 
 ################################################################################
@@ -114,6 +189,7 @@ class StreamResult:
     tool_invocations : all tool calls requested in this response
     metrics          : token counts + latency
     errors           : any stream exception messages collected
+    turn_metrics     : set by ConversationManager.run() on the final result
     """
     text:             str                      = ""
     stop_reason:      str                      = ""
@@ -121,6 +197,7 @@ class StreamResult:
     tool_invocations: list                     = field(default_factory=list)
     metrics:          StreamMetrics            = field(default_factory=StreamMetrics)
     errors:           list                     = field(default_factory=list)
+    turn_metrics:     Optional[TurnMetrics]    = None
 
     @property
     def has_tool_call(self) -> bool:
@@ -0,0 +1,200 @@
+"""
+cmn/bedrock/converse/replay.py
+===============================
+Record / replay harness for converse_stream — load-test and benchmark the
+converse engine without live Bedrock.
+
+No streamlit. The recorder only wraps an existing client; the replay
+client never touches boto3.
+
+Recording format (JSONL — one line per converse_stream call)
+------------------------------------------------------------
+    {"modelId": "...", "message_count": 3,
+     "events": [{"dt": 0.412, "event": {"messageStart": {...}}}, ...]}
+
+    dt = seconds since the previous event (first event: since the request).
+
+Classes
+-------
+RecordingBedrockClient : wraps a bedrock-runtime client, appends every
+                         converse_stream event sequence to a JSONL file
+ReplayBedrockClient    : fake client serving recorded calls in order, at
+                         real (speed=1), accelerated (speed>1) or no-delay
+                         (speed=0) pace
+
+Functions
+---------
+load_recordings(path)           : read a JSONL recording file
+synthetic_recording(...)        : build a recording in memory (benchmarks)
+
+Usage
+-----
+    client = RecordingBedrockClient(real_client, "turns.jsonl")
+    ConversationManager(bedrock_client=client, ...).run(history)
+
+    replay = ReplayBedrockClient.from_file("turns.jsonl", speed=10)
+    ConversationManager(bedrock_client=replay, ...).run(history)
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+################################################################################
+# SECTION: Recording
+################################################################################
+
+class RecordingBedrockClient:
+    """
+    Transparent proxy around a bedrock-runtime client.
+    converse_stream responses are passed through unchanged while each event
+    (and its inter-event delay) is captured; the call is appended to path
+    once its stream has been fully consumed. Everything else is delegated.
+    """
+
+    def __init__(self, client, path: str):
+        self._client = client
+        self._path   = path
+        self._lock   = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def converse_stream(self, **kwargs) -> dict:
+        t_request = time.monotonic()
+        response  = self._client.converse_stream(**kwargs)
+        header    = {
+            "modelId":       kwargs.get("modelId"),
+            "message_count": len(kwargs.get("messages", [])),
+        }
+        return {
+            **response,
+            "stream": self._record(response["stream"], header, t_request),
+        }
+
+    def _record(self, stream, header: dict, t_request: float) -> Iterator[dict]:
+        events = []
+        t_prev = t_request
+        try:
+            for event in stream:
+                now = time.monotonic()
+                events.append({"dt": round(now - t_prev, 6), "event": event})
+                t_prev = now
+                yield event
+        finally:
+            self._append({**header, "events": events})
+
+    def _append(self, record: dict) -> None:
+        line = json.dumps(record, default=str)
+        with self._lock, open(self._path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        logger.info("Recorded converse_stream call: %d events → %s",
+                    len(record["events"]), self._path)
+
+
+################################################################################
+# SECTION: Replay
+################################################################################
+
+def load_recordings(path: str) -> list[dict]:
+    """Read a JSONL recording file written by RecordingBedrockClient."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayBedrockClient:
+    """
+    Fake bedrock-runtime client that replays recorded converse_stream calls.
+
+    Calls are served in recording order; with loop=True the sequence
+    restarts when exhausted (useful for load tests), otherwise an
+    IndexError is raised. speed scales the recorded delays — 0 disables
+    sleeping entirely for throughput benchmarks. Thread-safe.
+    """
+
+    def __init__(self, recordings: list[dict], speed: float = 1.0, loop: bool = True):
+        if not recordings:
+            raise ValueError("ReplayBedrockClient needs at least one recording")
+        self._recordings = recordings
+        self._speed      = speed
+        self._loop       = loop
+        self._index      = 0
+        self._lock       = threading.Lock()
+        self.calls       = 0
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "ReplayBedrockClient":
+        return cls(load_recordings(path), **kwargs)
+
+    def converse_stream(self, **kwargs) -> dict:
+        with self._lock:
+            if self._index >= len(self._recordings):
+                if not self._loop:
+                    raise IndexError("Replay exhausted: no more recorded calls")
+                self._index = 0
+            record       = self._recordings[self._index]
+            self._index += 1
+            self.calls  += 1
+        return {"stream": self._replay(record["events"])}
+
+    def _replay(self, events: list[dict]) -> Iterator[dict]:
+        for item in events:
+            if self._speed and item.get("dt"):
+                time.sleep(item["dt"] / self._speed)
+            yield item["event"]
+
+
+################################################################################
+# SECTION: Synthetic Recordings
+################################################################################
+
+def synthetic_recording(
+    text_chunks:   int   = 200,
+    chunk_text:    str   = "lorem ipsum ",
+    tool_calls:    Optional[list[tuple[str, dict]]] = None,
+    ttft_s:        float = 0.4,
+    chunk_gap_s:   float = 0.01,
+) -> dict:
+    """
+    Build one recorded converse_stream call without Bedrock.
+
+    Emits messageStart, text_chunks text deltas, one toolUse block per
+    (name, input) in tool_calls, messageStop (tool_use if tools were
+    requested, else end_turn) and a metadata event.
+    """
+    def gap(event: dict) -> dict:
+        return {"dt": chunk_gap_s, "event": event}
+
+    events = [{"dt": ttft_s, "event": {"messageStart": {"role": "assistant"}}}]
+
+    events.append(gap({"contentBlockStart": {"start": {}, "contentBlockIndex": 0}}))
+    for _ in range(text_chunks):
+        events.append(gap({"contentBlockDelta": {"delta": {"text": chunk_text},
+                                                 "contentBlockIndex": 0}}))
+    events.append(gap({"contentBlockStop": {"contentBlockIndex": 0}}))
+
+    for idx, (name, tool_input) in enumerate(tool_calls or [], start=1):
+        events.append(gap({"contentBlockStart": {
+            "start": {"toolUse": {"toolUseId": f"tooluse_{idx}", "name": name}},
+            "contentBlockIndex": idx,
+        }}))
+        events.append(gap({"contentBlockDelta": {
+            "delta": {"toolUse": {"input": json.dumps(tool_input)}},
+            "contentBlockIndex": idx,
+        }}))
+        events.append(gap({"contentBlockStop": {"contentBlockIndex": idx}}))
+
+    stop_reason = "tool_use" if tool_calls else "end_turn"
+    events.append(gap({"messageStop": {"stopReason": stop_reason}}))
+    events.append(gap({"metadata": {
+        "usage":   {"inputTokens": 1000, "outputTokens": text_chunks * 2,
+                    "totalTokens": 1000 + text_chunks * 2},
+        "metrics": {"latencyMs": int(1000 * (ttft_s + chunk_gap_s * len(events)))},
+    }}))
+
+    return {"modelId": "synthetic", "message_count": 0, "events": events}
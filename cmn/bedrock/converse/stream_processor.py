@@ -8,8 +8,12 @@ Receives the raw event stream iterator and returns a StreamResult.
 
 Functions
 ---------
-process_stream(stream, on_text_delta)  : main entry point — iterates events
+process_stream(stream, on_text_delta, on_tool_ready)
+                                       : main entry point — iterates events
 _handle_metadata(metadata, result)     : extracts token counts and latency
+_EventParser                           : per-event state machine shared with
+                                         the async stream processor; also
+                                         records client-side timings
 
 Callback
 --------
@@ -17,9 +21,16 @@ on_text_delta(chunk: str) -> None
     Optional callable fired for every streamed text chunk.
     Intended for live UI updates — kept as a plain callable so this
     module stays UI-agnostic.
+
+on_tool_ready(tool: ToolInvocation) -> None
+    Optional callable fired as soon as a tool call is finalized on
+    contentBlockStop — before the stream ends and before the stop reason
+    is known. Lets the caller dispatch the tool speculatively so its work
+    overlaps with the rest of the stream.
 """
 
 import logging
+import time
 from typing import Callable, Optional
 
 from cmn.bedrock.converse.models import (
@@ -37,7 +48,8 @@ logger = logging.getLogger(__name__)
 
 def _handle_metadata(metadata: dict, result: StreamResult) -> None:
     """
-    Extract token usage and latency from the metadata event.
+    Extract token usage (including prompt-cache reads / writes) and
+    latency from the metadata event.
     Mutates result.metrics in place.
     """
     if 'usage' in metadata:
@@ -45,41 +57,69 @@ def _handle_metadata(metadata: dict, result: StreamResult) -> None:
         result.metrics.input_tokens  = u.get('inputTokens',  0)
         result.metrics.output_tokens = u.get('outputTokens', 0)
         result.metrics.total_tokens  = u.get('totalTokens',  0)
+        result.metrics.cache_read_input_tokens  = u.get('cacheReadInputTokens',  0)
+        result.metrics.cache_write_input_tokens = u.get('cacheWriteInputTokens', 0)
 
     if 'metrics' in metadata:
         result.metrics.latency_ms = metadata['metrics'].get('latencyMs', 0)
 
 
+def _percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1,
+                      round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
 ################################################################################
-# SECTION: Main Entry Point
+# SECTION: Event Parser
 ################################################################################
 
-def process_stream(
-    stream,
-    on_text_delta: Optional[Callable[[str], None]] = None,
-) -> StreamResult:
+class _EventParser:
     """
-    Iterate a boto3 converse_stream event stream and return a StreamResult.
+    Stateful per-event parser shared by process_stream and its async
+    counterpart (async_stream_processor.process_stream_async).
 
-    Parameters
-    ----------
-    stream        : the raw event stream from response['stream']
-    on_text_delta : optional callback fired for each text chunk — use for
-                    live UI streaming. Kept as plain callable so this
-                    function stays UI-agnostic.
+    feed() consumes one event, mutates the StreamResult being built and
+    returns (text_chunk, finalized_tool) so the caller can fire callbacks
+    in whatever style it needs (plain call or await). finish() fills the
+    client-side timings into result.metrics.
 
-    Returns
-    -------
-    StreamResult  : fully populated after all events consumed
+    request_start is a time.monotonic() value taken just before the
+    converse_stream call; defaults to parser creation.
     """
-    result           = StreamResult()
-    tool_invocations = []
-    current_tool     = None
 
-    for event in stream:
+    def __init__(self, request_start: Optional[float] = None):
+        self.result           = StreamResult()
+        self.tool_invocations = []
+        self.current_tool     = None
+
+        self._t_start         = request_start if request_start is not None else time.monotonic()
+        self._t_message_start = None
+        self._t_first_delta   = None            # any content delta (generation window)
+        self._t_first_text    = None            # first text delta (TTFT)
+        self._t_last_delta    = None
+        self._t_last_event    = None
+        self._chunk_gaps      = []
+
+    def feed(self, event: dict) -> tuple[Optional[str], Optional[ToolInvocation]]:
+        result = self.result
+        now    = time.monotonic()
+        self._t_last_event = now
+
+        if 'contentBlockDelta' in event:
+            if self._t_first_delta is None:
+                self._t_first_delta = now
+            else:
+                self._chunk_gaps.append(now - self._t_last_delta)
+            self._t_last_delta = now
 
         # ── Message start ─────────────────────────────────────────────────────
         if 'messageStart' in event:
+            if self._t_message_start is None:
+                self._t_message_start = now
             logger.debug("messageStart: role=%s",
                          event['messageStart'].get('role'))
 
@@ -88,30 +128,31 @@ def process_stream(
             start = event['contentBlockStart'].get('start', {})
 
             if 'toolUse' in start:
-                tu           = start['toolUse']
-                current_tool = ToolInvocation(
+                tu                = start['toolUse']
+                self.current_tool = ToolInvocation(
                     tool_use_id = tu['toolUseId'],
                     tool_name   = tu['name'],
                 )
-                tool_invocations.append(current_tool)
+                self.tool_invocations.append(self.current_tool)
                 logger.info("Tool call started: id=%s name=%s",
                             tu['toolUseId'], tu['name'])
             else:
-                current_tool = None     # text block — not a tool
+                self.current_tool = None    # text block — not a tool
 
         # ── Content block delta ───────────────────────────────────────────────
         elif 'contentBlockDelta' in event:
             delta = event['contentBlockDelta']['delta']
 
             if 'text' in delta:
+                if self._t_first_text is None:
+                    self._t_first_text = now
                 chunk = delta['text']
                 result.text += chunk
-                if on_text_delta:
-                    on_text_delta(chunk)
+                return chunk, None
 
             elif 'toolUse' in delta:
-                if current_tool is not None:
-                    current_tool.tool_input_raw += delta['toolUse'].get('input', '')
+                if self.current_tool is not None:
+                    self.current_tool.tool_input_raw += delta['toolUse'].get('input', '')
 
             elif 'reasoningContent' in delta:
                 rc = delta['reasoningContent']
@@ -120,20 +161,21 @@ def process_stream(
 
         # ── Content block stop ────────────────────────────────────────────────
         elif 'contentBlockStop' in event:
-            if current_tool is not None:
-                current_tool.finalize()
+            if self.current_tool is not None:
+                tool = self.current_tool.finalize()
                 logger.info("Tool call finalized: name=%s args=%s",
-                            current_tool.tool_name,
-                            current_tool.tool_arguments)
-                current_tool = None
+                            tool.tool_name,
+                            tool.tool_arguments)
+                self.current_tool = None
+                return None, tool
 
         # ── Message stop ──────────────────────────────────────────────────────
         elif 'messageStop' in event:
             result.stop_reason = event['messageStop'].get('stopReason', '')
 
-            if result.stop_reason == 'tool_use' and tool_invocations:
-                result.tool_invocations = tool_invocations
-                result.tool_invocation  = tool_invocations[0]  # backward compat
+            if result.stop_reason == 'tool_use' and self.tool_invocations:
+                result.tool_invocations = self.tool_invocations
+                result.tool_invocation  = self.tool_invocations[0]  # backward compat
 
         # ── Metadata ──────────────────────────────────────────────────────────
         elif 'metadata' in event:
@@ -147,4 +189,68 @@ def process_stream(
                     logger.error("Stream exception [%s]: %s", exc_key, msg)
                     result.errors.append(f"[{exc_key}] {msg}")
 
-    return result
\ No newline at end of file
+        return None, None
+
+    def finish(self) -> StreamResult:
+        """Compute client-side timings and return the completed result."""
+        m = self.result.metrics
+
+        def ms(t: Optional[float]) -> float:
+            return round((t - self._t_start) * 1000, 1) if t is not None else 0.0
+
+        m.message_start_ms = ms(self._t_message_start)
+        m.ttft_ms          = ms(self._t_first_text)
+        m.duration_ms      = ms(self._t_last_event)
+
+        gaps = sorted(g * 1000 for g in self._chunk_gaps)
+        m.chunk_gap_p50_ms = round(_percentile(gaps, 50), 1)
+        m.chunk_gap_p95_ms = round(_percentile(gaps, 95), 1)
+        m.chunk_gap_max_ms = round(gaps[-1], 1) if gaps else 0.0
+
+        if self._t_first_delta is not None and self._t_last_event > self._t_first_delta:
+            window = self._t_last_event - self._t_first_delta
+            m.output_tokens_per_sec = round(m.output_tokens / window, 1)
+
+        return self.result
+
+
+################################################################################
+# SECTION: Main Entry Point
+################################################################################
+
+def process_stream(
+    stream,
+    on_text_delta: Optional[Callable[[str], None]] = None,
+    on_tool_ready: Optional[Callable[[ToolInvocation], None]] = None,
+    request_start: Optional[float] = None,
+) -> StreamResult:
+    """
+    Iterate a boto3 converse_stream event stream and return a StreamResult.
+
+    Parameters
+    ----------
+    stream        : the raw event stream from response['stream']
+    on_text_delta : optional callback fired for each text chunk — use for
+                    live UI streaming. Kept as plain callable so this
+                    function stays UI-agnostic.
+    on_tool_ready : optional callback fired with each ToolInvocation as soon
+                    as its arguments are finalized. The caller must discard
+                    any speculative work if result.has_tool_call is False.
+    request_start : time.monotonic() taken before converse_stream was called,
+                    so client-side TTFT includes connection and queueing time
+
+    Returns
+    -------
+    StreamResult  : fully populated after all events consumed
+    """
+    parser = _EventParser(request_start)
+
+    for event in stream:
+        chunk, tool = parser.feed(event)
+
+        if chunk is not None and on_text_delta:
+            on_text_delta(chunk)
+        if tool is not None and on_tool_ready:
+            on_tool_ready(tool)
+
+    return parser.finish()
@@ -0,0 +1,340 @@
+"""
+cmn/bedrock/rate_limiter.py
+===========================
+Process-wide client-side rate limiter for Bedrock RPM / TPM quotas.
+
+The adaptive retries in client_registry._BASE_CONFIG only react
+after a ThrottlingException. RateLimiter paces calls *before* they are
+sent, so peaks turn into a short queue instead of failed requests.
+
+How it works
+------------
+- Each configured model ID gets two token buckets: requests per minute
+  and tokens per minute. Unconfigured models are not limited.
+- A call reserves 1 request and an estimated token count (input estimate
+  + maxTokens, which is what Bedrock charges against TPM at request start).
+  Once the response reports real usage the difference is settled, so
+  over-estimates are returned to the bucket.
+- Waiters are served by priority class, FIFO within a class: interactive
+  chat is always let through before queued batch ingestion.
+- stats() reports queue wait (mean / p95 / max) and current queue depth.
+
+Limits
+------
+    limiter = RateLimiter.default()
+    limiter.configure("us.anthropic.claude-sonnet-4-20250514-v1:0", rpm=50, tpm=200_000)
+    limiter.configure("*", rpm=100)                 # fallback for other models
+
+or once via env BEDROCK_RATE_LIMITS (JSON):
+    {"amazon.titan-embed-image-v1": {"rpm": 600}, "*": {"rpm": 100}}
+
+Usage
+-----
+    # converse_stream — ConversationManager acquires in _call_llm
+    ConversationManager(..., rate_limiter=RateLimiter.default())
+
+    # invoke_model / converse — wrap the client
+    bedrock_runtime = RateLimiter.default().wrap(client, priority=BATCH)
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BATCH       = "batch"
+PRIORITIES  = {INTERACTIVE: 0, BATCH: 1}
+
+CHARS_PER_TOKEN = 4
+
+
+class RateLimitTimeout(Exception):
+    """Raised when acquire() could not get capacity within its timeout."""
+
+
+################################################################################
+# SECTION: Token Bucket
+################################################################################
+
+class TokenBucket:
+    """
+    Classic token bucket refilled continuously at per_minute / 60 per second.
+    Not thread-safe on its own — RateLimiter guards it with its lock.
+
+    A request larger than the capacity is admitted once the bucket is full
+    and drives the level negative, so oversized calls are paced, not refused.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.per_second = per_minute / 60.0
+        self.capacity   = capacity if capacity is not None else per_minute
+        self.level      = self.capacity
+        self._updated   = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level    = min(self.capacity, self.level + (now - self._updated) * self.per_second)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount can be consumed (0 if available now)."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.per_second) if missing > 0 else 0.0
+
+    def consume(self, amount: float) -> None:
+        self.level -= amount
+
+    def refund(self, amount: float) -> None:
+        """Give back (or, if negative, additionally take) capacity."""
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass
+class Reservation:
+    """Capacity taken by one acquire(); pass it back to settle()."""
+    model_id: str
+    tokens:   int
+    wait_s:   float
+
+
+class _ModelLimit:
+    def __init__(self, rpm: Optional[float], tpm: Optional[float]):
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens   = TokenBucket(tpm) if tpm else None
+        self.waiters  = []      # heap of (priority, seq)
+
+    def wait_time(self, tokens: int, now: float) -> float:
+        waits = [0.0]
+        if self.requests:
+            waits.append(self.requests.wait_time(1, now))
+        if self.tokens:
+            waits.append(self.tokens.wait_time(tokens, now))
+        return max(waits)
+
+    def consume(self, tokens: int) -> None:
+        if self.requests:
+            self.requests.consume(1)
+        if self.tokens:
+            self.tokens.consume(tokens)
+
+
+################################################################################
+# SECTION: RateLimiter
+################################################################################
+
+class RateLimiter:
+    """Per-model RPM / TPM token buckets with priority queueing. Thread-safe."""
+
+    _default      = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        self._limits = {}                    # model_id (or "*") → _ModelLimit
+        self._cond   = threading.Condition()
+        self._seq    = itertools.count()
+        self._stats  = {}                    # (model_id, priority) → dict
+
+    @classmethod
+    def default(cls) -> "RateLimiter":
+        """The process-wide limiter (created on first use, limits from env)."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+                raw = os.environ.get("BEDROCK_RATE_LIMITS")
+                if raw:
+                    try:
+                        for model_id, limit in json.loads(raw).items():
+                            cls._default.configure(model_id, limit.get("rpm"), limit.get("tpm"))
+                    except (ValueError, AttributeError) as err:
+                        logger.warning("Ignoring invalid BEDROCK_RATE_LIMITS: %s", err)
+            return cls._default
+
+    def configure(self, model_id: str, rpm: Optional[float] = None,
+                  tpm: Optional[float] = None) -> None:
+        """Set (or, with rpm=tpm=None, remove) the limits for model_id ("*" = fallback)."""
+        with self._cond:
+            if rpm or tpm:
+                self._limits[model_id] = _ModelLimit(rpm, tpm)
+            else:
+                self._limits.pop(model_id, None)
+            self._cond.notify_all()
+
+    def _limit_for(self, model_id: str) -> Optional[_ModelLimit]:
+        return self._limits.get(model_id) or self._limits.get("*")
+
+    # ── Acquire / settle ──────────────────────────────────────────────────────
+
+    def acquire(
+        self,
+        model_id: str,
+        tokens:   int            = 0,
+        priority: str            = INTERACTIVE,
+        timeout:  Optional[float] = None,
+    ) -> Reservation:
+        """
+        Block until one request and `tokens` estimated tokens are available
+        for model_id, then take them.
+
+        Raises RateLimitTimeout if timeout (seconds) elapses first.
+        """
+        start = time.monotonic()
+        with self._cond:
+            limit = self._limit_for(model_id)
+            if limit is None:
+                return Reservation(model_id, 0, 0.0)
+
+            entry = (PRIORITIES.get(priority, len(PRIORITIES)), next(self._seq))
+            heapq.heappush(limit.waiters, entry)
+            try:
+                while True:
+                    now  = time.monotonic()
+                    wait = limit.wait_time(tokens, now) if limit.waiters[0] == entry else None
+                    if wait == 0.0:
+                        limit.consume(tokens)
+                        break
+                    if timeout is not None:
+                        remaining = timeout - (now - start)
+                        if remaining <= 0:
+                            raise RateLimitTimeout(
+                                f"No {model_id} capacity within {timeout}s")
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                limit.waiters.remove(entry)
+                heapq.heapify(limit.waiters)
+                self._cond.notify_all()
+
+            wait_s = time.monotonic() - start
+            self._record(model_id, priority, wait_s)
+        if wait_s > 0.05:
+            logger.info("Rate limiter: %s waited %.2fs (%s, %d tokens)",
+                        model_id, wait_s, priority, tokens)
+        return Reservation(model_id, tokens, wait_s)
+
+    def settle(self, reservation: Reservation, actual_tokens: Optional[int]) -> None:
+        """Correct the token bucket with the usage the response reported."""
+        if actual_tokens is None or reservation.tokens == actual_tokens:
+            return
+        with self._cond:
+            limit = self._limit_for(reservation.model_id)
+            if limit and limit.tokens:
+                limit.tokens.refund(reservation.tokens - actual_tokens)
+                self._cond.notify_all()
+
+    # ── Client wrapper ────────────────────────────────────────────────────────
+
+    def wrap(self, client, priority: str = INTERACTIVE) -> "RateLimitedClient":
+        """bedrock-runtime client whose invoke_model / converse calls acquire first."""
+        return RateLimitedClient(client, self, priority)
+
+    # ── Metrics ───────────────────────────────────────────────────────────────
+
+    def _record(self, model_id: str, priority: str, wait_s: float) -> None:
+        row = self._stats.setdefault((model_id, priority), {
+            "acquired": 0, "waited": 0, "total_wait_s": 0.0,
+            "waits": deque(maxlen=500),
+        })
+        row["acquired"]     += 1
+        row["waited"]       += wait_s > 0.001
+        row["total_wait_s"] += wait_s
+        row["waits"].append(wait_s)
+
+    def stats(self) -> list[dict]:
+        """
+        Queue statistics per (model, priority):
+            acquired     : calls let through
+            waited       : calls that had to queue
+            mean_wait_ms / p95_wait_ms / max_wait_ms : queue wait (last 500 calls)
+            queued       : callers waiting right now (all priorities)
+        """
+        rows = []
+        with self._cond:
+            for (model_id, priority), row in self._stats.items():
+                waits = sorted(row["waits"])
+                limit = self._limit_for(model_id)
+                rows.append({
+                    "model_id":     model_id,
+                    "priority":     priority,
+                    "acquired":     row["acquired"],
+                    "waited":       row["waited"],
+                    "mean_wait_ms": round(1000 * row["total_wait_s"] / row["acquired"], 1),
+                    "p95_wait_ms":  round(1000 * waits[int(0.95 * (len(waits) - 1))], 1),
+                    "max_wait_ms":  round(1000 * waits[-1], 1),
+                    "queued":       len(limit.waiters) if limit else 0,
+                })
+        return rows
+
+
+################################################################################
+# SECTION: Client Wrapper
+################################################################################
+
+def estimate_converse_tokens(kwargs: dict) -> int:
+    """Estimated TPM cost of a converse / converse_stream request."""
+    from cmn.bedrock.converse.context_window import _block_chars
+
+    chars  = sum(len(b.get('text', '')) for b in kwargs.get('system', []))
+    chars += sum(_block_chars(b)
+                 for m in kwargs.get('messages', []) for b in m.get('content', []))
+    return chars // CHARS_PER_TOKEN + kwargs.get('inferenceConfig', {}).get('maxTokens', 0)
+
+
+def _estimate_invoke_tokens(body) -> int:
+    """Estimated tokens of an invoke_model body (embeddings: input text only)."""
+    try:
+        payload = json.loads(body)
+    except (TypeError, ValueError):
+        return 0
+    if not isinstance(payload, dict):
+        return 0
+    text = payload.get('inputText') or payload.get('prompt') or ''
+    if isinstance(payload.get('texts'), list):
+        text = ''.join(payload['texts'])
+    return len(text) // CHARS_PER_TOKEN if isinstance(text, str) else 0
+
+
+class RateLimitedClient:
+    """
+    Transparent proxy around a bedrock-runtime client. invoke_model,
+    invoke_model_with_response_stream and converse acquire from the limiter
+    before sending; everything else (incl. converse_stream, which
+    ConversationManager limits itself) is delegated unchanged.
+    """
+
+    def __init__(self, client, limiter: RateLimiter, priority: str = INTERACTIVE):
+        self._client   = client
+        self._limiter  = limiter
+        self._priority = priority
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def invoke_model(self, **kwargs):
+        self._limiter.acquire(kwargs.get('modelId'),
+                              _estimate_invoke_tokens(kwargs.get('body')), self._priority)
+        return self._client.invoke_model(**kwargs)
+
+    def invoke_model_with_response_stream(self, **kwargs):
+        self._limiter.acquire(kwargs.get('modelId'),
+                              _estimate_invoke_tokens(kwargs.get('body')), self._priority)
+        return self._client.invoke_model_with_response_stream(**kwargs)
+
+    def converse(self, **kwargs):
+        reservation = self._limiter.acquire(
+            kwargs.get('modelId'), estimate_converse_tokens(kwargs), self._priority)
+        actual = 0
+        try:
+            response = self._client.converse(**kwargs)
+            actual   = response.get('usage', {}).get('totalTokens') or 0
+            return response
+        finally:
+            self._limiter.settle(reservation, actual)
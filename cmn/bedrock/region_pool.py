@@ -0,0 +1,351 @@
+"""
+cmn/bedrock/region_pool.py
+==========================
+Multi-region bedrock-runtime client with failover, per-region circuit
+breakers and optional request hedging for converse_stream.
+
+A drop-in replacement for a single-region client: ConversationManager,
+process_stream and pages keep calling client.converse_stream(...) etc.
+
+Behaviour
+---------
+- Calls go to the first healthy region in the configured order.
+- Throttling / service-unavailable / connection errors mark a failure on
+  that region's circuit breaker and the call is retried in the next
+  healthy region. Other errors (validation, access denied) are raised.
+- A breaker opens after `failure_threshold` consecutive failures and stays
+  open for `cooldown_s`; then calls are let through again (half-open) and
+  the next failure re-opens it immediately.
+- converse_stream peeks the first stream event, so exception events sent
+  before any content (e.g. throttlingException) also fail over.
+- Hedging: if the first event has not arrived within `hedge_after_s`
+  (or, when None and hedging is enabled, the rolling p95 of first-event
+  latency) a duplicate request is sent to the next healthy region and
+  whichever stream answers first is used; the other is closed. The two
+  racing requests each stay in their own region — only if both fail does
+  the call fail over to the regions not tried yet, so one region never
+  receives two billed copies of a request.
+
+Model IDs must be valid in every pooled region (e.g. use "global." or the
+matching "us." / "eu." inference profiles).
+
+Usage
+-----
+    from cmn.bedrock.client_manager import BedrockClientFactory
+
+    client = BedrockClientFactory.bedrock_runtime_pool(
+        regions = ["us-east-1", "us-west-2"],
+        hedge   = True,
+    )
+    response = client.converse_stream(modelId=..., messages=...)
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
+from cmn.bedrock.converse.models import _EXCEPTION_EVENTS
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_ERROR_CODES = {
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "InternalServerException",
+    "ModelNotReadyException",
+    "TooManyRequestsException",
+}
+
+# Transport errors another region may not have. Other BotoCoreErrors
+# (ParamValidationError, NoCredentialsError, ...) fail the same everywhere.
+_RETRYABLE_BOTOCORE_ERRORS = (
+    EndpointConnectionError,
+    ConnectTimeoutError,
+    ReadTimeoutError,
+    ConnectionClosedError,
+)
+
+# Stream exception events that may be retried in another region when they
+# arrive before any content. validationException is a request problem.
+_RETRYABLE_STREAM_EVENTS = set(_EXCEPTION_EVENTS) - {"validationException"}
+
+
+def _is_retryable(err: Exception) -> bool:
+    if isinstance(err, ClientError):
+        return err.response.get("Error", {}).get("Code") in RETRYABLE_ERROR_CODES
+    return isinstance(err, _RETRYABLE_BOTOCORE_ERRORS)
+
+
+class _StreamEventError(Exception):
+    """Raised when a stream's first event is a retryable exception event."""
+
+
+################################################################################
+# SECTION: Circuit Breaker
+################################################################################
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one region. Thread-safe."""
+
+    def __init__(self, failure_threshold: int = 3, cooldown_s: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown_s        = cooldown_s
+        self.failures          = 0
+        self.opened_at         = None
+        self._lock             = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown_s:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """True unless open; a half-open breaker admits calls again and
+        re-opens on the next failure (the failure count is not reset)."""
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures  = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+################################################################################
+# SECTION: Stream Wrapper
+################################################################################
+
+class _PeekedStream:
+    """Re-attaches an already-read first event in front of the rest of a stream."""
+
+    def __init__(self, first: dict, iterator, stream):
+        self._events = itertools.chain([first], iterator)
+        self._stream = stream
+
+    def __iter__(self):
+        return self._events
+
+    def close(self) -> None:
+        if hasattr(self._stream, "close"):
+            self._stream.close()
+
+
+################################################################################
+# SECTION: RegionPoolClient
+################################################################################
+
+class RegionPoolClient:
+    """
+    bedrock-runtime client spread over several regions.
+    Create via BedrockClientFactory.bedrock_runtime_pool().
+    """
+
+    def __init__(
+        self,
+        clients:           dict,
+        failure_threshold: int             = 3,
+        cooldown_s:        float           = 30.0,
+        hedge:             bool            = False,
+        hedge_after_s:     Optional[float] = None,
+        hedge_min_samples: int             = 20,
+    ):
+        self.regions           = list(clients)
+        self._clients          = clients
+        self._breakers         = {
+            r: CircuitBreaker(failure_threshold, cooldown_s) for r in self.regions
+        }
+        self.hedge             = hedge
+        self.hedge_after_s     = hedge_after_s
+        self.hedge_min_samples = hedge_min_samples
+        self._first_event_s    = deque(maxlen=200)
+        self._executor         = (
+            ThreadPoolExecutor(max_workers=8, thread_name_prefix="region-hedge")
+            if hedge else None
+        )
+        self.last_region       = None
+        self.stats             = {"failovers": 0, "hedges": 0, "hedge_wins": 0}
+        self._stats_lock       = threading.Lock()
+
+    # ── Introspection ─────────────────────────────────────────────────────────
+
+    def _count(self, key: str) -> None:
+        # Hedged attempts update stats from executor threads
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def breaker_states(self) -> dict:
+        return {r: b.state for r, b in self._breakers.items()}
+
+    def _candidate_regions(self) -> list[str]:
+        """Healthy regions in preference order; all regions if none are healthy."""
+        healthy = [r for r in self.regions if self._breakers[r].allow()]
+        return healthy or list(self.regions)
+
+    def _hedge_threshold(self) -> Optional[float]:
+        if not self.hedge:
+            return None
+        if self.hedge_after_s is not None:
+            return self.hedge_after_s
+        if len(self._first_event_s) < self.hedge_min_samples:
+            return None
+        samples = sorted(self._first_event_s)
+        return samples[int(0.95 * (len(samples) - 1))]
+
+    # ── Generic failover ──────────────────────────────────────────────────────
+
+    def __getattr__(self, name):
+        """Any other client method (converse, invoke_model, count_tokens...)."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not callable(getattr(self._clients[self.regions[0]], name)):
+            return getattr(self._clients[self.regions[0]], name)
+
+        def call(*args, **kwargs):
+            return self._with_failover(
+                lambda region: getattr(self._clients[region], name)(*args, **kwargs)
+            )
+        return call
+
+    def _attempt(self, region: str, fn):
+        """fn(region) once, recorded on the region's breaker. Errors propagate."""
+        try:
+            result = fn(region)
+        except (ClientError, BotoCoreError, _StreamEventError) as err:
+            if isinstance(err, _StreamEventError) or _is_retryable(err):
+                self._breakers[region].record_failure()
+                logger.warning("Region %s failed (%s)", region, err)
+            raise
+        self._breakers[region].record_success()
+        return result
+
+    @staticmethod
+    def _retryable(err: BaseException) -> bool:
+        return isinstance(err, _StreamEventError) or (
+            isinstance(err, (ClientError, BotoCoreError)) and _is_retryable(err))
+
+    @staticmethod
+    def _surface(err: BaseException) -> BaseException:
+        """The error to raise once every region failed."""
+        if isinstance(err, _StreamEventError):
+            return ClientError(
+                {"Error": {"Code": "ServiceUnavailableException",
+                           "Message": str(err)}},
+                "ConverseStream",
+            )
+        return err
+
+    def _with_failover(self, fn, regions: Optional[list] = None):
+        last_err = None
+        for attempt, region in enumerate(regions or self._candidate_regions()):
+            if attempt:
+                self._count("failovers")
+            try:
+                result = self._attempt(region, fn)
+            except (ClientError, BotoCoreError, _StreamEventError) as err:
+                if not self._retryable(err):
+                    raise
+                last_err = err
+                continue
+            self.last_region = region
+            return result
+        raise self._surface(last_err)
+
+    # ── converse_stream ───────────────────────────────────────────────────────
+
+    def _open_stream(self, region: str, kwargs: dict) -> dict:
+        """Call converse_stream in region and wait for its first event."""
+        start    = time.monotonic()
+        response = self._clients[region].converse_stream(**kwargs)
+        stream   = response["stream"]
+        iterator = iter(stream)
+        first    = next(iterator, None)
+
+        if first is not None:
+            for exc_key in _RETRYABLE_STREAM_EVENTS:
+                if exc_key in first:
+                    if hasattr(stream, "close"):
+                        stream.close()
+                    raise _StreamEventError(
+                        f"[{exc_key}] {first[exc_key].get('message', exc_key)}"
+                    )
+            self._first_event_s.append(time.monotonic() - start)
+            stream = _PeekedStream(first, iterator, stream)
+
+        return {**response, "stream": stream}
+
+    def converse_stream(self, **kwargs) -> dict:
+        threshold = self._hedge_threshold()
+        if threshold is None:
+            return self._with_failover(lambda region: self._open_stream(region, kwargs))
+        return self._hedged_stream(kwargs, threshold)
+
+    def _hedged_stream(self, kwargs: dict, threshold: float) -> dict:
+        regions = self._candidate_regions()
+        open_in = lambda region: self._open_stream(region, kwargs)
+
+        # Primary is a single-region attempt: failing over while a hedge is
+        # in flight could land both copies in the hedge's region
+        primary = self._executor.submit(self._attempt, regions[0], open_in)
+        racing  = {primary: regions[0]}
+        done, _ = wait([primary], timeout=threshold)
+        if not done and len(regions) > 1:
+            # Primary is slow — race a duplicate against it in the next region
+            self._count("hedges")
+            hedge_region = regions[1]
+            logger.info("Hedging converse_stream to %s after %.2fs", hedge_region, threshold)
+            racing[self._executor.submit(self._attempt, hedge_region, open_in)] = hedge_region
+
+        pending = set(racing)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    continue
+                if future is not primary:
+                    self._count("hedge_wins")
+                self.last_region = racing[future]
+                for loser in pending:
+                    loser.add_done_callback(self._close_loser)
+                return future.result()
+
+        # Every racing attempt failed — fail over through the untried regions
+        err = primary.exception()
+        for future in racing:
+            if not self._retryable(future.exception()):
+                raise future.exception()
+        rest = [r for r in regions if r not in racing.values()]
+        if not rest:
+            raise self._surface(err)
+        self._count("failovers")
+        return self._with_failover(open_in, rest)
+
+    @staticmethod
+    def _close_loser(future) -> None:
+        if future.exception() is None:
+            stream = future.result()["stream"]
+            if hasattr(stream, "close"):
+                try:
+                    stream.close()
+                except Exception as close_err:
+                    logger.warning("Error closing hedged stream: %s", close_err)
@@ -25,6 +25,8 @@ class FoundationModel:
             'streaming_tool_use': streaming_tool_use,
             'guardrails': guardrails
         }
+        self.features.update(self._set_prompt_caching())
+        self.features.update(self._set_tool_result_formats())
         self.InferenceParameter = self._set_inference_parameters()
 
     def isFeatureSupported(self, feature_id):
@@ -33,6 +35,27 @@ class FoundationModel:
     def get_provider(self):
         return self.provider
 
+    def _set_prompt_caching(self):
+        # Bedrock prompt caching (cachePoint blocks).
+        # Claude: system, messages and tools. Nova: system and messages only.
+        if self.provider == "Anthropic":
+            cacheable = any(marker in self.model_id for marker in [
+                "claude-3-7-sonnet", "claude-3-5-haiku",
+                "claude-sonnet-4", "claude-opus-4", "claude-haiku-4",
+            ])
+            return {'prompt_caching': cacheable, 'prompt_caching_tools': cacheable}
+        elif self.provider == "Amazon":
+            cacheable = any(marker in self.model_id for marker in [
+                "nova-micro", "nova-lite", "nova-pro", "nova-premier", "nova-2-lite",
+            ])
+            return {'prompt_caching': cacheable, 'prompt_caching_tools': False}
+        return {'prompt_caching': False, 'prompt_caching_tools': False}
+
+    def _set_tool_result_formats(self):
+        # Tables in toolResult content may be sent as CSV text blocks
+        # (ResultEncoder) — only for models that read them as reliably as JSON.
+        return {'tool_result_csv': self.provider in ("Anthropic", "Amazon")}
+
     def _set_inference_parameters(self):
         if self.provider == "Anthropic":
             
@@ -16,6 +16,8 @@ import logging
 from datetime import datetime, timezone
 import numpy as np
 
+from cmn.bedrock.rate_limiter import RateLimiter
+
 
 # Configure logging
 logging.basicConfig(
@@ -117,7 +119,8 @@ class MultimodalSearchService:
 
     def _get_bedrock_client(self):
         """Initialize Bedrock client"""
-        return self.session.client('bedrock-runtime', region_name=config.AWS_REGION)
+        client = self.session.client('bedrock-runtime', region_name=config.AWS_REGION)
+        return RateLimiter.default().wrap(client)
 
     def _get_opensearch_client(self):
         """Initialize OpenSearch Serverless client"""
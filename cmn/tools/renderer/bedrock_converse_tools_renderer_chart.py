@@ -3,6 +3,7 @@ import plotly.express as px
 import streamlit as st
 from typing import Any
 from cmn.tools.renderer.bedrock_converse_tools_renderer import AbstractToolRenderer
+from cmn.tools.tool.bedrock_converse_tools_tool import RENDER_KEY
 
 
 class ChartToolRenderer(AbstractToolRenderer):
@@ -13,7 +14,12 @@ class ChartToolRenderer(AbstractToolRenderer):
 
     def render(self, tool_args: dict, tool_result: Any, result_container) -> None:
 
-        data  = tool_args.get("data") or tool_result.get("data", [])
+        # Rows resolved from data_ref come back render-only (not in tool_args)
+        data  = (
+            (tool_result.get(RENDER_KEY) or {}).get("data")
+            or tool_args.get("data")
+            or tool_result.get("data", [])
+        )
         x     = tool_args["x_label"]
         y     = tool_args["y_label"]
         title = tool_args["title"]
@@ -20,14 +20,21 @@ class SalesAnomalyToolRenderer(AbstractToolRenderer):
         normal    = tool_result.get("normal",    [])
         metric    = tool_result.get("metric",    "revenue")
         year      = tool_result.get("year",      "")
-        mean      = tool_result.get("mean",       0)
+        mean      = tool_result.get("mean")
+        method    = tool_result.get("method",    "zscore")
 
         with result_container:
             st.markdown(f"**🔍 Anomaly Detection — {metric.title()} {year}**")
-            st.caption(
-                f"Yearly mean: {mean:,.0f} | "
-                f"Threshold: ±{tool_result.get('threshold', 1.5)} std dev"
-            )
+            if mean is not None:
+                st.caption(
+                    f"Yearly mean: {mean:,.0f} | "
+                    f"Threshold: ±{tool_result.get('threshold', 1.5)} std dev | {method}"
+                )
+            else:
+                st.caption(
+                    f"{tool_result.get('series_count', 0)} series | "
+                    f"Threshold: ±{tool_result.get('threshold', 1.5)} | {method}"
+                )
 
             if not anomalies:
                 st.success("✅ No anomalies detected — all months within normal range.")
@@ -37,10 +44,13 @@ class SalesAnomalyToolRenderer(AbstractToolRenderer):
             for i, entry in enumerate(anomalies):
                 with cols[i % 4]:
                     icon = "🔴" if entry["flag"] == "below_normal" else "🟢"
+                    label = f"{icon} {entry['month_name']}"
+                    if "series" in entry:
+                        label += f" · {entry['series']}"
                     st.metric(
-                        label       = f"{icon} {entry['month_name']}",
+                        label       = label,
                         value       = f"{entry['value']:,.0f}",
-                        delta       = f"{entry['pct_vs_mean']:+.1f}% vs mean",
+                        delta       = f"{entry['pct_vs_mean'] or 0:+.1f}% vs mean",
                         delta_color = "normal" if entry["flag"] == "above_normal" else "inverse",
                     )
                     st.caption(f"Z-score: {entry['zscore']} | {entry.get('severity', '')}")
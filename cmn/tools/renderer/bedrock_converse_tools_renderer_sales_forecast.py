@@ -32,34 +32,40 @@ class SalesForecastToolRenderer(AbstractToolRenderer):
             col1, col2, col3 = st.columns(3)
             col1.metric("Trend",      summary.get("trend", "").title())
             col2.metric("Monthly Δ",  f"{model_info.get('slope', 0):+,.0f}")
+            r2 = model_info.get("r2_score")
             col3.metric("Confidence", summary.get("confidence", "").title(),
-                        delta=f"R²={model_info.get('r2_score', 0)}")
+                        delta=f"R²={r2}" if r2 is not None else None)
+
+            # Actuals may span several years — label each point with its own
+            first_year = actuals[0].get("year", train_year) if actuals else train_year
+            span       = (f"{first_year}–{train_year}" if first_year != train_year
+                          else f"{train_year}")
 
             rows = []
             for row in actuals:
                 rows.append({
-                    "order":  row["month"],
-                    "label":  f"{row['month_name']} {train_year}",
+                    "order":  len(rows),
+                    "label":  f"{row['month_name']} {row.get('year', train_year)}",
                     "value":  row["actual"],
-                    "series": f"{train_year} Actual",
+                    "series": "Actual",
                 })
-            for i, row in enumerate(forecast):
+            for row in forecast:
                 rows.append({
-                    "order":  12 + (i + 1),
-                    "label":  f"{row['month_name']} {forecast_year}",
+                    "order":  len(rows),
+                    "label":  f"{row['month_name']} {row.get('forecast_year', forecast_year)}",
                     "value":  row["forecasted_value"],
-                    "series": f"{forecast_year} Forecast",
+                    "series": "Forecast",
                 })
 
             plot_df = pd.DataFrame(rows).sort_values("order")
 
-            st.markdown(f"**{train_year} Actuals vs {forecast_year} Forecast**")
+            st.markdown(f"**{span} Actuals vs Forecast**")
             fig = px.line(
                 plot_df, x="label", y="value", color="series",
                 markers=True,
                 color_discrete_map={
-                    f"{train_year} Actual":      "#4A90D9",
-                    f"{forecast_year} Forecast": "#FF6B6B",
+                    "Actual":   "#4A90D9",
+                    "Forecast": "#FF6B6B",
                 },
             )
             fig.update_xaxes(
@@ -68,11 +74,11 @@ class SalesForecastToolRenderer(AbstractToolRenderer):
             )
             st.plotly_chart(fig, width="content")
 
-            st.markdown(f"**{forecast_year} Monthly Forecast**")
+            st.markdown("**Monthly Forecast**")
             st.dataframe(
                 pd.DataFrame([
                     {
-                        "Month":                f"{f['month_name']} {forecast_year}",
+                        "Month":                f"{f['month_name']} {f.get('forecast_year', forecast_year)}",
                         f"Forecast ({metric})": f"{f['forecasted_value']:,.0f}",
                     }
                     for f in forecast
@@ -3,35 +3,49 @@ cmn/tools/tool/__init__.py
 ==========================
 Re-exports all Bedrock converse tools and the ToolRegistry.
 
+The registry, executor and metrics are imported eagerly (stdlib only).
+Tool classes are resolved lazily (PEP 562): importing this package loads
+no tool module, `from cmn.tools.tool import PdfBedrockConverseTool` loads
+only the PDF tool. See catalog.py.
+
 Naming convention for tool files:
     bedrock_converse_tools_tool_<toolname>.py
 """
 
-from cmn.tools.tool.bedrock_converse_tools_tool                import AbstractBedrockConverseTool, ToolRegistry
-from cmn.tools.tool.bedrock_converse_tools_tool_acronym        import AcronymBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_aws_docs       import AwsDocsBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_calculator     import CalculatorBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_datetime       import DateTimeBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_eda_correlation import EDACorrelationBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_eda_group      import EDAGroupBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_eda_profile    import EDAProfileBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_holiday        import HolidayBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_pdf            import PdfBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_pptx           import PptxBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_sales          import SalesBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_sales_kpi      import SalesKpiBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_sales_forecast       import SalesForecastBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_sales_anomaly        import SalesAnomalyBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_url            import UrlContentBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_wikipedia   import WikipediaBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_chart           import ChartBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_product         import ProductBedrockConverseTool
+from cmn.tools.tool.bedrock_converse_tools_tool                import AbstractBedrockConverseTool, ResultEncoder, ResultStore, ToolRegistry, ToolResultCache
+from cmn.tools.tool.executor                                   import INLINE, PROCESS, THREAD, ToolExecutor
+from cmn.tools.tool.metrics                                    import EmfExporter, JsonlExporter, ToolMetrics
+from cmn.tools.tool.catalog                                    import CLASSES, TOOLS, load_class, tool_class
+
+
+def __getattr__(name: str):
+    if name not in CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = globals()[name] = load_class(name)
+    return cls
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(CLASSES))
 
 
 __all__ = [
     # Base
     "AbstractBedrockConverseTool",
+    "ResultStore",
+    "ResultEncoder",
     "ToolRegistry",
+    "ToolResultCache",
+    "ToolExecutor",
+    "INLINE",
+    "THREAD",
+    "PROCESS",
+    "ToolMetrics",
+    "EmfExporter",
+    "JsonlExporter",
+    "TOOLS",
+    "tool_class",
+    # Tools (lazy)
     "AcronymBedrockConverseTool",
     "AwsDocsBedrockConverseTool",
     "CalculatorBedrockConverseTool",
@@ -47,8 +61,9 @@ __all__ = [
     "SalesForecastBedrockConverseTool",
     "SalesAnomalyBedrockConverseTool",
     "UrlContentBedrockConverseTool",
+    "WebSearchBedrockConverseTool",
     "WikipediaBedrockConverseTool",
     "ChartBedrockConverseTool",
     "ProductBedrockConverseTool",
-    
-]
\ No newline at end of file
+
+]
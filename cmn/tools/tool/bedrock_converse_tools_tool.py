@@ -1,10 +1,47 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any
+import asyncio
+import copy
+import csv
+import hashlib
+import io
 import json
 import logging
+import threading
+import time
+import uuid
+
+from cmn.tools.tool.catalog import tool_class
+from cmn.tools.tool.executor import INLINE, ToolExecutor
+from cmn.tools.tool.metrics import ToolCall, ToolMetrics
 
 logger = logging.getLogger(__name__)
 
+# Shared inputSchema property for tools that accept a dataset by reference
+DATA_REF_PROPERTY = {
+    "type": "string",
+    "description": (
+        "Handle of a dataset returned by another tool (its 'data_ref' field, "
+        "e.g. 'ds_1a2b3c4d'). Prefer this over copying the data array."
+    ),
+}
+
+# Result key for UI-only payload (e.g. the rows a chart plots): renderers
+# see it through on_tool_invoked, ToolRegistry.content() strips it so it
+# never goes back to the model.
+RENDER_KEY = "_render"
+
+# Several datasets concatenated — e.g. one sales_data result per year
+DATA_REFS_PROPERTY = {
+    "type":  "array",
+    "items": {"type": "string"},
+    "description": (
+        "Handles of several datasets (their 'data_ref' fields) whose rows are "
+        "combined, e.g. one sales_data result per year."
+    ),
+}
+
 
 class AbstractBedrockConverseTool(ABC):
     """
@@ -12,6 +49,20 @@ class AbstractBedrockConverseTool(ABC):
     """
     definition: object
 
+    # True for tools whose result carries a 'data' array worth passing on by
+    # reference — ToolRegistry stores it and adds a data_ref to the result.
+    produces_dataset: bool = False
+
+    # Seconds an identical call (same tool, same canonical args) may be
+    # answered from ToolResultCache. None = never cached (side effects,
+    # time-dependent or cheap tools).
+    cache_ttl_s: float | None = None
+
+    # Where ToolRegistry runs invoke() when it has a ToolExecutor: INLINE,
+    # THREAD or PROCESS (CPU-bound tools; needs a no-argument constructor).
+    # See cmn/tools/tool/executor.py.
+    execution: str = INLINE
+
     def __init__(self, name, definition):
         self.name       = name
         self.definition = definition
@@ -30,22 +81,366 @@ class AbstractBedrockConverseTool(ABC):
     def invoke(self, params, tool_args=None):
         raise NotImplementedError
 
+    async def ainvoke(self, params, tool_args=None):
+        """
+        Async entry point used by AsyncConversationManager.
+        Default runs the blocking invoke() in a worker thread — override
+        with a native coroutine for tools that have an async client.
+        """
+        return await asyncio.to_thread(self.invoke, params, tool_args)
+
+
+class ResultStore:
+    """
+    Per-conversation store of tool result datasets, addressed by data_ref.
+
+    Lets the model pass a dataset from one tool to the next by handle
+    instead of copying every row into its output. Bounded LRU; thread-safe
+    because tools of one turn may run concurrently.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._data       = OrderedDict()
+        self._lock       = threading.Lock()
+
+    def put(self, rows: list) -> str:
+        ref = f"ds_{uuid.uuid4().hex[:8]}"
+        with self._lock:
+            self._data[ref] = rows
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return ref
+
+    def get(self, ref: str) -> list | None:
+        with self._lock:
+            rows = self._data.get(ref)
+            if rows is not None:
+                self._data.move_to_end(ref)
+            return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ToolResultCache:
+    """
+    Memoizes tool results by tool name + canonical JSON hash of the args.
+
+    Opt-in per registry (ToolRegistry(..., cache=ToolResultCache.default()))
+    and per tool (cache_ttl_s). Size-bounded LRU with per-entry expiry;
+    error results are never cached. Thread-safe — default() is shared by
+    every session in the process.
+    """
+
+    _default      = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries    = OrderedDict()    # key → (expires_at, result)
+        self._lock       = threading.Lock()
+        self.hits        = 0
+        self.misses      = 0
+        self.evictions   = 0
+
+    @classmethod
+    def default(cls) -> "ToolResultCache":
+        """The process-wide cache (created on first use)."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @staticmethod
+    def make_key(tool_name: str, tool_args: dict) -> str:
+        canonical = json.dumps(tool_args or {}, sort_keys=True,
+                               separators=(",", ":"), default=str)
+        return f"{tool_name}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """(True, result) on a live hit, else (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: str, result: Any, ttl_s: float) -> None:
+        if isinstance(result, dict) and "error" in result:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_s, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries":   len(self._entries),
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+            "hit_rate":  round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class ResultEncoder:
+    """
+    Compacts the tables in a tool result before it is sent to the model.
+
+    A table is any top-level list of at least min_rows dicts ('data',
+    'groups', ...). As row records every column name is repeated in every
+    row; content() serializes each allowed encoding and keeps the smallest:
+
+    records   : unchanged list of row dicts
+    columnar  : {"columns": [...], "rows": [[...], ...]}
+    csv       : tables moved into CSV text blocks, the rest stays JSON
+
+    Opt-in: float_digits rounds floats to that many significant digits in
+    the columnar and CSV encodings (default None = full precision). The
+    records encoding never changes values. Savings against the plain
+    records JSON accumulate in stats(). Thread-safe.
+
+    Usage:
+        encoder = ResultEncoder.for_model(model_id)
+        content = encoder.content(tool_result)     # toolResult content blocks
+    """
+
+    RECORDS   = "records"
+    COLUMNAR  = "columnar"
+    CSV       = "csv"
+    ENCODINGS = (RECORDS, COLUMNAR, CSV)
+
+    CHARS_PER_TOKEN = 4         # same heuristic as cmn/bedrock/rate_limiter.py
+
+    def __init__(
+        self,
+        encodings:    tuple = ENCODINGS,
+        float_digits: int | None = None,
+        min_rows:     int = 2,
+    ):
+        self.encodings    = tuple(encodings)
+        self.float_digits = float_digits
+        self.min_rows     = min_rows
+        self._lock        = threading.Lock()
+        self._results     = 0
+        self._encoded     = 0
+        self._bytes_in    = 0
+        self._bytes_out   = 0
+        self._chosen      = {encoding: 0 for encoding in self.encodings}
+
+    @classmethod
+    def for_model(cls, model_id: str, **kwargs) -> "ResultEncoder":
+        """
+        Encoder for model_id: CSV only for models flagged 'tool_result_csv'
+        in cmn/bedrock_models.py (unknown models stay JSON-only).
+        """
+        from cmn.bedrock_models import FoundationModel
+
+        model = FoundationModel.find(model_id)
+        if model is None or not model.isFeatureSupported('tool_result_csv'):
+            kwargs.setdefault("encodings", (cls.RECORDS, cls.COLUMNAR))
+        return cls(**kwargs)
+
+    # ── Encoding ──────────────────────────────────────────────────────────────
+
+    def _round(self, value: Any) -> Any:
+        if type(value) is float and self.float_digits is not None and value == value:
+            return float(f"{value:.{self.float_digits}g}")
+        return value
+
+    def _tables(self, result: dict) -> list[str]:
+        return [
+            key for key, value in result.items()
+            if isinstance(value, list) and len(value) >= self.min_rows
+            and all(isinstance(row, dict) for row in value)
+        ]
+
+    @staticmethod
+    def _columns(rows: list[dict]) -> list:
+        return list(dict.fromkeys(key for row in rows for key in row))
+
+    def _encode(self, result: dict, tables: list[str], encoding: str) -> list[dict] | None:
+        """toolResult content blocks for one encoding; None if it does not apply."""
+        encoded = dict(result)
+        texts   = []
+        for key in tables:
+            rows = result[key]
+            if encoding == self.RECORDS:
+                encoded[key] = rows
+                continue
+            columns = self._columns(rows)
+            matrix  = [[self._round(row.get(col)) for col in columns] for row in rows]
+
+            if encoding == self.COLUMNAR:
+                encoded[key] = {"columns": columns, "rows": matrix}
+            else:
+                if any(isinstance(v, (dict, list)) for values in matrix for v in values):
+                    return None                         # not flat — no CSV
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, lineterminator="\n")
+                writer.writerow(columns)
+                writer.writerows(matrix)
+                encoded[key] = f"{len(rows)} rows as CSV in the text block '{key}'"
+                texts.append({"text": f"{key}:\n{buffer.getvalue()}"})
+        return [{"json": {"result": encoded}}] + texts
+
+    @staticmethod
+    def _size(blocks: list[dict]) -> int:
+        return sum(
+            len(block["text"]) if "text" in block
+            else len(json.dumps(block["json"], separators=(",", ":"), default=str))
+            for block in blocks
+        )
+
+    def content(self, result: Any) -> list[dict]:
+        """toolResult content blocks for result, in the smallest allowed encoding."""
+        plain  = [{"json": {"result": result}}]
+        tables = self._tables(result) if isinstance(result, dict) else []
+        if not tables:
+            with self._lock:
+                self._results += 1
+            return plain
+
+        best, best_size, best_encoding = plain, self._size(plain), None
+        before = best_size
+        for encoding in self.encodings:
+            blocks = self._encode(result, tables, encoding)
+            if blocks is None:
+                continue
+            size = self._size(blocks)
+            if size < best_size:
+                best, best_size, best_encoding = blocks, size, encoding
+
+        with self._lock:
+            self._results   += 1
+            self._bytes_in  += before
+            self._bytes_out += best_size
+            if best_encoding is not None:
+                self._encoded += 1
+                self._chosen[best_encoding] += 1
+        logger.debug("ResultEncoder: %s %d → %d bytes", best_encoding or "plain", before, best_size)
+        return best
+
+    def stats(self) -> dict:
+        with self._lock:
+            saved = self._bytes_in - self._bytes_out
+            return {
+                "results":      self._results,
+                "encoded":      self._encoded,
+                "bytes_before": self._bytes_in,
+                "bytes_after":  self._bytes_out,
+                "bytes_saved":  saved,
+                "tokens_saved": saved // self.CHARS_PER_TOKEN,
+                "saved_pct":    round(100 * saved / self._bytes_in, 1) if self._bytes_in else 0.0,
+                "by_encoding":  dict(self._chosen),
+            }
+
 
 class ToolRegistry:
     """
     Registers tools and provides O(1) lookup + dispatch.
 
+    Datasets returned by tools with produces_dataset=True are kept in a
+    ResultStore and tagged with a data_ref; tools that declare a 'data_ref'
+    (or 'data_refs') input get it resolved back into 'data' before
+    invoke(). Results above
+    inline_rows rows only carry a preview_rows preview of 'data'.
+
+    Pass cache=ToolResultCache.default() to answer repeated calls of tools
+    with a cache_ttl_s from the cache instead of running them again.
+
+    Pass executor=ToolExecutor.default() to run THREAD / PROCESS tools off
+    the calling thread (timeouts, cancellation, result size limits);
+    without it every tool runs inline.
+
+    Pass metrics=ToolMetrics.default() to record wall / CPU time, payload
+    sizes, errors and cache status of every call (tool diagnostics page,
+    EMF / JSONL export).
+
+    content() turns a result into toolResult content blocks; with an
+    encoder (ResultEncoder, or for_model(model_id)) tables in the result
+    are sent in their most compact encoding.
+
     Usage:
         registry = ToolRegistry([calc_tool, wiki_tool, ...])
+        registry = ToolRegistry.from_names(["expr_evaluator", "wikipedia_loader"])
         tool_cfg = registry.tool_config       # pass to converse_stream
         result   = registry.invoke(name, args)
+
+        # Shared (cached) registry — give each conversation its own store
+        registry.with_results(st.session_state.result_store)
+
+        # Compact table encoding for the model's context
+        registry = registry.for_model(model_id)
+        blocks   = registry.content(result)
     """
 
-    def __init__(self, tools: list[AbstractBedrockConverseTool]):
+    def __init__(
+        self,
+        tools:        list[AbstractBedrockConverseTool],
+        results:      ResultStore | None = None,
+        inline_rows:  int = 50,
+        preview_rows: int = 5,
+        cache:        ToolResultCache | None = None,
+        encoder:      ResultEncoder | None = None,
+        executor:     ToolExecutor | None = None,
+        metrics:      ToolMetrics | None = None,
+    ):
         self._tools = {
             tool.definition['toolSpec']['name']: tool
             for tool in tools
         }
+        self.results      = results if results is not None else ResultStore()
+        self.inline_rows  = inline_rows
+        self.preview_rows = preview_rows
+        self.cache        = cache
+        self.encoder      = encoder
+        self.executor     = executor
+        self.metrics      = metrics
+
+    @classmethod
+    def from_names(cls, names: list[str], **kwargs) -> "ToolRegistry":
+        """
+        Registry of the named tools (catalog.TOOLS), built with their no-argument
+        constructors; only their modules are imported. kwargs go to __init__.
+        Raises KeyError for an unknown name.
+        """
+        return cls([tool_class(name)() for name in names], **kwargs)
+
+    def with_results(self, results: ResultStore) -> "ToolRegistry":
+        """Same tools, different result store (one per conversation)."""
+        view         = copy.copy(self)
+        view.results = results
+        return view
+
+    def with_encoder(self, encoder: ResultEncoder | None) -> "ToolRegistry":
+        """Same tools, different result encoder."""
+        view         = copy.copy(self)
+        view.encoder = encoder
+        return view
+
+    def for_model(self, model_id: str) -> "ToolRegistry":
+        """This registry with ResultEncoder.for_model(model_id), unless it already has an encoder."""
+        if self.encoder is not None:
+            return self
+        return self.with_encoder(ResultEncoder.for_model(model_id))
 
     # ── Properties ────────────────────────────────────────────────────────────
 
@@ -117,10 +512,123 @@ class ToolRegistry:
         Dispatch to the matching tool.
         Raises KeyError if tool_name is not registered.
         """
+        tool = self._get(tool_name)
+        logger.info("Invoking tool '%s' with args: %s", tool_name, tool_args)
+        with ToolCall(self.metrics, tool, tool_args) as call:
+            key, result = self._cached(tool, tool_args)
+            call.cache  = self._cache_status(tool, key)
+            if key is None:
+                resolved, error = self._resolve_data_ref(tool_args)
+                if error:
+                    return call.done(error)
+                if self.executor is not None:
+                    result = self.executor.run(tool, resolved, usage=call.usage)
+                else:
+                    result = tool.invoke(params=None, tool_args=resolved)
+                self._remember(tool, tool_args, result)
+            return call.done(self._publish(tool, result))
+
+    async def ainvoke(self, tool_name: str, tool_args: dict) -> Any:
+        """
+        Async dispatch to the matching tool's ainvoke().
+        Raises KeyError if tool_name is not registered.
+        """
+        tool = self._get(tool_name)
+        logger.info("Invoking tool '%s' (async) with args: %s", tool_name, tool_args)
+        with ToolCall(self.metrics, tool, tool_args, thread_cpu=False) as call:
+            key, result = self._cached(tool, tool_args)
+            call.cache  = self._cache_status(tool, key)
+            if key is None:
+                resolved, error = self._resolve_data_ref(tool_args)
+                if error:
+                    return call.done(error)
+                if self.executor is not None and tool.execution != INLINE:
+                    result = await self.executor.arun(tool, resolved, usage=call.usage)
+                else:
+                    result = await tool.ainvoke(params=None, tool_args=resolved)
+                self._remember(tool, tool_args, result)
+            return call.done(self._publish(tool, result))
+
+    def _get(self, tool_name: str) -> AbstractBedrockConverseTool:
         if tool_name not in self._tools:
             raise KeyError(
                 f"Unknown tool: '{tool_name}'. Available: {self.tool_names}"
             )
-        tool = self._tools[tool_name]
-        logger.info("Invoking tool '%s' with args: %s", tool_name, tool_args)
-        return tool.invoke(params=None, tool_args=tool_args)
\ No newline at end of file
+        return self._tools[tool_name]
+
+    # ── Result cache ──────────────────────────────────────────────────────────
+    # Raw tool results are cached (before _publish), so a hit is registered
+    # in the calling conversation's ResultStore like a fresh result.
+
+    def _cached(self, tool: AbstractBedrockConverseTool, tool_args: dict) -> tuple[str | None, Any]:
+        """(key, result) on a cache hit, (None, None) otherwise."""
+        if self.cache is None or tool.cache_ttl_s is None:
+            return None, None
+        key      = ToolResultCache.make_key(tool.name, tool_args)
+        hit, res = self.cache.get(key)
+        if hit:
+            logger.info("Tool cache hit: %s", tool.name)
+            return key, res
+        return None, None
+
+    def _cache_status(self, tool: AbstractBedrockConverseTool, key: str | None) -> str:
+        """'hit', 'miss' or 'off' (no cache, or tool not cacheable) — for ToolMetrics."""
+        if key is not None:
+            return "hit"
+        if self.cache is None or tool.cache_ttl_s is None:
+            return "off"
+        return "miss"
+
+    def _remember(self, tool: AbstractBedrockConverseTool, tool_args: dict, result: Any) -> None:
+        if self.cache is not None and tool.cache_ttl_s is not None:
+            key = ToolResultCache.make_key(tool.name, tool_args)
+            self.cache.put(key, result, tool.cache_ttl_s)
+
+    # ── Result handles ────────────────────────────────────────────────────────
+
+    def _resolve_data_ref(self, tool_args: dict) -> tuple[dict, dict | None]:
+        """
+        Replace data_ref / data_refs arguments with the stored rows (in
+        that order, concatenated) as 'data'.
+        Returns (tool_args, None) or (tool_args, {"error": ...}).
+        """
+        args = tool_args or {}
+        refs = ([args["data_ref"]] if args.get("data_ref") else []) + list(args.get("data_refs") or [])
+        if not refs or args.get("data"):
+            return tool_args, None
+
+        rows = []
+        for ref in refs:
+            stored = self.results.get(ref)
+            if stored is None:
+                return tool_args, {
+                    "error": f"Unknown data_ref '{ref}'. It may have expired — "
+                             f"call the source tool again and use its new data_ref."
+                }
+            rows.extend(stored)
+        return {**tool_args, "data": rows}, None
+
+    def content(self, result: Any) -> list[dict]:
+        """toolResult content blocks for a (published) tool result."""
+        if isinstance(result, dict) and RENDER_KEY in result:
+            result = {k: v for k, v in result.items() if k != RENDER_KEY}
+        if self.encoder is None:
+            return [{"json": {"result": result}}]
+        return self.encoder.content(result)
+
+    def _publish(self, tool: AbstractBedrockConverseTool, result: Any) -> Any:
+        """Store a produced dataset and return the result with its data_ref."""
+        if not (tool.produces_dataset and isinstance(result, dict)):
+            return result
+        rows = result.get("data")
+        if not isinstance(rows, list) or not rows:
+            return result
+
+        result = {**result, "data_ref": self.results.put(rows)}
+        if len(rows) > self.inline_rows:
+            result["data"]    = rows[:self.preview_rows]
+            result["preview"] = (
+                f"'data' shows {self.preview_rows} of {len(rows)} rows. "
+                f"Pass data_ref to other tools to use the full dataset."
+            )
+        return result
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+cmn/tools/tool/bedrock_converse_tools_tool_acronym.py
+======================================================
+Tool: acronym_evaluator
+
+Resolves proprietary acronyms that are not generally defined, from a fixed
+glossary. Returns 'unknown' for anything else.
+
+Port of the deprecated cmn/bedrock_converse_tools_acronym.py onto the
+cmn.tools.tool base class (same tool name and input schema).
+
+Dependencies: none
+"""
+
+import logging
+from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+
+logger = logging.getLogger(__name__)
+
+ACRONYMS = {
+    "AUP":  "Access Utilization Procedure",
+    "POIE": "Procedural Oversight and Inspection Evaluation",
+    "SPT":  "Sustainable Production Technologies",
+}
+
+
+class AcronymBedrockConverseTool(AbstractBedrockConverseTool):
+
+    def __init__(self):
+        name = "acronym_evaluator"
+        definition = {
+            "toolSpec": {
+                "name": name,
+                "description": (
+                    "Useful for when you need to decode proprietary acronym. "
+                    "This tool is only resolving meanings of acronyms that are not generally defined. "
+                    "Tool will return the word 'unknown' if it does not know the answer."
+                ),
+                "inputSchema": {
+                    "json": {
+                        "type": "object",
+                        "properties": {
+                            "expression": {
+                                "type": "string",
+                                "description": "Acronym. Example AUP,POIE.",
+                            }
+                        },
+                        "required": ["expression"],
+                    }
+                },
+            }
+        }
+        super().__init__(name, definition)
+
+    def summary(self) -> str:
+        return "acronym_evaluator : use to look up acronym definitions"
+
+    def invoke(self, params, tool_args: dict = None) -> dict:
+        expression = (tool_args or {}).get("expression")
+
+        if not expression:
+            return {"error": "No acronym provided"}
+
+        logger.info("AcronymTool: expression=%s", expression)
+
+        acronyms = [a.strip().upper() for a in expression.split(",") if a.strip()]
+        return {"result": {a: ACRONYMS.get(a, "unknown") for a in acronyms}}
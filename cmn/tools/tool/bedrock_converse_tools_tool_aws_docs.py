@@ -28,6 +28,8 @@ KNOWN_DOCS = {
 
 class AwsDocsBedrockConverseTool(AbstractBedrockConverseTool):
 
+    cache_ttl_s = 3600.0
+
     def __init__(self):
         name = "aws_docs"
         definition = {
@@ -5,6 +5,9 @@ Tool: render_chart
 
 Does NOT render the chart itself.
 Returns a structured chart payload that the UI layer (ChartToolRenderer) renders.
+The rows to plot travel under RENDER_KEY, which ToolRegistry.content()
+strips — the model only gets the chart metadata, row_count and data_ref
+back, not the dataset it passed by reference.
 
 The model should:
   1. Fetch data first (e.g. via sales_data tool)
@@ -15,7 +18,7 @@ Dependencies: none (pure data passthrough)
 """
 
 import logging
-from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.bedrock_converse_tools_tool import DATA_REF_PROPERTY, RENDER_KEY, AbstractBedrockConverseTool
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +37,7 @@ class ChartBedrockConverseTool(AbstractBedrockConverseTool):
                 "description": (
                     "Use this tool to visualize data as a chart. "
                     "Call this AFTER you have fetched the data. "
-                    "Pass the data you want to chart along with chart configuration."
+                    "Pass the data_ref (or data) you want to chart along with chart configuration."
                 ),
                 "inputSchema": {
                     "json": {
@@ -61,10 +64,12 @@ class ChartBedrockConverseTool(AbstractBedrockConverseTool):
                                 "type": "array",
                                 "description": (
                                     "Array of data objects to chart. "
-                                    "Example: [{'month_name': 'January', 'revenue': 125000}, ...]"
+                                    "Example: [{'month_name': 'January', 'revenue': 125000}, ...]. "
+                                    "Use data_ref instead when charting another tool's dataset as-is."
                                 ),
                                 "items": {"type": "object"},
                             },
+                            "data_ref": DATA_REF_PROPERTY,
                             "color_series": {
                                 "type": "string",
                                 "description": (
@@ -77,7 +82,7 @@ class ChartBedrockConverseTool(AbstractBedrockConverseTool):
                                 ),
                             },
                         },
-                        "required": ["chart_type", "title", "x_label", "y_label", "data"],
+                        "required": ["chart_type", "title", "x_label", "y_label"],
                     }
                 },
             }
@@ -101,24 +106,29 @@ class ChartBedrockConverseTool(AbstractBedrockConverseTool):
         Actual rendering happens in ChartToolRenderer in the UI layer.
         """
         args = tool_args or {}
+        rows = args.get("data")
 
-        if not args.get("data"):
+        if not rows:
             return {"error": "No data provided to chart"}
 
         logger.info(
             "ChartTool: type=%s title=%s rows=%d color_series=%s",
             args.get("chart_type"),
             args.get("title"),
-            len(args.get("data", [])),
+            len(rows),
             args.get("color_series"),
         )
 
-        return {
+        result = {
             "status":       "chart_ready",
             "chart_type":   args.get("chart_type"),
             "title":        args.get("title"),
             "x_label":      args.get("x_label"),
             "y_label":      args.get("y_label"),
-            "data":         args.get("data"),
             "color_series": args.get("color_series"),
-        }
\ No newline at end of file
+            "row_count":    len(rows),
+            RENDER_KEY:     {"data": rows},     # renderer only, not sent to the model
+        }
+        if args.get("data_ref"):
+            result["data_ref"] = args["data_ref"]
+        return result
\ No newline at end of file
@@ -1,12 +1,21 @@
+import numpy as np
 import pandas as pd
 import logging
-from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.bedrock_converse_tools_tool import DATA_REF_PROPERTY, AbstractBedrockConverseTool
+from cmn.tools.tool.executor import PROCESS
+from cmn.tools.tool.eda.correlation import METHODS, PEARSON, correlation_matrix, top_pairs
 
 logger = logging.getLogger(__name__)
 
+THRESHOLD   = 0.5
+TOP_PAIRS   = 15
+SAMPLE_ROWS = 200_000      # taller inputs are correlated on a uniform row sample
+
 
 class EDACorrelationBedrockConverseTool(AbstractBedrockConverseTool):
 
+    execution = PROCESS     # DataFrame build + ranking of inline data
+
     def __init__(self):
         name = "eda_correlation"
         definition = {
@@ -15,7 +24,7 @@ class EDACorrelationBedrockConverseTool(AbstractBedrockConverseTool):
                 "description": (
                     "Calculates correlation between numeric columns in a dataset. "
                     "Returns notable correlations (|r| >= 0.5) ranked by strength. "
-                    "Pass data directly from another tool result such as sales_data."
+                    "Pass data_ref from another tool result such as sales_data."
                 ),
                 "inputSchema": {
                     "json": {
@@ -26,10 +35,11 @@ class EDACorrelationBedrockConverseTool(AbstractBedrockConverseTool):
                                 "items": {"type": "object"},
                                 "description": (
                                     "Data to analyze. "
-                                    "Pass the data array from another tool result. "
-                                    "Example: pass data array from sales_data result."
+                                    "Only needed when there is no data_ref — "
+                                    "pass the data array from another tool result."
                                 ),
                             },
+                            "data_ref": DATA_REF_PROPERTY,
                             "columns": {
                                 "type": "array",
                                 "items": {"type": "string"},
@@ -38,8 +48,17 @@ class EDACorrelationBedrockConverseTool(AbstractBedrockConverseTool):
                                     "Uses all numeric columns if not specified."
                                 ),
                             },
+                            "method": {
+                                "type": "string",
+                                "enum": list(METHODS),
+                                "description": (
+                                    "Optional. 'pearson' (linear, default) or "
+                                    "'spearman' (rank-based, robust to outliers and "
+                                    "monotonic non-linear relationships)."
+                                ),
+                            },
                         },
-                        "required": ["data"],
+                        "required": [],
                     }
                 },
             }
@@ -50,31 +69,39 @@ class EDACorrelationBedrockConverseTool(AbstractBedrockConverseTool):
         return (
             "eda_correlation : finds correlations between numeric columns. "
             "Returns notable correlations ranked by strength. "
-            "Pass data array from another tool result."
+            "Pass data_ref from another tool result."
         )
 
     def invoke(self, params, tool_args: dict = None) -> dict:
         args    = tool_args or {}
         data    = args.get("data", [])
         columns = args.get("columns", [])
+        method  = args.get("method") or PEARSON
 
         if not data:
             return {
                 "error": (
                     "No data provided. "
-                    "Pass data array from another tool result. "
-                    "Example: call sales_data first then pass its data array here."
+                    "Pass data_ref (or the data array) from another tool result. "
+                    "Example: call sales_data first then pass its data_ref here."
                 )
             }
 
+        if method not in METHODS:
+            return {"error": f"Unknown method '{method}'. Use one of: {', '.join(METHODS)}."}
+
         df = pd.DataFrame(data)
 
         if df.empty:
             return {"error": "Data is empty."}
 
-        logger.info("EDACorrelationTool: shape=%s", df.shape)
+        logger.info("EDACorrelationTool: shape=%s method=%s", df.shape, method)
 
         # ── Select columns ────────────────────────────────────────────────
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            return {"error": f"Unknown columns: {missing}. Available: {list(df.columns)}"}
+
         num_df = (
             df[columns].select_dtypes(include="number")
             if columns
@@ -90,40 +117,42 @@ class EDACorrelationBedrockConverseTool(AbstractBedrockConverseTool):
             }
 
         # ── Drop constant columns ─────────────────────────────────────────
-        num_df = num_df.loc[:, num_df.std() > 0]
+        X = num_df.to_numpy(dtype=float, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            keep = np.nan_to_num(np.nanstd(X, axis=0)) > 0
+        X    = X[:, keep]
+        cols = list(num_df.columns[keep])
 
-        if num_df.shape[1] < 2:
+        if len(cols) < 2:
             return {"error": "Need at least 2 non-constant numeric columns."}
 
         # ── Compute correlation ───────────────────────────────────────────
-        corr = num_df.corr()
-        cols = list(corr.columns)
-
-        notable = []
-        for i in range(len(cols)):
-            for j in range(i + 1, len(cols)):
-                val = corr.iloc[i, j]
-                if abs(val) >= 0.5:
-                    notable.append({
-                        "col1":        cols[i],
-                        "col2":        cols[j],
-                        "correlation": round(float(val), 4),
-                        "strength": (
-                            "strong positive"   if val >= 0.7  else
-                            "moderate positive" if val >= 0.5  else
-                            "strong negative"   if val <= -0.7 else
-                            "moderate negative"
-                        ),
-                    })
-
-        notable.sort(key=lambda x: abs(x["correlation"]), reverse=True)
+        corr          = correlation_matrix(X, method=method, sample_rows=SAMPLE_ROWS)
+        i, j, r, hits = top_pairs(corr, TOP_PAIRS, THRESHOLD)
+
+        strength = np.select(
+            [r >= 0.7, r >= 0.5, r <= -0.7],
+            ["strong positive", "moderate positive", "strong negative"],
+            "moderate negative",
+        )
+        notable = [
+            {
+                "col1":        cols[a],
+                "col2":        cols[b],
+                "correlation": round(float(v), 4),
+                "strength":    str(label),
+            }
+            for a, b, v, label in zip(i, j, r, strength)
+        ]
 
         return {
             "columns_analyzed":     cols,
-            "notable_correlations": notable[:15],
-            "total_notable":        len(notable),
+            "method":               method,
+            "rows_used":            min(len(X), SAMPLE_ROWS),
+            "notable_correlations": notable,
+            "total_notable":        hits,
             "summary": (
                 f"Analyzed {len(cols)} numeric columns. "
-                f"Found {len(notable)} notable correlations (|r| >= 0.5)."
+                f"Found {hits} notable correlations (|r| >= {THRESHOLD})."
             ),
-        }
\ No newline at end of file
+        }
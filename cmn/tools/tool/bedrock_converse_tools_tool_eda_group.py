@@ -1,23 +1,32 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
-from scipy import stats as scipy_stats
-from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.bedrock_converse_tools_tool import DATA_REF_PROPERTY, AbstractBedrockConverseTool
+from cmn.tools.tool.executor import THREAD
+from cmn.tools.tool.eda.group import STATS, GroupEngine, one_way_anova
 
 logger = logging.getLogger(__name__)
 
+MAX_GROUPS = 50
+
 
 class EDAGroupBedrockConverseTool(AbstractBedrockConverseTool):
 
-    def __init__(self):
+    execution = THREAD     # DuckDB releases the GIL while it aggregates
+
+    def __init__(self, engine: GroupEngine = None):
+        self._engine = engine
         name = "eda_group"
         definition = {
             "toolSpec": {
                 "name": name,
                 "description": (
                     "Compares a numeric metric across groups in a dataset. "
-                    "Returns mean, median, min, max per group "
+                    "Returns count, mean, median, quartiles, min, max per group "
                     "and ANOVA test to check if differences are significant. "
-                    "Pass data directly from another tool result such as sales_data."
+                    "Pass data_ref from another tool result such as sales_data."
                 ),
                 "inputSchema": {
                     "json": {
@@ -28,10 +37,11 @@ class EDAGroupBedrockConverseTool(AbstractBedrockConverseTool):
                                 "items": {"type": "object"},
                                 "description": (
                                     "Data to analyze. "
-                                    "Pass the data array from another tool result. "
-                                    "Example: pass data array from sales_data result."
+                                    "Only needed when there is no data_ref — "
+                                    "pass the data array from another tool result."
                                 ),
                             },
+                            "data_ref": DATA_REF_PROPERTY,
                             "group_by": {
                                 "type": "string",
                                 "description": (
@@ -46,8 +56,16 @@ class EDAGroupBedrockConverseTool(AbstractBedrockConverseTool):
                                     "Example: 'revenue', 'units_sold', 'returns'"
                                 ),
                             },
+                            "max_groups": {
+                                "type": "integer",
+                                "description": (
+                                    "Optional. Most groups to list (largest by count), "
+                                    f"default {MAX_GROUPS}. Best / worst and ANOVA "
+                                    "always use every group."
+                                ),
+                            },
                         },
-                        "required": ["data", "group_by", "target"],
+                        "required": ["group_by", "target"],
                     }
                 },
             }
@@ -58,7 +76,7 @@ class EDAGroupBedrockConverseTool(AbstractBedrockConverseTool):
         return (
             "eda_group : compares a numeric metric across groups. "
             "Returns stats per group and ANOVA significance test. "
-            "Pass data array from another tool result."
+            "Pass data_ref from another tool result."
         )
 
     def invoke(self, params, tool_args: dict = None) -> dict:
@@ -66,13 +84,14 @@ class EDAGroupBedrockConverseTool(AbstractBedrockConverseTool):
         data     = args.get("data", [])
         group_by = args.get("group_by", "")
         target   = args.get("target", "")
+        limit    = int(args.get("max_groups") or MAX_GROUPS)
 
         if not data:
             return {
                 "error": (
                     "No data provided. "
-                    "Pass data array from another tool result. "
-                    "Example: call sales_data first then pass its data array here."
+                    "Pass data_ref (or the data array) from another tool result. "
+                    "Example: call sales_data first then pass its data_ref here."
                 )
             }
 
@@ -101,56 +120,63 @@ class EDAGroupBedrockConverseTool(AbstractBedrockConverseTool):
                          f"Available: {list(df.columns)}"
             }
 
-        # ── Group stats ───────────────────────────────────────────────────
-        groups  = df.groupby(group_by)[target]
-        summary = (
-            groups
-            .agg(count="count", mean="mean", median="median",
-                 std="std", min="min", max="max")
-            .round(2)
-            .reset_index()
-            .to_dict(orient="records")
-        )
+        # ── Group stats (one DuckDB aggregate query) ──────────────────────
+        engine = self._engine or GroupEngine.default()
+        table  = engine.group_stats(df, group_by, target)
+        stats  = {
+            name: np.asarray(table[name].to_numpy(zero_copy_only=False), dtype=float)
+            for name in STATS
+        }
+
+        if not len(table) or not stats["count"].sum():
+            return {"error": f"target='{target}' has no numeric values."}
 
         # ── ANOVA ─────────────────────────────────────────────────────────
-        anova        = None
-        group_arrays = [
-            g.dropna().values
-            for _, g in groups
-            if len(g.dropna()) > 1
-        ]
-
-        if len(group_arrays) >= 2:
-            try:
-                f, p   = scipy_stats.f_oneway(*group_arrays)
-                anova  = {
-                    "f_statistic": round(float(f), 4),
-                    "p_value":     round(float(p), 6),
-                    "significant": bool(p < 0.05),
-                    "interpretation": (
-                        f"Significant difference between groups (p={p:.4f})"
-                        if p < 0.05
-                        else f"No significant difference between groups (p={p:.4f})"
-                    ),
-                }
-            except Exception as e:
-                logger.warning("ANOVA failed: %s", e)
+        anova  = None
+        result = one_way_anova(stats["count"], stats["mean"], stats["std"])
+        if result is not None:
+            f, p  = result
+            anova = {
+                "f_statistic": round(f, 4),
+                "p_value":     round(p, 6),
+                "significant": bool(p < 0.05),
+                "interpretation": (
+                    f"Significant difference between groups (p={p:.4f})"
+                    if p < 0.05
+                    else f"No significant difference between groups (p={p:.4f})"
+                ),
+            }
 
         # ── Best / worst ──────────────────────────────────────────────────
-        means      = {r[group_by]: r["mean"] for r in summary}
-        best_group = max(means, key=means.get)
-        worst_group = min(means, key=means.get)
+        keys  = table["group_key"].to_pylist()
+        means = np.round(stats["mean"], 2)
+        best  = int(np.nanargmax(means))
+        worst = int(np.nanargmin(means))
+
+        # ── Listed groups: the largest by count, in key order ─────────────
+        listed = table
+        if len(table) > limit:
+            listed = table.take(np.sort(np.argsort(-stats["count"], kind="stable")[:limit]))
+        summary = pa.table({
+            group_by: listed["group_key"],
+            **{
+                name: listed[name] if name == "count" else pc.round(listed[name], 2)
+                for name in STATS
+            },
+        }).to_pylist()
 
         return {
-            "group_by":    group_by,
-            "target":      target,
-            "groups":      summary,
-            "anova":       anova,
-            "best_group":  best_group,
-            "worst_group": worst_group,
+            "group_by":     group_by,
+            "target":       target,
+            "groups":       summary,
+            "group_count":  len(keys),
+            "anova":        anova,
+            "best_group":   keys[best],
+            "worst_group":  keys[worst],
             "summary": (
-                f"Compared '{target}' across {len(summary)} groups of '{group_by}'. "
-                f"Best: {best_group} ({round(means[best_group], 2)}), "
-                f"Worst: {worst_group} ({round(means[worst_group], 2)})."
+                f"Compared '{target}' across {len(keys)} groups of '{group_by}'. "
+                f"Best: {keys[best]} ({means[best]}), "
+                f"Worst: {keys[worst]} ({means[worst]})."
+                + (f" Listing the {len(summary)} largest groups." if len(summary) < len(keys) else "")
             ),
-        }
\ No newline at end of file
+        }
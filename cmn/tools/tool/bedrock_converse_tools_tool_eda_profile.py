@@ -1,12 +1,18 @@
-import pandas as pd
 import logging
-from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.bedrock_converse_tools_tool import DATA_REF_PROPERTY, AbstractBedrockConverseTool
+from cmn.tools.tool.executor import PROCESS
+from cmn.tools.tool.eda.profile import StreamingProfiler
 
 logger = logging.getLogger(__name__)
 
+# Inputs up to this many rows are profiled exactly unless "exact" is given
+EXACT_ROW_LIMIT = 100_000
+
 
 class EDAProfileBedrockConverseTool(AbstractBedrockConverseTool):
 
+    execution = PROCESS     # pandas over the full inline dataset
+
     def __init__(self):
         name = "eda_profile"
         definition = {
@@ -16,7 +22,7 @@ class EDAProfileBedrockConverseTool(AbstractBedrockConverseTool):
                     "Profiles a dataset — shape, column types, null counts, "
                     "basic statistics for numeric columns, "
                     "and top values for categorical columns. "
-                    "Pass data directly from another tool result such as sales_data."
+                    "Pass data_ref from another tool result such as sales_data."
                 ),
                 "inputSchema": {
                     "json": {
@@ -27,12 +33,22 @@ class EDAProfileBedrockConverseTool(AbstractBedrockConverseTool):
                                 "items": {"type": "object"},
                                 "description": (
                                     "Data to profile. "
-                                    "Pass the data array from another tool result. "
-                                    "Example: pass data array from sales_data result."
+                                    "Only needed when there is no data_ref — "
+                                    "pass the data array from another tool result."
+                                ),
+                            },
+                            "data_ref": DATA_REF_PROPERTY,
+                            "exact": {
+                                "type": "boolean",
+                                "description": (
+                                    "Optional. true = exact statistics, "
+                                    "false = bounded-memory sketches (approximate median, "
+                                    "distinct counts, top values and duplicates). "
+                                    f"Default: exact up to {EXACT_ROW_LIMIT:,} rows."
                                 ),
                             },
                         },
-                        "required": ["data"],
+                        "required": [],
                     }
                 },
             }
@@ -43,7 +59,7 @@ class EDAProfileBedrockConverseTool(AbstractBedrockConverseTool):
         return (
             "eda_profile : profiles a dataset — shape, nulls, "
             "basic stats for numeric columns, top values for categorical. "
-            "Pass data array from another tool result."
+            "Pass data_ref from another tool result."
         )
 
     def invoke(self, params, tool_args: dict = None) -> dict:
@@ -54,55 +70,21 @@ class EDAProfileBedrockConverseTool(AbstractBedrockConverseTool):
             return {
                 "error": (
                     "No data provided. "
-                    "Pass data array from another tool result. "
-                    "Example: call sales_data first then pass its data array here."
+                    "Pass data_ref (or the data array) from another tool result. "
+                    "Example: call sales_data first then pass its data_ref here."
                 )
             }
 
-        df = pd.DataFrame(data)
+        exact = args.get("exact")
+        if exact is None:
+            exact = len(data) <= EXACT_ROW_LIMIT
 
-        if df.empty:
-            return {"error": "Data is empty."}
-
-        logger.info("EDAProfileTool: shape=%s columns=%s", df.shape, list(df.columns))
+        logger.info("EDAProfileTool: rows=%d exact=%s", len(data), exact)
 
-        num_df = df.select_dtypes(include="number")
-        cat_df = df.select_dtypes(include=["object", "category"])
+        # One pass over the rows in chunks; never builds the full DataFrame
+        profile = StreamingProfiler.profile(data, exact=bool(exact))
 
-        numeric = []
-        for col in num_df.columns:
-            s = num_df[col].dropna()
-            if len(s) == 0:
-                continue
-            numeric.append({
-                "column": col,
-                "count":  int(s.count()),
-                "nulls":  int(df[col].isna().sum()),
-                "mean":   round(float(s.mean()), 2),
-                "median": round(float(s.median()), 2),
-                "std":    round(float(s.std()), 2),
-                "min":    round(float(s.min()), 2),
-                "max":    round(float(s.max()), 2),
-            })
-
-        categorical = []
-        for col in cat_df.columns:
-            s  = cat_df[col].dropna()
-            vc = s.value_counts()
-            categorical.append({
-                "column":    col,
-                "unique":    int(s.nunique()),
-                "nulls":     int(df[col].isna().sum()),
-                "top_value": str(vc.index[0]) if len(vc) > 0 else "N/A",
-                "top_3":     {str(k): int(v) for k, v in vc.head(3).items()},
-            })
+        if not profile["rows"]:
+            return {"error": "Data is empty."}
 
-        return {
-            "rows":           len(df),
-            "columns":        len(df.columns),
-            "column_names":   list(df.columns),
-            "total_nulls":    int(df.isna().sum().sum()),
-            "duplicate_rows": int(df.duplicated().sum()),
-            "numeric":        numeric,
-            "categorical":    categorical,
-        }
\ No newline at end of file
+        return profile
@@ -27,6 +27,8 @@ class HolidayBedrockConverseTool(AbstractBedrockConverseTool):
     including moveable feasts and substitution holidays.
     """
 
+    cache_ttl_s = 86400.0   # deterministic for a given date + country
+
     def __init__(self):
         name = "holiday_checker"
         definition = {
@@ -184,6 +184,7 @@ class PdfBrandGuidelines:
 import re
 import tempfile
 from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.executor import PROCESS
 from cmn.tools.tool.pdf import PdfReportBuilder
 
 
@@ -204,6 +205,8 @@ def _safe_filename(title: str) -> str:
 
 class PdfBedrockConverseTool(AbstractBedrockConverseTool):
 
+    execution = PROCESS     # reportlab rendering holds the GIL
+
     def __init__(self, config_dir: str = _CONFIG_DIR):
         name = "create_pdf"
         definition = {
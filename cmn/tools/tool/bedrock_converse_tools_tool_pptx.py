@@ -13,6 +13,7 @@ from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches, Pt, Emu
 
 from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.executor import PROCESS
 from cmn.tools.tool.pptx import PptxChartBuilder
 
 logger = logging.getLogger(__name__)
@@ -194,6 +195,8 @@ def _safe_filename(title: str) -> str:
 
 class PptxBedrockConverseTool(AbstractBedrockConverseTool):
 
+    execution = PROCESS     # python-pptx + chart rendering holds the GIL
+
     def __init__(self, config_dir: str = _CONFIG_DIR):
         name = "create_pptx"
         definition = {
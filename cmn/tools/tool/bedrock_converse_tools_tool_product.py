@@ -1,14 +1,18 @@
-import pandas as pd
+import functools
 import duckdb
+import pandas as pd
 import logging
 from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.sales.store import SalesStore, default_store
 
 logger = logging.getLogger(__name__)
 
 
 # ── 1. Mock Data ──────────────────────────────────────────────────────────────
 
+@functools.cache
 def _build_mock_products() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """(products, product_colors), built once on first call — treat as read-only."""
 
     products = pd.DataFrame({
         "product_id":   [1, 2, 3, 4, 5, 6, 7, 8],
@@ -41,9 +45,6 @@ def _build_mock_products() -> tuple[pd.DataFrame, pd.DataFrame]:
     return products, product_colors
 
 
-_PRODUCTS_DF, _PRODUCT_COLORS_DF = _build_mock_products()
-
-
 # ── 2. Schema Description (fed to LLM so it can write SQL) ───────────────────
 
 SCHEMA_DESCRIPTION = """
@@ -82,10 +83,13 @@ class ProductBedrockConverseTool(AbstractBedrockConverseTool):
     """
     True NL-to-SQL tool.
     The LLM writes the actual SQL query — not just parameters.
-    DuckDB executes it against in-memory DataFrames.
+    DuckDB executes it against the products / product_colors tables of
+    the shared SalesStore (mock frames or Parquet), in the store's
+    sandbox without access to sales data or files (SalesStore.query).
     """
 
-    def __init__(self):
+    def __init__(self, store: SalesStore = None):
+        self.store = store
         name = "product_query"
         definition = {
             "toolSpec": {
@@ -138,23 +142,29 @@ class ProductBedrockConverseTool(AbstractBedrockConverseTool):
         if not sql:
             return {"error": "No SQL query provided"}
 
-        # Safety guard — only allow SELECT
-        if not sql.upper().startswith("SELECT"):
+        # Safety guard — exactly one SELECT statement (parsed, so ';' inside
+        # string literals is fine)
+        try:
+            statements = duckdb.extract_statements(sql)
+        except duckdb.Error as e:
+            return {"error": str(e), "sql_used": sql,
+                    "hint": "Check the SQL syntax"}
+        if len(statements) != 1:
+            return {"error": "Only a single SELECT statement is allowed"}
+        if statements[0].type != duckdb.StatementType.SELECT:
             return {"error": "Only SELECT queries are allowed"}
+        sql = statements[0].query.strip().rstrip(";").strip()
 
         try:
-            con = duckdb.connect()
-            con.register("products",       _PRODUCTS_DF)
-            con.register("product_colors", _PRODUCT_COLORS_DF)
-
-            df = con.execute(sql).df()
+            store   = self.store or default_store()
+            records = store.query(sql)
 
             return {
                 "question":  question,
                 "sql_used":  sql,
-                "row_count": len(df),
-                "columns":   list(df.columns),
-                "data":      df.to_dict(orient="records"),
+                "row_count": len(records),
+                "columns":   list(records[0].keys()) if records else [],
+                "data":      records,
             }
 
         except Exception as e:
@@ -16,17 +16,24 @@ Data
 ----
 Two years of monthly sales (2023 & 2024) simulating a retail business
 with seasonal patterns and a mid-2024 revenue dip.
-Built once at import time via _build_mock_sales() and reused as a
-module-level singleton (_SALES_DF).
+Built on first use by _build_mock_sales() (cached), not at import time,
+so registering the tool stays cheap.
 
-Dependencies: pandas, duckdb
+Queries run through a SalesStore (cmn/tools/tool/sales/store.py): the
+mock rows in a native DuckDB table by default, or Hive-partitioned Parquet
+when SALES_PARQUET_ROOT is set. Both query types are answered from the
+store's pre-aggregated rollup cube (year × month × region × category with
+subtotals), so their cost does not grow with the number of raw rows.
+
+Dependencies: pandas, duckdb, pyarrow
 """
 
+import functools
 import logging
 import pandas as pd
-import duckdb
 
 from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.sales.store import SalesStore, default_store
 
 logger = logging.getLogger(__name__)
 
@@ -45,34 +52,32 @@ def _safe_int(value) -> int:
         return 0
 
 
-def _run_sql(sql: str, params: list = None) -> pd.DataFrame:
-    """Execute parameterised SQL against the in-memory sales DataFrame."""
-    con = duckdb.connect()
-    con.register("sales", _SALES_DF)
-    return con.execute(sql, params or []).df()
-
-
-def _df_to_tool_result(df: pd.DataFrame) -> dict:
+def _records_to_tool_result(records: list[dict]) -> dict:
     """
-    Convert a DataFrame to a JSON-serialisable dict the LLM can reason about.
+    Wrap query records in a JSON-serialisable dict the LLM can reason about.
     Returns row count, column names, and row records.
     """
     return {
-        "row_count": len(df),
-        "columns":   list(df.columns),
-        "data":      df.to_dict(orient="records"),
+        "row_count": len(records),
+        "columns":   list(records[0].keys()) if records else [],
+        "data":      records,
     }
 
 
+def _total(records: list[dict], column: str) -> int:
+    return _safe_int(sum(r[column] or 0 for r in records))
+
+
 ################################################################################
 # SECTION: Mock Data
 ################################################################################
 
+@functools.cache
 def _build_mock_sales() -> pd.DataFrame:
     """
     Generate 2 years of monthly sales data (2023 & 2024).
     Simulates a retail business with seasonal patterns and a mid-2024 dip.
-    Built once at module import — do not call directly.
+    Built once, on first call (InMemorySalesStore) — treat as read-only.
     """
     records = [
         # year  month  revenue     units  returns  cogs       region      category
@@ -144,10 +149,6 @@ def _build_mock_sales() -> pd.DataFrame:
     return df
 
 
-# ── Module-level singleton — built once at import time ────────────────────────
-_SALES_DF = _build_mock_sales()
-
-
 ################################################################################
 # SECTION: Tool Class
 ################################################################################
@@ -157,9 +158,16 @@ class SalesBedrockConverseTool(AbstractBedrockConverseTool):
     Provides two query modes:
       get_monthly_sales   → all months for a given year
       get_sales_by_month  → single month detail by region & category
+
+    Results are registered in the ToolRegistry result store, so other
+    tools can take them by data_ref.
     """
 
-    def __init__(self):
+    produces_dataset = True
+    cache_ttl_s      = 300.0
+
+    def __init__(self, store: SalesStore = None):
+        self.store = store
         name = "sales_data"
         definition = {
             "toolSpec": {
@@ -223,7 +231,8 @@ class SalesBedrockConverseTool(AbstractBedrockConverseTool):
     def summary(self) -> str:
         return (
             "sales_data : fetches sales figures, monthly data and yearly summaries. "
-            "For year-over-year comparisons call once per year."
+            "For year-over-year comparisons call once per year. "
+            "Results include a data_ref to pass to analysis and chart tools."
         )
 
     # ── Dispatch ──────────────────────────────────────────────────────────────
@@ -251,6 +260,9 @@ class SalesBedrockConverseTool(AbstractBedrockConverseTool):
 
         return {"error": f"Unknown query_type: {query_type}"}
 
+    def _store(self) -> SalesStore:
+        return self.store or default_store()
+
     # ── Query Implementations ─────────────────────────────────────────────────
 
     def _get_monthly_sales(
@@ -261,59 +273,31 @@ class SalesBedrockConverseTool(AbstractBedrockConverseTool):
     ) -> dict:
         """All 12 months for a year, aggregated across region × category."""
 
-        filters = ["year = ?"]
-        params  = [year]
-
-        if category != "all":
-            filters.append("category = ?")
-            params.append(category)
-        if region != "all":
-            filters.append("region = ?")
-            params.append(region)
-
-        where = " AND ".join(filters)
-
-        sql = f"""
-            SELECT
-                month,
-                month_name,
-                SUM(revenue)                 AS revenue,
-                SUM(units_sold)              AS units_sold,
-                SUM(returns)                 AS returns,
-                SUM(gross_profit)            AS gross_profit,
-                ROUND(AVG(profit_margin), 2) AS profit_margin_pct,
-                ROUND(SUM(net_revenue),   2) AS net_revenue
-            FROM sales
-            WHERE {where}
-            GROUP BY month, month_name
-            ORDER BY month
-        """
-
-        df = _run_sql(sql, params)
-
-        if df.empty:
+        records = self._store().monthly(year, category, region)
+
+        if not records:
             return {
                 "error":     f"No data for year={year} category={category} region={region}",
                 "row_count": 0,
                 "data":      [],
             }
 
-        df = df.fillna(0)
-        df["ytd_revenue"] = df["revenue"].cumsum()
+        best  = max(records, key=lambda r: r["revenue"])
+        worst = min(records, key=lambda r: r["revenue"])
 
-        result = _df_to_tool_result(df)
+        result = _records_to_tool_result(records)
         result.update({
             "year":     year,
             "category": category,
             "region":   region,
             "summary": {
-                "total_revenue":      _safe_int(df["revenue"].sum()),
-                "total_units":        _safe_int(df["units_sold"].sum()),
-                "total_returns":      _safe_int(df["returns"].sum()),
-                "avg_monthly_rev":    _safe_int(df["revenue"].mean()),
-                "best_month":         df.loc[df["revenue"].idxmax(), "month_name"],
-                "worst_month":        df.loc[df["revenue"].idxmin(), "month_name"],
-                "total_gross_profit": _safe_int(df["gross_profit"].sum()),
+                "total_revenue":      _total(records, "revenue"),
+                "total_units":        _total(records, "units_sold"),
+                "total_returns":      _total(records, "returns"),
+                "avg_monthly_rev":    _safe_int(_total(records, "revenue") / len(records)),
+                "best_month":         best["month_name"],
+                "worst_month":        worst["month_name"],
+                "total_gross_profit": _total(records, "gross_profit"),
             },
         })
         return result
@@ -327,39 +311,9 @@ class SalesBedrockConverseTool(AbstractBedrockConverseTool):
     ) -> dict:
         """Single month broken down by region × category."""
 
-        filters = ["year = ?", "month = ?"]
-        params  = [year, month]
-
-        if category != "all":
-            filters.append("category = ?")
-            params.append(category)
-        if region != "all":
-            filters.append("region = ?")
-            params.append(region)
-
-        where = " AND ".join(filters)
-
-        sql = f"""
-            SELECT
-                year,
-                month,
-                month_name,
-                region,
-                category,
-                revenue,
-                units_sold,
-                returns,
-                gross_profit,
-                profit_margin,
-                ROUND(net_revenue, 2) AS net_revenue
-            FROM sales
-            WHERE {where}
-            ORDER BY region, category
-        """
-
-        df = _run_sql(sql, params)
-
-        if df.empty:
+        records = self._store().by_month(year, month, category, region)
+
+        if not records:
             return {
                 "error":     f"No data for year={year} month={month} "
                              f"category={category} region={region}",
@@ -367,15 +321,15 @@ class SalesBedrockConverseTool(AbstractBedrockConverseTool):
                 "data":      [],
             }
 
-        result = _df_to_tool_result(df)
+        result = _records_to_tool_result(records)
         result.update({
             "year":  year,
             "month": month,
             "summary": {
-                "total_revenue":      _safe_int(df["revenue"].sum()),
-                "total_units":        _safe_int(df["units_sold"].sum()),
-                "total_returns":      _safe_int(df["returns"].sum()),
-                "total_gross_profit": _safe_int(df["gross_profit"].sum()),
+                "total_revenue":      _total(records, "revenue"),
+                "total_units":        _total(records, "units_sold"),
+                "total_returns":      _total(records, "returns"),
+                "total_gross_profit": _total(records, "gross_profit"),
             },
         })
-        return result
\ No newline at end of file
+        return result
@@ -3,11 +3,15 @@ cmn/tools/tool/bedrock_converse_tools_sales_anomaly.py
 =======================================================
 Tool: sales_anomaly_detector
 
-Detects anomalies in sales data using the Z-score method.
-Flags months where a metric deviates beyond a configurable threshold.
+Detects anomalies in sales data — global z-score, robust (median / MAD)
+or rolling-window scores. Flags months where a metric deviates beyond a
+configurable threshold; can score several metrics and every region /
+category series in one call.
 
-Data source: _SALES_DF imported from bedrock_converse_tools_sales
-Pure pandas/numpy — no streamlit, no external API calls.
+Data source: the shared SalesStore (cmn/tools/tool/sales/store.py) — the
+monthly series come pre-aggregated from DuckDB. Scoring is vectorized over
+the whole month × series matrix (cmn/tools/tool/sales/anomaly.py).
+No streamlit, no external API calls.
 
 invoke() returns a plain dict — the UI/renderer layer handles display.
 """
@@ -15,10 +19,11 @@ invoke() returns a plain dict — the UI/renderer layer handles display.
 import logging
 
 import numpy as np
-import pandas as pd
 
 from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
-from cmn.tools.tool.bedrock_converse_tools_tool_sales import _SALES_DF
+from cmn.tools.tool.executor import THREAD
+from cmn.tools.tool.sales import anomaly
+from cmn.tools.tool.sales.store import METRICS, SalesStore, default_store
 
 logger = logging.getLogger(__name__)
 
@@ -27,26 +32,11 @@ logger = logging.getLogger(__name__)
 # SECTION: Helpers
 ################################################################################
 
-def _severity(zscore: float, threshold: float) -> str:
-    """
-    Classify severity based on how far beyond the threshold the z-score is.
+GROUP_COLUMNS = ["region", "category"]
 
-    Parameters
-    ----------
-    zscore    : the z-score of the data point
-    threshold : the configured anomaly threshold
 
-    Returns
-    -------
-    "mild" | "moderate" | "severe"
-    """
-    distance = abs(zscore) - threshold
-    if distance < 0.5:
-        return "mild"
-    elif distance < 1.0:
-        return "moderate"
-    else:
-        return "severe"
+def _series_label(metric: str, region: str, category: str) -> str:
+    return f"{metric} · {region} / {category}"
 
 
 ################################################################################
@@ -59,19 +49,24 @@ class SalesAnomalyBedrockConverseTool(AbstractBedrockConverseTool):
 
     Method
     ------
-    Z-score: flags months where abs(zscore) >= threshold.
-    Default threshold = 1.5 (moderate sensitivity).
+    zscore (default), robust or rolling score; flags months where
+    abs(score) >= threshold. Default threshold = 1.5 (moderate sensitivity).
 
     Flow
     ----
-    1. Filter _SALES_DF by year, region, category
-    2. Aggregate metric by month
-    3. Compute z-scores and pct_vs_mean
-    4. Split into anomalies / normal lists
-    5. Return payload — renderer layer handles display
+    1. Fetch monthly sums of all metrics from the store, one series per
+       region / category value in group_by
+    2. Build a month × (series × metric) matrix and score it in one pass
+    3. Pick the strongest flagged cells with argpartition (top_k)
+    4. Return payload — renderer layer handles display. A single series
+       keeps the classic shape (anomalies + normal months); several
+       series return the top_k anomalies across all of them.
     """
 
-    def __init__(self):
+    execution = THREAD     # store query + NumPy scoring
+
+    def __init__(self, store: SalesStore = None):
+        self.store = store
         name = "sales_anomaly_detector"
         definition = {
             "toolSpec": {
@@ -79,7 +74,9 @@ class SalesAnomalyBedrockConverseTool(AbstractBedrockConverseTool):
                 "description": (
                     "Detects anomalies in sales metrics for a given year. "
                     "Flags months where performance is unusually high or low "
-                    "compared to the yearly average. "
+                    "compared to the yearly average (zscore), the median (robust) "
+                    "or the preceding months (rolling). Can check several metrics "
+                    "and every region / category at once. "
                     "Use this to identify root causes of underperformance."
                 ),
                 "inputSchema": {
@@ -92,15 +89,39 @@ class SalesAnomalyBedrockConverseTool(AbstractBedrockConverseTool):
                             },
                             "metric": {
                                 "type": "string",
-                                "enum": [
-                                    "revenue",
-                                    "units_sold",
-                                    "returns",
-                                    "gross_profit",
-                                    "net_revenue",
-                                ],
+                                "enum": list(METRICS),
                                 "description": "The metric to check for anomalies.",
                             },
+                            "metrics": {
+                                "type":        "array",
+                                "items":       {"type": "string", "enum": list(METRICS)},
+                                "description": "Additional metrics to check in the same call.",
+                            },
+                            "method": {
+                                "type":        "string",
+                                "enum":        list(anomaly.METHODS),
+                                "description": (
+                                    "zscore (default): vs yearly mean. robust: vs median, "
+                                    "not skewed by extreme months. rolling: vs the previous "
+                                    "`window` months."
+                                ),
+                            },
+                            "window": {
+                                "type":        "integer",
+                                "description": "Months in the rolling window. Default 3.",
+                            },
+                            "group_by": {
+                                "type":        "array",
+                                "items":       {"type": "string", "enum": GROUP_COLUMNS},
+                                "description": "Score every region and/or category series separately.",
+                            },
+                            "top_k": {
+                                "type":        "integer",
+                                "description": (
+                                    "Max anomalies returned when several series are "
+                                    "checked. Default 10."
+                                ),
+                            },
                             "threshold": {
                                 "type":        "number",
                                 "description": (
@@ -137,26 +158,39 @@ class SalesAnomalyBedrockConverseTool(AbstractBedrockConverseTool):
         args      = tool_args or {}
         year      = args.get("year")
         metric    = args.get("metric",    "revenue")
+        extra     = args.get("metrics")   or []
+        method    = args.get("method")    or anomaly.ZSCORE
+        window    = int(args.get("window") or 3)
+        group_by  = args.get("group_by")  or []
+        top_k     = int(args.get("top_k") or 10)
         threshold = args.get("threshold", 1.5)
         region    = args.get("region",    "all")
         category  = args.get("category",  "all")
 
         logger.info(
-            "SalesAnomalyTool — year=%s metric=%s threshold=%s",
-            year, metric, threshold,
+            "SalesAnomalyTool — year=%s metric=%s extra=%s method=%s group_by=%s threshold=%s",
+            year, metric, extra, method, group_by, threshold,
         )
 
-        return self._detect_anomalies(year, metric, threshold, region, category)
+        metrics = [metric] + [m for m in extra if m != metric]
+        return self._detect_anomalies(
+            year, metrics, threshold, region, category,
+            method=method, window=window, group_by=group_by, top_k=top_k,
+        )
 
     # ── Private ───────────────────────────────────────────────────────────────
 
     def _detect_anomalies(
         self,
         year:      int,
-        metric:    str,
+        metrics:   list,
         threshold: float,
         region:    str,
         category:  str,
+        method:    str  = anomaly.ZSCORE,
+        window:    int  = 3,
+        group_by:  list = None,
+        top_k:     int  = 10,
     ) -> dict:
         """
         Core anomaly detection logic.
@@ -164,100 +198,109 @@ class SalesAnomalyBedrockConverseTool(AbstractBedrockConverseTool):
         Parameters
         ----------
         year      : year to filter on
-        metric    : column to analyse
-        threshold : z-score cutoff for flagging
+        metrics   : columns to analyse; metrics[0] is the primary metric
+        threshold : score cutoff for flagging
         region    : region filter ("all" = no filter)
         category  : category filter ("all" = no filter)
+        method    : zscore | robust | rolling
+        window    : rolling window in months
+        group_by  : subset of region / category to split series by
+        top_k     : max anomalies returned for multi-series requests
 
         Returns
         -------
-        dict with keys: year, metric, threshold, region, category,
-                        mean, std, anomaly_count, anomalies, normal, summary
+        dict with keys: year, metric, threshold, region, category, method,
+                        anomaly_count, anomalies, summary, and
+                        - one series     : mean, std, normal
+                        - several series : metrics, group_by, series_count,
+                                           flagged_cells
         """
+        group_by = [g for g in GROUP_COLUMNS if g in (group_by or [])]
 
-        # ── Filter ────────────────────────────────────────────────────────────
-        df = _SALES_DF[_SALES_DF["year"] == year].copy()
+        for metric in metrics:
+            if metric not in METRICS:
+                return {"error": f"Unknown metric: {metric}", "anomalies": []}
+        if method not in anomaly.METHODS:
+            return {"error": f"Unknown method: {method}", "anomalies": []}
 
-        if df.empty:
-            return {
-                "error":     f"No data found for year={year}",
-                "anomalies": [],
-            }
-
-        if region != "all":
-            df = df[df["region"] == region]
-        if category != "all":
-            df = df[df["category"] == category]
+        # ── Month × (series × metric) matrix ──────────────────────────────────
+        store = self.store or default_store()
+        table = store.monthly_series(year, region, category, tuple(group_by))
 
-        if df.empty:
+        if table.num_rows == 0:
             return {
-                "error":     f"No data after filters region={region} category={category}",
+                "error":     f"No data found for year={year} region={region} category={category}",
                 "anomalies": [],
             }
 
-        # ── Aggregate by month ────────────────────────────────────────────────
-        monthly = (
-            df.groupby(["month", "month_name"])[metric]
-            .sum()
-            .reset_index()
-            .sort_values("month")
-            .fillna(0)
-        )
-
-        # ── Z-score ───────────────────────────────────────────────────────────
-        mean = monthly[metric].mean()
-        std  = monthly[metric].std()
-
-        if std == 0:
+        months, m_idx  = np.unique(table.column("month").to_numpy(), return_inverse=True)
+        names          = np.empty(len(months), dtype=object)
+        names[m_idx]   = table.column("month_name").to_numpy(zero_copy_only=False)
+        regions        = table.column("region").to_numpy(zero_copy_only=False).astype(str)
+        categories     = table.column("category").to_numpy(zero_copy_only=False).astype(str)
+        keys, g_idx    = np.unique(np.char.add(np.char.add(regions, "\x1f"), categories),
+                                   return_inverse=True)
+
+        n, g, k = len(months), len(keys), len(metrics)
+        cube    = np.full((n, g, k), np.nan)
+        cube[m_idx, g_idx] = np.column_stack(
+            [table.column(m).to_numpy(zero_copy_only=False) for m in metrics])
+        Y = cube.reshape(n, g * k)                  # column = group * k + metric
+
+        # ── Score ─────────────────────────────────────────────────────────────
+        scores        = np.round(anomaly.score(Y, method, window), 2)
+        center, _     = anomaly.baseline(Y, method, window)
+        center        = np.broadcast_to(center, Y.shape)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pct = np.round((Y - center) / center * 100, 1)
+
+        single = g * k == 1
+        if single and np.isnan(scores).all():
             return {
-                "error":     "No variance in data — cannot compute anomalies",
+                "error":     "No variance in data — cannot compute anomalies"
+                             if method != anomaly.ROLLING else
+                             f"Need more than {window} months for a rolling window of {window}",
                 "anomalies": [],
             }
 
-        monthly["zscore"]      = ((monthly[metric] - mean) / std).round(2)
-        monthly["pct_vs_mean"] = (((monthly[metric] - mean) / mean) * 100).round(1)
-
-        # ── Classify ──────────────────────────────────────────────────────────
-        anomalies = []
-        normal    = []
-
-        for _, row in monthly.iterrows():
-            entry = {
-                "month":       int(row["month"]),
-                "month_name":  row["month_name"],
-                "value":       round(float(row[metric]), 2),
-                "zscore":      float(row["zscore"]),
-                "pct_vs_mean": float(row["pct_vs_mean"]),
+        rows, cols = anomaly.top_k(scores, n if single else top_k, threshold)
+        levels     = anomaly.severity(scores[rows, cols], threshold)
+
+        def entry(row: int, col: int) -> dict:
+            z = scores[row, col]
+            item = {
+                "month":       int(months[row]),
+                "month_name":  names[row],
+                "value":       round(float(Y[row, col]), 2),
+                "zscore":      None if np.isnan(z) else float(z),
+                "pct_vs_mean": None if np.isnan(pct[row, col]) else float(pct[row, col]),
             }
+            if not single:
+                region_, category_ = keys[col // k].split("\x1f")
+                item.update({
+                    "metric":   metrics[col % k],
+                    "region":   region_,
+                    "category": category_,
+                    "series":   _series_label(metrics[col % k], region_, category_),
+                })
+            return item
 
-            if row["zscore"] <= -threshold:
-                entry["flag"]     = "below_normal"
-                entry["severity"] = _severity(row["zscore"], threshold)
-                anomalies.append(entry)
-
-            elif row["zscore"] >= threshold:
-                entry["flag"]     = "above_normal"
-                entry["severity"] = _severity(row["zscore"], threshold)
-                anomalies.append(entry)
-
-            else:
-                entry["flag"] = "normal"
-                normal.append(entry)
-
-        # ── Sort worst first ──────────────────────────────────────────────────
-        anomalies.sort(key=lambda x: abs(x["zscore"]), reverse=True)
+        anomalies = []
+        for row, col, level in zip(rows, cols, levels):
+            item = entry(row, col)
+            item["flag"]     = "below_normal" if scores[row, col] < 0 else "above_normal"
+            item["severity"] = str(level)
+            anomalies.append(item)
 
-        return {
+        result = {
             "year":          year,
-            "metric":        metric,
+            "metric":        metrics[0],
             "threshold":     threshold,
             "region":        region,
             "category":      category,
-            "mean":          round(float(mean), 2),
-            "std":           round(float(std),  2),
+            "method":        method,
             "anomaly_count": len(anomalies),
             "anomalies":     anomalies,
-            "normal":        normal,
             "summary": {
                 "worst_month": anomalies[0]["month_name"] if anomalies else "none",
                 "best_month":  next(
@@ -266,4 +309,26 @@ class SalesAnomalyBedrockConverseTool(AbstractBedrockConverseTool):
                 ),
                 "total_anomalies": len(anomalies),
             },
-        }
\ No newline at end of file
+        }
+
+        if single:
+            # Plain yearly stats of the series (renderer / LLM context)
+            mean, std = anomaly.baseline(Y, anomaly.ZSCORE)
+            flagged   = set(rows.tolist())
+            result.update({
+                "mean":   round(float(mean[0]), 2),
+                "std":    None if np.isnan(std[0]) else round(float(std[0]), 2),
+                "normal": [
+                    {**entry(row, 0),
+                     "flag": "not_scored" if np.isnan(scores[row, 0]) else "normal"}
+                    for row in range(n) if row not in flagged
+                ],
+            })
+        else:
+            result.update({
+                "metrics":       metrics,
+                "group_by":      group_by,
+                "series_count":  g * k,
+                "flagged_cells": int(np.count_nonzero(np.abs(np.nan_to_num(scores)) >= threshold)),
+            })
+        return result
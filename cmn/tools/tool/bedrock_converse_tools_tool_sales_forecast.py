@@ -3,22 +3,36 @@ cmn/tools/tool/bedrock_converse_tools_sales_forecast.py
 ========================================================
 Tool: sales_forecast
 
-Forecasts future monthly sales using linear regression.
+Forecasts future monthly sales — linear trend, seasonal-naive or
+Holt-Winters — for one or more metrics, optionally per region / category.
 Receives historical data directly from the LLM — no DB access.
 LLM is responsible for fetching data first via sales_data tool,
-then passing the result array here.
+then passing the result array here (one data_ref per year via data_refs
+for multi-year history).
+
+Rows are indexed by year × month when they carry a 'year' column, so
+several years form one consecutive series (what Holt-Winters needs)
+instead of being summed per calendar month.
+
+All requested series are fitted together by the vectorized NumPy engine
+in cmn/tools/tool/sales/forecast.py, which also caches fitted models by a
+fingerprint of the data.
 
 invoke() returns a plain dict — the UI/renderer layer handles display.
 No streamlit imports.
 """
 
 import logging
+import math
+from typing import Optional
 
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
 
-from cmn.tools.tool.bedrock_converse_tools_tool import AbstractBedrockConverseTool
+from cmn.tools.tool.bedrock_converse_tools_tool import DATA_REF_PROPERTY, DATA_REFS_PROPERTY, AbstractBedrockConverseTool
+from cmn.tools.tool.executor import THREAD
+from cmn.tools.tool.sales.forecast import LINEAR, METHODS, ForecastEngine
+from cmn.tools.tool.sales.store import METRICS
 
 logger = logging.getLogger(__name__)
 
@@ -33,13 +47,23 @@ MONTH_NAMES = {
     9:  "September", 10: "October",  11: "November",  12: "December",
 }
 
+MODEL_TYPES = {
+    "linear":         "linear_regression",
+    "seasonal_naive": "seasonal_naive",
+    "holt_winters":   "holt_winters",
+}
+
+GROUP_COLUMNS = ["region", "category"]
+
 
 ################################################################################
 # SECTION: Helper
 ################################################################################
 
-def _confidence_label(r2: float) -> str:
+def _confidence_label(r2: Optional[float]) -> str:
     """Map R² score to a human-readable confidence label."""
+    if r2 is None:
+        return "unknown — needs two years of history to score"
     if r2 >= 0.9:
         return "high"
     elif r2 >= 0.7:
@@ -56,25 +80,33 @@ def _confidence_label(r2: float) -> str:
 
 class SalesForecastBedrockConverseTool(AbstractBedrockConverseTool):
     """
-    Forecasts future monthly sales using linear regression.
+    Forecasts future monthly sales.
 
     Flow
     ----
     1. LLM calls sales_data tool to fetch historical monthly data
-    2. LLM passes that data array here along with metric + periods
-    3. invoke() trains a LinearRegression model and returns actuals + forecast
+    2. LLM passes that data array here along with metric(s) + periods
+    3. invoke() builds a month × series matrix (months numbered across
+       years when rows carry 'year'), fits it in one pass and
+       returns actuals + forecast for `metric`; with extra metrics or
+       group_by, every series is also listed under "series"
     4. Renderer layer (SalesForecastToolRenderer) handles chart/table display
     """
 
-    def __init__(self):
+    execution = THREAD     # vectorized NumPy fit of the rows passed in — no store access
+
+    def __init__(self, engine: ForecastEngine = None):
+        self.engine = engine or ForecastEngine.default()
         name = "sales_forecast"
         definition = {
             "toolSpec": {
                 "name": name,
                 "description": (
-                    "Forecasts future monthly sales using linear regression. "
+                    "Forecasts future monthly sales using a linear trend, "
+                    "seasonal-naive or Holt-Winters model. "
                     "You must provide the historical monthly data to train on — "
-                    "fetch it first using sales_data tool, then pass the result here. "
+                    "fetch it first using sales_data tool, then pass its data_ref here "
+                    "(or several years' data_refs as data_refs). "
                     "Returns forecasted values for the requested number of future months."
                 ),
                 "inputSchema": {
@@ -85,22 +117,46 @@ class SalesForecastBedrockConverseTool(AbstractBedrockConverseTool):
                                 "type":        "array",
                                 "description": (
                                     "Historical monthly data to train on. "
-                                    "Each item must have 'month' (1-12) and the metric field. "
-                                    "Pass the data array directly from sales_data tool result."
+                                    "Each item must have 'month' (1-12) and the metric field, "
+                                    "plus 'year' when the data spans several years. "
+                                    "Only needed when there is no data_ref."
                                 ),
                                 "items": {"type": "object"},
                             },
+                            "data_ref":  DATA_REF_PROPERTY,
+                            "data_refs": DATA_REFS_PROPERTY,
                             "metric": {
                                 "type": "string",
-                                "enum": [
-                                    "revenue",
-                                    "units_sold",
-                                    "returns",
-                                    "gross_profit",
-                                    "net_revenue",
-                                ],
+                                "enum": list(METRICS),
                                 "description": "The metric column to forecast.",
                             },
+                            "metrics": {
+                                "type":        "array",
+                                "items":       {"type": "string", "enum": list(METRICS)},
+                                "description": (
+                                    "Additional metrics to forecast in the same call. "
+                                    "Their results are listed under 'series'."
+                                ),
+                            },
+                            "method": {
+                                "type": "string",
+                                "enum": list(METHODS),
+                                "description": (
+                                    "linear (default): straight trend line. "
+                                    "seasonal_naive: repeats last year's same month "
+                                    "(needs 12 months). holt_winters: trend + seasonality "
+                                    "(needs 24 consecutive months — pass two years of "
+                                    "get_monthly_sales results as data_refs)."
+                                ),
+                            },
+                            "group_by": {
+                                "type":        "array",
+                                "items":       {"type": "string", "enum": GROUP_COLUMNS},
+                                "description": (
+                                    "Also forecast every region and/or category series "
+                                    "separately. Only for data rows that carry those columns."
+                                ),
+                            },
                             "periods": {
                                 "type":        "integer",
                                 "description": (
@@ -111,12 +167,13 @@ class SalesForecastBedrockConverseTool(AbstractBedrockConverseTool):
                             "train_year": {
                                 "type":        "integer",
                                 "description": (
-                                    "The year the training data belongs to. "
-                                    "Used for labelling forecast output only."
+                                    "The year the training data belongs to, when its "
+                                    "rows carry no 'year'. Used for labelling forecast "
+                                    "output only."
                                 ),
                             },
                         },
-                        "required": ["data", "metric", "periods", "train_year"],
+                        "required": ["metric", "periods", "train_year"],
                     }
                 },
             }
@@ -125,9 +182,10 @@ class SalesForecastBedrockConverseTool(AbstractBedrockConverseTool):
 
     def summary(self) -> str:
         return (
-            "sales_forecast : forecasts future monthly sales using linear regression. "
+            "sales_forecast : forecasts future monthly sales (linear, seasonal-naive "
+            "or Holt-Winters), for several metrics at once if needed. "
             "Requires historical data passed directly — call sales_data first, "
-            "then pass its data array here. "
+            "then pass its data_ref here (data_refs for several years). "
             "The result contains both 'actuals' and 'forecast' arrays. "
             "When rendering a chart, combine BOTH actuals and forecast into one data array "
             "before calling render_chart — do not pass forecast data only."
@@ -137,118 +195,177 @@ class SalesForecastBedrockConverseTool(AbstractBedrockConverseTool):
         args       = tool_args or {}
         data       = args.get("data",       [])
         metric     = args.get("metric",     "revenue")
+        extra      = args.get("metrics")    or []
+        method     = args.get("method")     or LINEAR
+        group_by   = args.get("group_by")   or []
         periods    = min(int(args.get("periods") or 3), 12)
         train_year = args.get("train_year")
 
         logger.info(
-            "SalesForecastTool — train_year=%s metric=%s periods=%s rows=%d",
-            train_year, metric, periods, len(data),
+            "SalesForecastTool — train_year=%s metric=%s extra=%s method=%s "
+            "group_by=%s periods=%s rows=%d",
+            train_year, metric, extra, method, group_by, periods, len(data),
         )
 
         if not data:
-            return {"error": "No data provided. Call sales_data first and pass its data array."}
+            return {"error": "No data provided. Call sales_data first and pass its data_ref."}
+
+        if method not in METHODS:
+            return {"error": f"Unknown method: {method}. Use one of {list(METHODS)}"}
 
-        return self._forecast(data, metric, periods, train_year)
+        metrics = [metric] + [m for m in extra if m != metric]
+        return self._forecast(data, metrics, periods, train_year, method, group_by)
 
     # ── Private ───────────────────────────────────────────────────────────────
 
     def _forecast(
         self,
         data:       list,
-        metric:     str,
+        metrics:    list,
         periods:    int,
         train_year: int,
+        method:     str  = LINEAR,
+        group_by:   list = None,
     ) -> dict:
         """
-        Train a LinearRegression model on monthly data and return
+        Fit all requested series in one engine call and return
         actuals + forecast payload.
 
         Parameters
         ----------
-        data       : list of dicts with 'month' + metric columns
-        metric     : column name to forecast
+        data       : list of dicts with 'month' (+ 'year') + metric columns
+        metrics    : metric columns to forecast; metrics[0] is the primary
         periods    : number of future months to predict
-        train_year : year label for the training data
+        train_year : year label for the training data when rows have no 'year'
+        method     : linear | seasonal_naive | holt_winters
+        group_by   : optional subset of region / category for per-group series
 
         Returns
         -------
-        dict with keys: train_year, forecast_year, metric, periods,
-                        model, actuals, forecast, summary
+        dict with keys: train_year, forecast_year, metric, periods, method,
+                        model, actuals, forecast, summary (+ series when
+                        more than one series was fitted)
         """
-        df = pd.DataFrame(data)
+        group_by = list(group_by or [])
+        metric   = metrics[0]
+        df       = pd.DataFrame(data)
 
         # ── Validate columns ──────────────────────────────────────────────────
         if "month" not in df.columns:
             return {"error": f"'month' column not found in data. Got: {list(df.columns)}"}
 
-        if metric not in df.columns:
-            return {"error": f"'{metric}' column not found in data. Got: {list(df.columns)}"}
+        for column in metrics + group_by:
+            if column not in df.columns:
+                return {"error": f"'{column}' column not found in data. Got: {list(df.columns)}"}
 
-        df = df[["month", metric]].dropna().sort_values("month")
-
-        if len(df) < 3:
+        time_columns = ["month", "year"] if "year" in df.columns else ["month"]
+        for column in time_columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+        df = df.dropna(subset=time_columns)
+        if df.empty:
             return {"error": "Need at least 3 months of data to forecast"}
 
-        # ── Train ─────────────────────────────────────────────────────────────
-        X_train = df["month"].values.reshape(-1, 1)
-        y_train = df[metric].values.astype(float)
-
-        model = LinearRegression()
-        model.fit(X_train, y_train)
-
-        r2    = round(model.score(X_train, y_train), 3)
-        slope = model.coef_[0]
-
-        # ── Predict ───────────────────────────────────────────────────────────
-        last_month    = int(df["month"].max())
-        future_months = list(range(last_month + 1, last_month + periods + 1))
-        predictions   = model.predict(np.array(future_months).reshape(-1, 1))
-
-        forecast_year = (train_year or 0) + 1
-
-        forecast_data = []
-        for future_m, pred in zip(future_months, predictions):
-            calendar_month = ((future_m - 1) % 12) + 1
-            forecast_data.append({
-                "month":            calendar_month,
-                "month_name":       MONTH_NAMES[calendar_month],
-                "forecast_year":    forecast_year,
-                "forecasted_value": round(max(float(pred), 0), 2),
-            })
-
-        # ── Actuals for reference ─────────────────────────────────────────────
-        actuals = [
-            {
-                "month":      int(row["month"]),
-                "month_name": MONTH_NAMES[int(row["month"])],
-                "actual":     round(float(row[metric]), 2),
-            }
-            for _, row in df.iterrows()
-        ]
-
-        trend = "upward" if slope > 0 else ("downward" if slope < 0 else "flat")
+        # ── Time index ────────────────────────────────────────────────────────
+        # t numbers months from January of the first year (1..12, 13..24, ...)
+        # so rows of different years are never summed together. Without a
+        # 'year' column every row belongs to train_year and t is the month.
+        if "year" in df.columns:
+            base_year = int(df["year"].min())
+            df["t"]   = (df["year"].astype(int) - base_year) * 12 + df["month"].astype(int)
+        else:
+            base_year = train_year
+            df["t"]   = df["month"].astype(int)
+
+        def calendar(t: int) -> tuple[int, Optional[int]]:
+            """(calendar month, year) of time index t."""
+            year = base_year + (t - 1) // 12 if base_year is not None else None
+            return (t - 1) % 12 + 1, year
+
+        totals = df.groupby("t")[metrics].sum(min_count=1).sort_index()
+
+        if totals[metric].notna().sum() < 3:
+            return {"error": "Need at least 3 months of data to forecast"}
 
-        return {
-            "train_year":    train_year,
-            "forecast_year": forecast_year,
-            "metric":        metric,
-            "periods":       periods,
-            "model": {
-                "type":      "linear_regression",
+        # ── Month × series matrix ─────────────────────────────────────────────
+        months = np.arange(int(totals.index.min()), int(totals.index.max()) + 1)
+        totals = totals.reindex(months)
+        labels = [{"metric": m} for m in metrics]
+        blocks = [totals[metrics].to_numpy(dtype=float)]
+
+        if group_by:
+            grouped = df.pivot_table(
+                index="t", columns=group_by, values=metrics, aggfunc="sum",
+            ).reindex(months)
+            for key in grouped.columns:
+                labels.append({"metric": key[0], **dict(zip(group_by, key[1:]))})
+            blocks.append(grouped.to_numpy(dtype=float))
+
+        # ── Fit + predict (all series at once) ────────────────────────────────
+        fit         = self.engine.fit(months, np.hstack(blocks), method)
+        predictions = np.maximum(fit.predict(periods), 0)
+
+        last_t = int(months[-1])
+        future = [calendar(t) for t in range(last_t + 1, last_t + periods + 1)]
+
+        def series_payload(j: int) -> dict:
+            slope = float(fit.slope[j])
+            r2    = None if math.isnan(fit.r2[j]) else round(float(fit.r2[j]), 3)
+            trend = "upward" if slope > 0 else ("downward" if slope < 0 else "flat")
+            model = {
+                "type":      MODEL_TYPES[fit.method],
                 "r2_score":  r2,
-                "slope":     round(float(slope),            2),
-                "intercept": round(float(model.intercept_), 2),
+                "slope":     round(slope, 2),
+                "intercept": round(float(fit.intercept[j]), 2),
                 "trend":     trend,
-            },
-            "actuals":  actuals,
-            "forecast": forecast_data,
-            "summary": {
+            }
+            for name in ("alpha", "beta", "gamma"):
+                if name in fit.params:
+                    model[name] = float(fit.params[name][j])
+            forecast = [
+                {
+                    "month":            calendar_month,
+                    "month_name":       MONTH_NAMES[calendar_month],
+                    "forecast_year":    year,
+                    "forecasted_value": round(float(value), 2),
+                }
+                for (calendar_month, year), value in zip(future, predictions[:, j])
+            ]
+            summary = {
                 "trend":          trend,
-                "monthly_change": round(float(slope), 2),
+                "monthly_change": round(slope, 2),
                 "avg_forecast":   round(float(np.mean(
-                    [f["forecasted_value"] for f in forecast_data]
+                    [f["forecasted_value"] for f in forecast]
                 )), 2),
                 "r2_score":       r2,
                 "confidence":     _confidence_label(r2),
-            },
-        }
\ No newline at end of file
+            }
+            return {"model": model, "forecast": forecast, "summary": summary}
+
+        # ── Actuals for reference ─────────────────────────────────────────────
+        actuals = []
+        for t, value in totals[metric].dropna().items():
+            month, year = calendar(int(t))
+            actuals.append({
+                "year":       year,
+                "month":      month,
+                "month_name": MONTH_NAMES[month],
+                "actual":     round(float(value), 2),
+            })
+
+        primary = series_payload(0)
+        result  = {
+            "train_year":    calendar(last_t)[1],
+            "forecast_year": future[0][1],
+            "metric":        metric,
+            "periods":       periods,
+            "method":        fit.method,
+            "model":         primary["model"],
+            "actuals":       actuals,
+            "forecast":      primary["forecast"],
+            "summary":       primary["summary"],
+        }
+        if len(labels) > 1:
+            result["series"] = [
+                {**label, **series_payload(j)} for j, label in enumerate(labels)
+            ]
+        return result
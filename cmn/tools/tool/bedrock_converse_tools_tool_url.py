@@ -38,6 +38,8 @@ _REQUEST_TIMEOUT = 10
 
 class UrlContentBedrockConverseTool(AbstractBedrockConverseTool):
 
+    cache_ttl_s = 600.0
+
     def __init__(self):
         name = "url_content_loader"
         definition = {
@@ -34,6 +34,8 @@ _VALID_RECENCY = {"day": "d", "week": "w", "month": "m", "year": "y"}
 
 class WebSearchBedrockConverseTool(AbstractBedrockConverseTool):
 
+    cache_ttl_s = 600.0     # short — results may be about current events
+
     def __init__(self, max_results: int = _DEFAULT_MAX_RESULTS):
         self.max_results = max_results
         name = "web_search"
@@ -7,6 +7,8 @@ logger = logging.getLogger(__name__)
 
 class WikipediaBedrockConverseTool(AbstractBedrockConverseTool):
 
+    cache_ttl_s = 3600.0    # article content changes rarely
+
     def __init__(self):
         name = "wikipedia_loader"
         definition = {
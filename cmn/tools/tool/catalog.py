@@ -0,0 +1,63 @@
+"""
+cmn/tools/tool/catalog.py
+=========================
+Where every converse tool lives, by the tool name the model sees.
+
+Tool modules pull in heavy dependencies (pandas, duckdb, reportlab,
+python-pptx, bs4, httpx, holidays, ...) and some build data at import
+time, so cmn.tools.tool imports none of them up front: a tool's module is
+imported the first time its class is used — `from cmn.tools.tool import
+CalculatorBedrockConverseTool` or tool_class("expr_evaluator") — and a
+page only pays for the tools it registers.
+
+Adding a tool: one line in TOOLS (plus the class name in __all__ of
+cmn/tools/tool/__init__.py).
+
+Usage
+-----
+    registry = ToolRegistry.from_names(["expr_evaluator", "sales_data"])
+    cls      = tool_class("create_pdf")       # imports the PDF tool module
+"""
+
+import importlib
+
+_PREFIX = "cmn.tools.tool.bedrock_converse_tools_tool_"
+
+# tool name → (module, class)
+TOOLS = {
+    "acronym_evaluator":      (_PREFIX + "acronym",         "AcronymBedrockConverseTool"),
+    "aws_docs":               (_PREFIX + "aws_docs",        "AwsDocsBedrockConverseTool"),
+    "expr_evaluator":         (_PREFIX + "calculator",      "CalculatorBedrockConverseTool"),
+    "datetime_tool":          (_PREFIX + "datetime",        "DateTimeBedrockConverseTool"),
+    "eda_correlation":        (_PREFIX + "eda_correlation", "EDACorrelationBedrockConverseTool"),
+    "eda_group":              (_PREFIX + "eda_group",       "EDAGroupBedrockConverseTool"),
+    "eda_profile":            (_PREFIX + "eda_profile",     "EDAProfileBedrockConverseTool"),
+    "holiday_checker":        (_PREFIX + "holiday",         "HolidayBedrockConverseTool"),
+    "create_pdf":             (_PREFIX + "pdf",             "PdfBedrockConverseTool"),
+    "create_pptx":            (_PREFIX + "pptx",            "PptxBedrockConverseTool"),
+    "sales_data":             (_PREFIX + "sales",           "SalesBedrockConverseTool"),
+    "render_sales_kpi":       (_PREFIX + "sales_kpi",       "SalesKpiBedrockConverseTool"),
+    "sales_forecast":         (_PREFIX + "sales_forecast",  "SalesForecastBedrockConverseTool"),
+    "sales_anomaly_detector": (_PREFIX + "sales_anomaly",   "SalesAnomalyBedrockConverseTool"),
+    "url_content_loader":     (_PREFIX + "url",             "UrlContentBedrockConverseTool"),
+    "web_search":             (_PREFIX + "web_search",      "WebSearchBedrockConverseTool"),
+    "wikipedia_loader":       (_PREFIX + "wikipedia",       "WikipediaBedrockConverseTool"),
+    "render_chart":           (_PREFIX + "chart",           "ChartBedrockConverseTool"),
+    "product_query":          (_PREFIX + "product",         "ProductBedrockConverseTool"),
+}
+
+# class name → module
+CLASSES = {cls: module for module, cls in TOOLS.values()}
+
+
+def load_class(class_name: str) -> type:
+    """Tool class by class name, importing its module. Raises KeyError if unknown."""
+    return getattr(importlib.import_module(CLASSES[class_name]), class_name)
+
+
+def tool_class(name: str) -> type:
+    """Tool class by tool name, importing its module. Raises KeyError if unknown."""
+    if name not in TOOLS:
+        raise KeyError(f"Unknown tool: '{name}'. Available: {list(TOOLS)}")
+    module, class_name = TOOLS[name]
+    return getattr(importlib.import_module(module), class_name)
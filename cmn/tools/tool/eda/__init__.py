@@ -0,0 +1,15 @@
+from cmn.tools.tool.eda.correlation import correlation_matrix, top_pairs
+from cmn.tools.tool.eda.group import GroupEngine, one_way_anova
+from cmn.tools.tool.eda.profile import StreamingProfiler
+from cmn.tools.tool.eda.sketches import HeavyHitters, HyperLogLog, TDigest
+
+__all__ = [
+    "StreamingProfiler",
+    "correlation_matrix",
+    "top_pairs",
+    "GroupEngine",
+    "one_way_anova",
+    "TDigest",
+    "HyperLogLog",
+    "HeavyHitters",
+]
@@ -0,0 +1,203 @@
+"""
+cmn/tools/tool/eda/group.py
+===========================
+DuckDB group-by engine behind the eda_group tool.
+
+One query computes every per-group statistic — count, mean, median,
+std, min, max and the 25th / 75th percentiles — in a single scan,
+so high-cardinality keys and Parquet inputs never go through a pandas
+groupby or a Python loop over groups. The one-way ANOVA is derived from
+those aggregates (between / within sums of squares), no second pass.
+
+All calls share one DuckDB database (GroupEngine.default()); each thread
+gets its own cursor, and inputs are registered as views for the duration
+of a query. The database is configured to spill to disk, so inputs larger
+than memory_limit still complete:
+
+    EDA_DUCKDB_MEMORY_LIMIT   e.g. "4GB"   (DuckDB default: 80% of RAM)
+    EDA_DUCKDB_TEMP_DIR       spill directory (default: <tmp>/eda_duckdb)
+
+Accepted input
+--------------
+list[dict], pandas DataFrame, pyarrow Table / RecordBatchReader, or a
+Parquet path / glob.
+
+Usage
+-----
+    engine = GroupEngine.default()
+    groups = engine.group_stats(data, group_by="region", target="revenue")
+    anova  = one_way_anova(groups["count"], groups["mean"], groups["std"])
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import uuid
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+STATS = ("count", "mean", "median", "std", "min", "max", "p25", "p75")
+
+# Percentiles come from a sorted window rather than quantile_cont():
+# holistic aggregates keep every group's values in memory, window sorts
+# spill to disk. quantile q of a group sits at sorted position h = q·(n-1);
+# weighting each value by max(0, 1 - |rank - h|) picks the two neighbours
+# and interpolates linearly between them — quantile_cont() exactly.
+_QUANTILE = "sum(val * greatest(0, 1 - abs(rn - {q} * (n - 1))))"
+
+_GROUP_SQL = """
+WITH ranked AS (
+    SELECT
+        {key}                                                   AS group_key,
+        val,
+        row_number() OVER (PARTITION BY {key} ORDER BY val) - 1 AS rn,
+        count(val)   OVER (PARTITION BY {key})                  AS n
+    FROM (SELECT {key}, TRY_CAST({target} AS DOUBLE) AS val FROM {source})
+    WHERE {key} IS NOT NULL
+)
+SELECT
+    group_key,
+    count(val)          AS count,
+    avg(val)            AS mean,
+    %s AS median,
+    stddev_samp(val)    AS std,
+    min(val)            AS min,
+    max(val)            AS max,
+    %s AS p25,
+    %s AS p75
+FROM ranked
+GROUP BY group_key
+ORDER BY group_key
+""" % (_QUANTILE.format(q=0.5), _QUANTILE.format(q=0.25), _QUANTILE.format(q=0.75))
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _read_parquet(path: str) -> str:
+    return "read_parquet('" + path.replace("'", "''") + "')"
+
+
+################################################################################
+# SECTION: ANOVA
+################################################################################
+
+def one_way_anova(count, mean, std) -> tuple[float, float] | None:
+    """
+    One-way ANOVA (F, p) from per-group count / mean / sample std — the same
+    result as scipy.stats.f_oneway on the raw values. Groups with fewer than
+    two values are left out; None if fewer than two groups remain or every
+    group is constant.
+    """
+    n    = np.asarray(count, dtype=float)
+    m    = np.asarray(mean, dtype=float)
+    s    = np.asarray(std, dtype=float)
+    keep = n > 1
+    n, m, s = n[keep], m[keep], s[keep]
+    k, total = len(n), n.sum()
+    if k < 2:
+        return None
+
+    grand      = (n * m).sum() / total
+    ss_between = (n * (m - grand) ** 2).sum()
+    ss_within  = ((n - 1) * s ** 2).sum()
+    if ss_within <= 0:
+        return None
+
+    # Imported here: only eda_group needs scipy, and cmn.tools.tool.eda
+    # (eda_profile, eda_correlation) must import without it
+    from scipy import stats as scipy_stats
+
+    f = (ss_between / (k - 1)) / (ss_within / (total - k))
+    return float(f), float(scipy_stats.f.sf(f, k - 1, total - k))
+
+
+################################################################################
+# SECTION: Engine
+################################################################################
+
+class GroupEngine:
+    """
+    Shared DuckDB database for eda_group queries. Thread-safe: every thread
+    gets its own cursor; inputs are registered under a unique view name.
+    """
+
+    _default      = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, memory_limit: str = None, temp_directory: str = None):
+        self._con   = duckdb.connect(":memory:")
+        self._local = threading.local()
+        self._lock  = threading.Lock()
+
+        temp_directory = temp_directory or os.path.join(tempfile.gettempdir(), "eda_duckdb")
+        self._con.execute("SET temp_directory = '" + temp_directory.replace("'", "''") + "'")
+        # Insertion order is irrelevant for aggregates and blocks spilling
+        self._con.execute("SET preserve_insertion_order = false")
+        if memory_limit:
+            self._con.execute(f"SET memory_limit = '{memory_limit}'")
+
+    @classmethod
+    def default(cls) -> "GroupEngine":
+        """The process-wide engine (created on first use)."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls(
+                    memory_limit   = os.getenv("EDA_DUCKDB_MEMORY_LIMIT"),
+                    temp_directory = os.getenv("EDA_DUCKDB_TEMP_DIR"),
+                )
+            return cls._default
+
+    def _cursor(self):
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            with self._lock:
+                cursor = self._con.cursor()
+            self._local.cursor = cursor
+        return cursor
+
+    # ── Input ─────────────────────────────────────────────────────────────────
+
+    def columns(self, source) -> list[str]:
+        """Column names of an input without reading its rows."""
+        if isinstance(source, str):
+            return list(self._cursor().sql(f"SELECT * FROM {_read_parquet(source)} LIMIT 0").columns)
+        if isinstance(source, list):
+            return list(dict.fromkeys(k for row in source for k in row))
+        if isinstance(source, pd.DataFrame):
+            return [str(c) for c in source.columns]
+        return list(source.schema.names)
+
+    def _register(self, cursor, source) -> tuple[str, bool]:
+        """Expose source to cursor → (FROM clause, whether a view was registered)."""
+        if isinstance(source, str):
+            return _read_parquet(source), False
+        if isinstance(source, list):
+            source = pd.DataFrame(source)       # tolerates mixed-type / ragged rows
+        name = f"_eda_{uuid.uuid4().hex}"
+        cursor.register(name, source)
+        return name, True
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def group_stats(self, source, group_by: str, target: str) -> pa.Table:
+        """
+        Per-group statistics of `target` by `group_by`, one row per non-null
+        key, ordered by key. Columns: group_key + STATS. Non-numeric target
+        values count as missing.
+        """
+        cursor           = self._cursor()
+        view, registered = self._register(cursor, source)
+        sql = _GROUP_SQL.format(key=_quote(group_by), target=_quote(target), source=view)
+        try:
+            return cursor.execute(sql).fetch_arrow_table()
+        finally:
+            if registered:
+                cursor.unregister(view)
@@ -0,0 +1,324 @@
+"""
+cmn/tools/tool/eda/profile.py
+=============================
+Single-pass, chunked data profiler behind the eda_profile tool.
+
+Input is consumed chunk by chunk — each row is visited once — and every
+statistic is kept as mergeable running state:
+
+numeric      : Welford / Chan moments (count, mean, M2) → mean, std;
+               min, max; median from a t-digest
+categorical  : HyperLogLog distinct count; Misra-Gries heavy hitters for
+               the top values
+rows         : HyperLogLog over row hashes → duplicate-row estimate
+
+exact=True keeps exact state instead (all numeric values for the median,
+full value counts, all row hashes) — identical to the previous pandas
+profile, but memory grows with the input. With exact=False memory is
+bounded by the sketch sizes whatever the number of rows.
+
+Accepted input
+--------------
+list[dict], pandas DataFrame, pyarrow Table / RecordBatch /
+RecordBatchReader, a Parquet file path, or any iterable of those chunks.
+
+Usage
+-----
+    profiler = StreamingProfiler(exact=False)
+    for chunk in chunks:
+        profiler.update(chunk)
+    profile = profiler.result()
+
+    profile = StreamingProfiler.profile(arrow_table, exact=True)
+"""
+
+import logging
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from cmn.tools.tool.eda.sketches import HeavyHitters, HyperLogLog, TDigest
+
+logger = logging.getLogger(__name__)
+
+NUMERIC     = "numeric"
+CATEGORICAL = "categorical"
+OTHER       = "other"
+
+
+################################################################################
+# SECTION: Input
+################################################################################
+
+def iter_frames(source, chunk_rows: int = 100_000):
+    """Yield pandas DataFrame chunks of at most chunk_rows rows from any supported input."""
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunk_rows):
+            yield source.iloc[start:start + chunk_rows]
+    elif isinstance(source, list):
+        for start in range(0, len(source), chunk_rows):
+            yield pd.DataFrame(source[start:start + chunk_rows])
+    elif isinstance(source, pa.Table):
+        for batch in source.to_batches(max_chunksize=chunk_rows):
+            yield batch.to_pandas()
+    elif isinstance(source, pa.RecordBatch):
+        yield from iter_frames(pa.Table.from_batches([source]), chunk_rows)
+    elif isinstance(source, pa.RecordBatchReader):
+        for batch in source:
+            yield from iter_frames(batch, chunk_rows)
+    elif isinstance(source, str):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    elif isinstance(source, Iterable):
+        for chunk in source:
+            yield from iter_frames(chunk, chunk_rows)
+    else:
+        raise TypeError(f"Unsupported profile input: {type(source).__name__}")
+
+
+def _kind(series: pd.Series) -> str:
+    if pd.api.types.is_bool_dtype(series):
+        return OTHER
+    if pd.api.types.is_numeric_dtype(series):
+        return NUMERIC
+    if series.dtype == object or isinstance(series.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+        return CATEGORICAL
+    return OTHER
+
+
+def _hashable(value):
+    """value itself if hashable, else its str() (lists, dicts, arrays)."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return str(value)
+
+
+################################################################################
+# SECTION: Column State
+################################################################################
+
+class _NumericColumn:
+    def __init__(self, exact: bool, compression: float):
+        self.count  = 0
+        self.nulls  = 0
+        self.mean   = 0.0
+        self.m2     = 0.0
+        self.min    = np.inf
+        self.max    = -np.inf
+        self.values = [] if exact else None
+        self.digest = None if exact else TDigest(compression)
+
+    def update(self, series: pd.Series) -> None:
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            series = pd.to_numeric(series, errors="coerce")
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        self.nulls += len(series) - len(values)
+        if not len(values):
+            return
+
+        # Chan et al. parallel update of the Welford moments
+        n_b    = len(values)
+        mean_b = float(values.mean())
+        m2_b   = float(((values - mean_b) ** 2).sum())
+        n      = self.count + n_b
+        delta  = mean_b - self.mean
+        self.mean  += delta * n_b / n
+        self.m2    += m2_b + delta ** 2 * self.count * n_b / n
+        self.count  = n
+        self.min    = min(self.min, float(values.min()))
+        self.max    = max(self.max, float(values.max()))
+
+        if self.values is not None:
+            self.values.append(values)
+        else:
+            self.digest.update(values)
+
+    def median(self) -> float:
+        if self.values is not None:
+            return float(np.median(np.concatenate(self.values)))
+        return self.digest.quantile(0.5)
+
+    def std(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+
+class _CategoricalColumn:
+    def __init__(self, exact: bool, precision: int, capacity: int):
+        self.count  = 0
+        self.nulls  = 0
+        self.counts = {} if exact else None
+        self.hll    = None if exact else HyperLogLog(precision)
+        self.heavy  = None if exact else HeavyHitters(capacity)
+
+    def update(self, series: pd.Series) -> None:
+        values      = series.dropna()
+        self.nulls += len(series) - len(values)
+        self.count += len(values)
+        if not len(values):
+            return
+        if values.dtype == object:
+            # Counts are keyed by value — lists / dicts need a hashable form
+            values = values.map(_hashable)
+        vc = values.value_counts()
+
+        if self.counts is not None:
+            for value, count in vc.items():
+                self.counts[value] = self.counts.get(value, 0) + int(count)
+        else:
+            self.hll.update(vc.index.to_numpy(dtype=object))
+            self.heavy.update_counts(vc.index.to_numpy(dtype=object), vc.to_numpy())
+
+    def unique(self) -> int:
+        if self.counts is not None:
+            return len(self.counts)
+        return min(self.hll.count(), self.count)
+
+    def top(self, n: int) -> list[tuple]:
+        if self.counts is not None:
+            return sorted(self.counts.items(), key=lambda item: -item[1])[:n]
+        return self.heavy.top(n)
+
+
+################################################################################
+# SECTION: Profiler
+################################################################################
+
+class StreamingProfiler:
+    """
+    Accumulates a dataset profile over chunks; result() returns the same
+    payload as the eda_profile tool has always returned, plus "approximate".
+
+    Column kinds are decided by the first chunk that contains the column;
+    later chunks are coerced to that kind (unparseable numbers → null).
+    """
+
+    def __init__(
+        self,
+        exact:         bool  = False,
+        chunk_rows:    int   = 100_000,
+        top_n:         int   = 3,
+        hll_precision: int   = 14,
+        compression:   float = 200.0,
+        heavy_hitters: int   = 100,
+    ):
+        self.exact         = exact
+        self.chunk_rows    = chunk_rows
+        self.top_n         = top_n
+        self.hll_precision = hll_precision
+        self.compression   = compression
+        self.heavy_hitters = heavy_hitters
+
+        self.rows     = 0
+        self._columns = {}        # name → (kind, state); insertion order = column order
+        self._nulls   = {}        # name → nulls of OTHER columns
+        self._hashes  = [] if exact else None
+        self._row_hll = None if exact else HyperLogLog(hll_precision)
+
+    @classmethod
+    def profile(cls, source, **options) -> dict:
+        """Profile any supported input in one pass."""
+        profiler = cls(**options)
+        profiler.update(source)
+        return profiler.result()
+
+    # ── Accumulate ────────────────────────────────────────────────────────────
+
+    def update(self, source) -> None:
+        """Consume one chunk or a whole chunked source."""
+        for frame in iter_frames(source, self.chunk_rows):
+            self._update_frame(frame)
+
+    def _update_frame(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        self.rows += len(df)
+
+        for name in df.columns:
+            if name not in self._columns:
+                self._columns[name] = (_kind(df[name]), self._new_state(_kind(df[name])))
+            kind, state = self._columns[name]
+            if state is None:
+                self._nulls[name] = self._nulls.get(name, 0) + int(df[name].isna().sum())
+            else:
+                state.update(df[name])
+
+        # Columns seen before but absent from this chunk are all-null here
+        for name, (kind, state) in self._columns.items():
+            if name not in df.columns:
+                if state is None:
+                    self._nulls[name] = self._nulls.get(name, 0) + len(df)
+                else:
+                    state.nulls += len(df)
+
+        try:
+            hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        except TypeError:                           # unhashable cells (lists, dicts)
+            hashes = pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy()
+        if self._hashes is not None:
+            self._hashes.append(hashes)
+        else:
+            self._row_hll.update_hashes(hashes)
+
+    def _new_state(self, kind: str):
+        if kind == NUMERIC:
+            return _NumericColumn(self.exact, self.compression)
+        if kind == CATEGORICAL:
+            return _CategoricalColumn(self.exact, self.hll_precision, self.heavy_hitters)
+        return None
+
+    # ── Result ────────────────────────────────────────────────────────────────
+
+    def _distinct_rows(self) -> int:
+        if self._hashes is not None:
+            return len(np.unique(np.concatenate(self._hashes))) if self._hashes else 0
+        return min(self._row_hll.count(), self.rows)
+
+    def result(self) -> dict:
+        numeric, categorical = [], []
+        total_nulls = sum(self._nulls.values())
+
+        for name, (kind, state) in self._columns.items():
+            if state is None:
+                continue
+            total_nulls += state.nulls
+
+            if kind == NUMERIC:
+                if not state.count:
+                    continue
+                std = state.std()
+                numeric.append({
+                    "column": name,
+                    "count":  state.count,
+                    "nulls":  state.nulls,
+                    "mean":   round(state.mean, 2),
+                    "median": round(state.median(), 2),
+                    "std":    round(float(np.sqrt(std)), 2) if std is not None else None,
+                    "min":    round(state.min, 2),
+                    "max":    round(state.max, 2),
+                })
+            else:
+                top = state.top(self.top_n)
+                categorical.append({
+                    "column":    name,
+                    "unique":    state.unique(),
+                    "nulls":     state.nulls,
+                    "top_value": str(top[0][0]) if top else "N/A",
+                    "top_3":     {str(k): int(v) for k, v in top},
+                })
+
+        return {
+            "rows":           self.rows,
+            "columns":        len(self._columns),
+            "column_names":   list(self._columns),
+            "total_nulls":    int(total_nulls),
+            "duplicate_rows": self.rows - self._distinct_rows(),
+            "numeric":        numeric,
+            "categorical":    categorical,
+            "approximate":    not self.exact,
+        }
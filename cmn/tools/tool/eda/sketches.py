@@ -0,0 +1,182 @@
+"""
+cmn/tools/tool/eda/sketches.py
+==============================
+Mergeable, fixed-memory sketches used by the streaming profiler.
+
+TDigest       : quantiles (merging t-digest, k1 scale function)
+HyperLogLog   : distinct counts (2^p one-byte registers)
+HeavyHitters  : top values with counts (Misra-Gries summary)
+
+All three take a whole NumPy batch per update() — the per-value work is
+vectorized — and keep memory independent of the number of rows seen.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+################################################################################
+# SECTION: TDigest
+################################################################################
+
+class TDigest:
+    """
+    Merging t-digest. Each update sorts the current centroids together with
+    the new values and re-clusters them so that no centroid spans more than
+    one unit of the k1 scale k(q) = δ/(2π)·asin(2q − 1): tails stay precise,
+    the middle is coarser, and the size stays O(δ).
+    """
+
+    def __init__(self, compression: float = 200.0):
+        self.compression = compression
+        self.means       = np.empty(0)
+        self.weights     = np.empty(0)
+        self.min         = np.inf
+        self.max         = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate([self.means, values]),
+                       np.concatenate([self.weights, np.ones(len(values))]))
+
+    def merge(self, other: "TDigest") -> None:
+        if not len(other.means):
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order   = np.argsort(means, kind="stable")
+        means   = means[order]
+        weights = weights[order]
+        total   = weights.sum()
+
+        # Bucket by the k-scale value at each item's left edge
+        left   = (np.cumsum(weights) - weights) / total
+        k      = self.compression / (2 * np.pi) * np.arcsin(2 * left - 1)
+        bucket = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+
+        w            = np.add.reduceat(weights, starts)
+        self.means   = np.add.reduceat(means * weights, starts) / w
+        self.weights = w
+
+    def quantile(self, q: float) -> float:
+        if not len(self.means):
+            return float("nan")
+        if len(self.means) == 1:
+            return float(self.means[0])
+        total = self.weights.sum()
+        # Centroid means sit at the middle of their cumulative weight
+        mids  = (np.cumsum(self.weights) - self.weights / 2) / total
+        xs    = np.r_[0.0, mids, 1.0]
+        ys    = np.r_[self.min, self.means, self.max]
+        return float(np.interp(q, xs, ys))
+
+
+################################################################################
+# SECTION: HyperLogLog
+################################################################################
+
+def hash_values(values) -> np.ndarray:
+    """64-bit hashes of a 1-d array (numbers or objects), vectorized."""
+    values = np.asarray(values)
+    if values.dtype == object:
+        values = values.astype(str).astype(object)
+    return pd.util.hash_array(values)
+
+
+def _leading_zeros(x: np.ndarray) -> np.ndarray:
+    """Count of leading zero bits of uint64 values (64 for zero)."""
+    x = x.copy()
+    n = np.zeros(len(x), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        empty = (x >> np.uint64(64 - shift)) == 0
+        n    += shift * empty
+        x     = np.where(empty, x << np.uint64(shift), x)
+    return n + (x == 0)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter with 2^p registers (p=14 → 16 KiB,
+    ~0.8% standard error) and linear counting for small cardinalities.
+    """
+
+    def __init__(self, p: int = 14):
+        self.p         = p
+        self.m         = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest  = hashes << np.uint64(self.p)
+        rank  = np.minimum(_leading_zeros(rest) + 1, 64 - self.p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def update(self, values) -> None:
+        self.update_hashes(hash_values(values))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m        = self.m
+        alpha    = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype(float))
+        zeros    = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+################################################################################
+# SECTION: Heavy Hitters
+################################################################################
+
+class HeavyHitters:
+    """
+    Misra-Gries summary of at most `capacity` values. Counts are lower
+    bounds, off by at most (rows seen / capacity); any value more frequent
+    than that is guaranteed to be kept.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counts   = {}
+
+    def update(self, values) -> None:
+        uniques, counts = np.unique(np.asarray(values), return_counts=True)
+        self.update_counts(uniques, counts)
+
+    def update_counts(self, uniques: np.ndarray, counts: np.ndarray) -> None:
+        # Reduce the batch to its own Misra-Gries summary first (summaries
+        # are mergeable), so the dict merge below touches ≤ capacity values
+        if len(counts) > self.capacity:
+            nth     = len(counts) - self.capacity - 1
+            cut     = np.partition(counts, nth)[nth]
+            keep    = counts > cut
+            uniques = uniques[keep]
+            counts  = counts[keep] - cut
+        for value, count in zip(uniques.tolist(), counts.tolist()):
+            self.counts[value] = self.counts.get(value, 0) + count
+        if len(self.counts) > self.capacity:
+            # Subtract the (capacity+1)-th largest count, drop what reaches 0
+            cut = sorted(self.counts.values(), reverse=True)[self.capacity]
+            self.counts = {v: c - cut for v, c in self.counts.items() if c > cut}
+
+    def top(self, n: int) -> list[tuple]:
+        return sorted(self.counts.items(), key=lambda item: -item[1])[:n]
@@ -0,0 +1,314 @@
+"""
+cmn/tools/tool/executor.py
+==========================
+Runs tools off the calling (Streamlit script) thread according to the
+execution class each tool declares:
+
+INLINE   : tool.invoke() on the calling thread (default)
+THREAD   : on a shared thread pool, with a timeout — for tools that block
+           on I/O or release the GIL (DuckDB)
+PROCESS  : on a warm process pool — for CPU-bound tools (PDF / PPTX
+           rendering, EDA on inline data) that would otherwise hold the
+           GIL and stall every other session's streaming
+
+Process workers
+---------------
+Workers are started lazily from a forkserver that has already imported
+PRELOAD_MODULES, so a new or replacement worker is ready in milliseconds.
+Each worker builds its own tool instance once (type(tool)() — process
+tools must be constructible without arguments) and reuses it.
+
+A call that exceeds its timeout, or whose cancel event is set, kills its
+worker and a fresh one takes its place, so a runaway 200-page PDF cannot
+hold a slot. Results larger than max_result_bytes (pickled) are replaced
+by an {"error": ...} result. Exceptions raised by a tool are re-raised in
+the caller as ToolExecutionError.
+
+The CPU time a call used (calling thread, pool thread or worker process)
+is reported in usage["cpu_s"] when a usage dict is passed.
+
+Usage
+-----
+    class PdfBedrockConverseTool(AbstractBedrockConverseTool):
+        execution = PROCESS
+
+    registry = ToolRegistry([...], executor=ToolExecutor.default())
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+INLINE     = "inline"
+THREAD     = "thread"
+PROCESS    = "process"
+EXECUTIONS = (INLINE, THREAD, PROCESS)
+
+# Imported once in the forkserver, inherited by every worker
+PRELOAD_MODULES = (
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "duckdb",
+    "reportlab.platypus",
+    "pptx",
+    "cmn.tools.tool",
+)
+
+
+class ToolExecutionError(RuntimeError):
+    """A tool raised inside a worker process; message is 'Type: text'."""
+
+
+################################################################################
+# SECTION: Worker Process
+################################################################################
+
+def _preload(modules: tuple) -> None:
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as exc:                    # optional dependency missing
+            logger.debug("ToolExecutor: preload %s skipped (%s)", name, exc)
+
+
+def _worker_main(conn, preload: tuple, max_result_bytes: int) -> None:
+    """Worker loop: receive (module, qualname, tool_args), send pickled (status, value, cpu_s)."""
+    _preload(preload)
+    tools = {}
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        module, qualname, tool_args = task
+        try:
+            cpu  = time.process_time()
+            tool = tools.get((module, qualname))
+            if tool is None:
+                cls = importlib.import_module(module)
+                for part in qualname.split("."):
+                    cls = getattr(cls, part)
+                tool = tools[(module, qualname)] = cls()
+            result  = tool.invoke(params=None, tool_args=tool_args)
+            payload = pickle.dumps(("ok", result, time.process_time() - cpu))
+            if len(payload) > max_result_bytes:
+                payload = pickle.dumps(("ok", {
+                    "error": f"Tool result too large ({len(payload):,} bytes, "
+                             f"limit {max_result_bytes:,}). Narrow the request."
+                }, time.process_time() - cpu))
+        except Exception as exc:
+            logger.exception("ToolExecutor: %s failed in worker", qualname)
+            payload = pickle.dumps(("raise", f"{type(exc).__name__}: {exc}", time.process_time() - cpu))
+        conn.send_bytes(payload)
+
+
+def _timed(tool, tool_args: dict, usage: dict) -> Any:
+    """tool.invoke() on this thread, CPU time into usage["cpu_s"]."""
+    cpu = time.thread_time()
+    try:
+        return tool.invoke(params=None, tool_args=tool_args)
+    finally:
+        usage["cpu_s"] = time.thread_time() - cpu
+
+
+class _Worker:
+    def __init__(self, ctx, preload: tuple, max_result_bytes: int):
+        self.conn, child = ctx.Pipe()
+        self.process     = ctx.Process(
+            target = _worker_main,
+            args   = (child, preload, max_result_bytes),
+            name   = "converse-tool-worker",
+            daemon = True,
+        )
+        self.process.start()
+        child.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+################################################################################
+# SECTION: ToolExecutor
+################################################################################
+
+class ToolExecutor:
+    """
+    Dispatches tool calls by their `execution` class. Thread-safe; pools
+    are created on first use. default() is shared by every session.
+    """
+
+    _default      = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        process_workers:  int   = max(1, min(4, (os.cpu_count() or 2) - 1)),
+        thread_workers:   int   = 8,
+        timeout:          float = 120.0,
+        max_result_bytes: int   = 16 * 1024 * 1024,
+        preload:          tuple = PRELOAD_MODULES,
+    ):
+        self.process_workers  = process_workers
+        self.thread_workers   = thread_workers
+        self.timeout          = timeout
+        self.max_result_bytes = max_result_bytes
+        self.preload          = preload
+
+        self._lock    = threading.Lock()
+        self._ctx     = None
+        self._idle    = None            # queue of idle _Worker
+        self._threads = None
+        self.counts   = {INLINE: 0, THREAD: 0, PROCESS: 0, "timeouts": 0, "cancelled": 0, "restarts": 0}
+
+    @classmethod
+    def default(cls) -> "ToolExecutor":
+        """The process-wide executor (created on first use)."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    # ── Pools ─────────────────────────────────────────────────────────────────
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    max_workers        = self.thread_workers,
+                    thread_name_prefix = "converse-tool-thread",
+                )
+            return self._threads
+
+    def _process_pool(self) -> queue.Queue:
+        with self._lock:
+            if self._idle is None:
+                if "forkserver" in multiprocessing.get_all_start_methods():
+                    self._ctx = multiprocessing.get_context("forkserver")
+                    self._ctx.set_forkserver_preload(list(self.preload))
+                else:
+                    self._ctx = multiprocessing.get_context("spawn")
+                self._idle = queue.Queue()
+                for _ in range(self.process_workers):
+                    self._idle.put(self._spawn())
+                logger.info("ToolExecutor: started %d worker processes", self.process_workers)
+            return self._idle
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._ctx, self.preload, self.max_result_bytes)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] += 1
+
+    # ── Dispatch ──────────────────────────────────────────────────────────────
+
+    def run(
+        self,
+        tool,
+        tool_args: dict,
+        cancel:    Optional[threading.Event] = None,
+        usage:     Optional[dict]            = None,
+    ) -> Any:
+        """Invoke tool by its execution class; blocks until the result is in."""
+        usage     = usage if usage is not None else {}
+        execution = getattr(tool, "execution", INLINE)
+        self._count(execution)
+        if execution == PROCESS:
+            return self._run_process(tool, tool_args, cancel, usage)
+        if execution == THREAD:
+            return self._run_thread(tool, tool_args, usage)
+        return _timed(tool, tool_args, usage)
+
+    async def arun(self, tool, tool_args: dict, usage: Optional[dict] = None) -> Any:
+        """Async run(); cancelling the awaiting task kills a process call."""
+        cancel = threading.Event()
+        try:
+            return await asyncio.to_thread(self.run, tool, tool_args, cancel, usage)
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
+
+    def _timeout_error(self, tool) -> dict:
+        self._count("timeouts")
+        return {"error": f"Tool '{tool.name}' timed out after {self.timeout:g}s."}
+
+    def _run_thread(self, tool, tool_args: dict, usage: dict) -> Any:
+        future = self._thread_pool().submit(_timed, tool, tool_args, usage)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()                         # threads cannot be killed once running
+            return self._timeout_error(tool)
+
+    def _run_process(self, tool, tool_args: dict, cancel: Optional[threading.Event], usage: dict) -> Any:
+        idle     = self._process_pool()
+        deadline = time.monotonic() + self.timeout
+        try:
+            worker = idle.get(timeout=self.timeout)
+        except queue.Empty:
+            return self._timeout_error(tool)
+
+        healthy = False
+        try:
+            cls = type(tool)
+            worker.conn.send((cls.__module__, cls.__qualname__, tool_args))
+            while not worker.conn.poll(0.05):
+                if cancel is not None and cancel.is_set():
+                    self._count("cancelled")
+                    return {"error": f"Tool '{tool.name}' was cancelled."}
+                if time.monotonic() >= deadline:
+                    return self._timeout_error(tool)
+            status, value, usage["cpu_s"] = pickle.loads(worker.conn.recv_bytes())
+            healthy = True
+        except (EOFError, OSError) as exc:
+            logger.error("ToolExecutor: worker for '%s' died: %s", tool.name, exc)
+            return {"error": f"Tool '{tool.name}' crashed."}
+        finally:
+            if not healthy:
+                worker.kill()
+                worker = self._spawn()
+                self._count("restarts")
+            idle.put(worker)
+
+        if status == "raise":
+            raise ToolExecutionError(value)
+        return value
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def shutdown(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, None
+            threads, self._threads = self._threads, None
+        if threads is not None:
+            threads.shutdown(wait=False, cancel_futures=True)
+        while idle is not None and not idle.empty():
+            worker = idle.get_nowait()
+            try:
+                worker.conn.send(None)
+                worker.process.join(timeout=5)
+            except OSError:
+                pass
+            if worker.process.is_alive():
+                worker.kill()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self.counts, "process_workers": self.process_workers}
@@ -0,0 +1,408 @@
+"""
+cmn/tools/tool/metrics.py
+=========================
+In-process latency / payload metrics for ToolRegistry calls.
+
+Every call through a registry that has metrics=ToolMetrics.default() is
+recorded with:
+
+wall_ms       : time from dispatch to published result (cache hits included)
+cpu_ms        : CPU time spent by the tool — the calling thread for inline
+                tools, the pool thread / worker process under ToolExecutor;
+                None for async inline calls (the tool runs on a thread we
+                cannot measure from the event loop)
+args_bytes    : JSON size of the arguments the model sent
+result_bytes  : JSON size of the raw published result — measured before
+                ResultEncoder.content() re-encodes it for the toolResult and
+                including any UI-only render payload; it tracks what the
+                tool produced, not the exact bytes the model receives
+cache         : "hit", "miss" or "off" (no cache / tool not cacheable)
+status        : "ok", "error" ({"error": ...} result) or "raised"
+
+Per tool, each numeric field feeds a log-bucketed Histogram (≈ 9% relative
+error on percentiles, fixed memory), so stats() can report p50 / p95 / p99
+for any number of calls. The last `recent` calls are kept verbatim.
+
+Exporters
+---------
+Each call record can also be written out, one JSON line per call:
+
+EmfExporter    : CloudWatch Embedded Metric Format — on stdout it is picked
+                 up by Lambda / ECS awslogs / the CloudWatch agent and turned
+                 into metrics (namespace App/ConverseTools, dimension Tool)
+JsonlExporter  : the raw call record, for offline analysis
+
+ToolMetrics.default() attaches exporters from env TOOL_METRICS_EXPORT, a
+comma-separated list of "emf", "emf:<path>" and "jsonl:<path>".
+
+Usage
+-----
+    registry = ToolRegistry([...], metrics=ToolMetrics.default())
+    ToolMetrics.default().stats()      # per-tool summary, slowest total first
+"""
+
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from cmn.tools.tool.executor import INLINE
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("wall_ms", "cpu_ms", "args_bytes", "result_bytes")
+
+
+def json_size(obj: Any) -> int:
+    """Length of obj as compact JSON (non-JSON values via str())."""
+    try:
+        return len(json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False))
+    except (TypeError, ValueError):                 # e.g. circular structures
+        return len(str(obj))
+
+
+################################################################################
+# SECTION: Histogram
+################################################################################
+
+class Histogram:
+    """
+    Log-bucketed histogram of non-negative values. Bucket i covers
+    [lo·g^(i-1), lo·g^i) with g = 2^(1/4); bucket 0 holds everything below
+    lo. Percentiles return the geometric middle of their bucket, clamped
+    to the observed min / max. Not thread-safe (ToolMetrics locks).
+    """
+
+    GROWTH = 2 ** 0.25
+
+    def __init__(self, lo: float = 0.01, hi: float = 1e10):
+        self.lo      = lo
+        self.buckets = [0] * (int(math.log(hi / lo, self.GROWTH)) + 2)
+        self.count   = 0
+        self.total   = 0.0
+        self.min     = math.inf
+        self.max     = -math.inf
+
+    def add(self, value: float) -> None:
+        if value < self.lo:
+            i = 0
+        else:
+            i = min(int(math.log(value / self.lo, self.GROWTH)) + 1, len(self.buckets) - 1)
+        self.buckets[i] += 1
+        self.count      += 1
+        self.total      += value
+        self.min         = min(self.min, value)
+        self.max         = max(self.max, value)
+
+    def upper(self, i: int) -> float:
+        """Upper bound of bucket i."""
+        return self.lo * self.GROWTH ** i
+
+    def percentile(self, q: float) -> float | None:
+        """Approximate q-th percentile (0–100); None when empty."""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                middle = self.upper(i) / math.sqrt(self.GROWTH) if i else self.lo / 2
+                return min(max(middle, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def rows(self) -> list[dict]:
+        """Non-empty buckets as [{"le": upper bound, "count": n}], ascending."""
+        return [
+            {"le": self.upper(i), "count": n}
+            for i, n in enumerate(self.buckets)
+            if n
+        ]
+
+
+################################################################################
+# SECTION: Exporters
+################################################################################
+
+class _LineExporter:
+    """Writes one JSON line per call record to a stream or an append-only file."""
+
+    def __init__(self, path: str | None = None, stream=None):
+        self.path    = path
+        self._stream = stream if stream is not None else (
+            open(path, "a", encoding="utf-8") if path else sys.stdout
+        )
+        self._lock   = threading.Lock()
+
+    def line(self, call: dict) -> dict:
+        raise NotImplementedError
+
+    def export(self, call: dict) -> None:
+        text = json.dumps(self.line(call), default=str, separators=(",", ":"))
+        with self._lock:
+            self._stream.write(text + "\n")
+            self._stream.flush()
+
+    def close(self) -> None:
+        if self.path:
+            self._stream.close()
+
+
+class JsonlExporter(_LineExporter):
+    """The call record as-is."""
+
+    def line(self, call: dict) -> dict:
+        return call
+
+
+class EmfExporter(_LineExporter):
+    """CloudWatch Embedded Metric Format: one metric set per call, dimension Tool."""
+
+    METRICS = (
+        ("wall_ms",      "WallTime",   "Milliseconds"),
+        ("cpu_ms",       "CpuTime",    "Milliseconds"),
+        ("args_bytes",   "ArgsSize",   "Bytes"),
+        ("result_bytes", "ResultSize", "Bytes"),
+    )
+
+    def __init__(self, path: str | None = None, stream=None, namespace: str = "App/ConverseTools"):
+        super().__init__(path, stream)
+        self.namespace = namespace
+
+    def line(self, call: dict) -> dict:
+        values = {name: call[field] for field, name, _ in self.METRICS if call[field] is not None}
+        values["Errors"]    = int(call["status"] != "ok")
+        values["CacheHits"] = int(call["cache"] == "hit")
+        units  = {name: unit for _, name, unit in self.METRICS}
+        return {
+            "_aws": {
+                "Timestamp": int(call["timestamp"] * 1000),
+                "CloudWatchMetrics": [{
+                    "Namespace":  self.namespace,
+                    "Dimensions": [["Tool"]],
+                    "Metrics":    [{"Name": name, "Unit": units.get(name, "Count")} for name in values],
+                }],
+            },
+            "Tool":      call["tool"],
+            "Execution": call["execution"],
+            "Cache":     call["cache"],
+            "Status":    call["status"],
+            **values,
+        }
+
+
+def exporters_from_env(spec: str | None = None) -> list:
+    """Exporters for a TOOL_METRICS_EXPORT value ("emf", "emf:<path>", "jsonl:<path>", ...)."""
+    spec      = os.getenv("TOOL_METRICS_EXPORT", "") if spec is None else spec
+    exporters = []
+    for item in filter(None, (s.strip() for s in spec.split(","))):
+        kind, _, path = item.partition(":")
+        if kind == "emf":
+            exporters.append(EmfExporter(path or None))
+        elif kind == "jsonl" and path:
+            exporters.append(JsonlExporter(path))
+        else:
+            logger.warning("TOOL_METRICS_EXPORT: ignoring '%s'", item)
+    return exporters
+
+
+################################################################################
+# SECTION: ToolMetrics
+################################################################################
+
+class _ToolStats:
+    def __init__(self):
+        self.calls      = 0
+        self.errors     = 0
+        self.raised     = 0
+        self.cache_hits = 0
+        self.last_error = None
+        self.histograms = {field: Histogram() for field in FIELDS}
+
+
+class ToolMetrics:
+    """
+    Per-tool call metrics. Thread-safe; default() is shared by every
+    session in the process (and read by the tool diagnostics page).
+    """
+
+    _default      = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, recent: int = 200, exporters: list | None = None):
+        self.exporters = list(exporters or [])
+        self._lock     = threading.Lock()
+        self._tools    = {}                         # tool name → _ToolStats
+        self._recent   = deque(maxlen=recent)
+
+    @classmethod
+    def default(cls) -> "ToolMetrics":
+        """The process-wide metrics (created on first use, exporters from env)."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls(exporters=exporters_from_env())
+            return cls._default
+
+    # ── Recording ─────────────────────────────────────────────────────────────
+
+    def record(self, call: dict) -> None:
+        """Add one call record (see ToolCall) and hand it to the exporters."""
+        with self._lock:
+            stats = self._tools.get(call["tool"])
+            if stats is None:
+                stats = self._tools[call["tool"]] = _ToolStats()
+            stats.calls      += 1
+            stats.errors     += call["status"] != "ok"
+            stats.raised     += call["status"] == "raised"
+            stats.cache_hits += call["cache"] == "hit"
+            if call["error"]:
+                stats.last_error = call["error"]
+            for field in FIELDS:
+                if call[field] is not None:
+                    stats.histograms[field].add(call[field])
+            self._recent.append(call)
+
+        for exporter in self.exporters:
+            try:
+                exporter.export(call)
+            except Exception as exc:                # never fail a tool call over metrics
+                logger.warning("ToolMetrics: %s failed: %s", type(exporter).__name__, exc)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+            self._recent.clear()
+
+    # ── Reading ───────────────────────────────────────────────────────────────
+
+    def stats(self) -> list[dict]:
+        """
+        One row per tool, largest total wall time first:
+            calls / errors / raised / cache_hit_pct
+            total_s, mean_ms, p50_ms, p95_ms, p99_ms, max_ms : wall time
+            cpu_mean_ms, cpu_pct : CPU time, and as a share of wall time
+            args_p95_bytes, result_p50_bytes, result_p95_bytes, result_max_bytes
+            last_error
+        """
+        def ms(value):
+            return None if value is None else round(value, 1)
+
+        def size(value):
+            return None if value is None else int(round(value))
+
+        rows = []
+        with self._lock:
+            for name, s in self._tools.items():
+                wall, cpu = s.histograms["wall_ms"], s.histograms["cpu_ms"]
+                args, res = s.histograms["args_bytes"], s.histograms["result_bytes"]
+                rows.append({
+                    "tool":             name,
+                    "calls":            s.calls,
+                    "errors":           s.errors,
+                    "raised":           s.raised,
+                    "cache_hit_pct":    round(100 * s.cache_hits / s.calls, 1),
+                    "total_s":          round(wall.total / 1000, 3),
+                    "mean_ms":          ms(wall.mean),
+                    "p50_ms":           ms(wall.percentile(50)),
+                    "p95_ms":           ms(wall.percentile(95)),
+                    "p99_ms":           ms(wall.percentile(99)),
+                    "max_ms":           ms(wall.max),
+                    "cpu_mean_ms":      ms(cpu.mean),
+                    "cpu_pct":          round(100 * cpu.total / wall.total, 1) if cpu.count and wall.total else None,
+                    "args_p95_bytes":   size(args.percentile(95)),
+                    "result_p50_bytes": size(res.percentile(50)),
+                    "result_p95_bytes": size(res.percentile(95)),
+                    "result_max_bytes": size(res.max),
+                    "last_error":       s.last_error,
+                })
+        rows.sort(key=lambda row: row["total_s"], reverse=True)
+        return rows
+
+    def histogram(self, tool: str, field: str = "wall_ms") -> list[dict]:
+        """Non-empty buckets of one tool's histogram (see Histogram.rows)."""
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field '{field}'. Use one of: {', '.join(FIELDS)}")
+        with self._lock:
+            stats = self._tools.get(tool)
+            return stats.histograms[field].rows() if stats else []
+
+    def recent(self) -> list[dict]:
+        """The most recent call records, newest first."""
+        with self._lock:
+            return list(reversed(self._recent))
+
+
+################################################################################
+# SECTION: ToolCall
+################################################################################
+
+class ToolCall:
+    """
+    Times one registry call and records it on exit. A no-op when metrics is
+    None. With thread_cpu=True the calling thread's CPU time is measured;
+    whoever runs the tool elsewhere reports it in usage["cpu_s"] instead.
+
+        with ToolCall(self.metrics, tool, tool_args) as call:
+            call.cache = "miss"
+            result = executor.run(tool, args, usage=call.usage)
+            return call.done(result)
+    """
+
+    def __init__(self, metrics: Optional[ToolMetrics], tool, tool_args: dict, thread_cpu: bool = True):
+        self.metrics    = metrics
+        self.tool       = tool
+        self.tool_args  = tool_args
+        self.thread_cpu = thread_cpu
+        self.cache      = "off"
+        self.usage      = {}
+        self.result     = None
+
+    def __enter__(self) -> "ToolCall":
+        if self.metrics is not None:
+            self.timestamp = time.time()
+            self._wall     = time.perf_counter()
+            self._cpu      = time.thread_time() if self.thread_cpu else None
+        return self
+
+    def done(self, result: Any) -> Any:
+        """Note the published result; returns it unchanged."""
+        self.result = result
+        return result
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.metrics is None:
+            return
+        wall_ms = 1000 * (time.perf_counter() - self._wall)
+        cpu_s   = self.usage.get("cpu_s")
+        if cpu_s is None and self._cpu is not None:
+            cpu_s = time.thread_time() - self._cpu
+
+        error = None
+        if exc is not None:
+            status, error = "raised", f"{exc_type.__name__}: {exc}"
+        elif isinstance(self.result, dict) and "error" in self.result:
+            status, error = "error", str(self.result["error"])
+        else:
+            status = "ok"
+
+        self.metrics.record({
+            "timestamp":    self.timestamp,
+            "tool":         self.tool.name,
+            "execution":    getattr(self.tool, "execution", INLINE),
+            "cache":        self.cache,
+            "status":       status,
+            "error":        error[:200] if error else None,
+            "wall_ms":      round(wall_ms, 3),
+            "cpu_ms":       None if cpu_s is None else round(1000 * cpu_s, 3),
+            "args_bytes":   json_size(self.tool_args or {}),
+            "result_bytes": json_size(self.result) if exc is None else 0,
+        })
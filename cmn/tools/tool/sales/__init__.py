@@ -0,0 +1,17 @@
+from cmn.tools.tool.sales.engine import SalesEngine
+from cmn.tools.tool.sales.forecast import ForecastEngine
+from cmn.tools.tool.sales.store import (
+    InMemorySalesStore,
+    ParquetSalesStore,
+    SalesStore,
+    default_store,
+)
+
+__all__ = [
+    "SalesEngine",
+    "ForecastEngine",
+    "SalesStore",
+    "InMemorySalesStore",
+    "ParquetSalesStore",
+    "default_store",
+]
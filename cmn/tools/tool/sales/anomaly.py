@@ -0,0 +1,112 @@
+"""
+cmn/tools/tool/sales/anomaly.py
+===============================
+Vectorized anomaly scoring behind the sales_anomaly_detector tool.
+
+Works on a month × series matrix Y (one column per metric, or metric ×
+region / category), so every series is scored by the same few NumPy
+array operations — no per-row or per-series Python loops.
+
+Methods
+-------
+zscore   : (y - mean) / std over the whole period (sample std, ddof=1)
+robust   : 0.6745 · (y - median) / MAD — not dragged by the outliers it
+           is looking for
+rolling  : each month against the mean / std of the `window` months
+           before it (trailing, excludes the month itself); the first
+           `window` months are not scored
+
+Undefined scores (constant series, not enough history) are NaN and never
+flagged.
+
+Usage
+-----
+    scores        = score(Y, method="robust")
+    center, scale = baseline(Y, method="robust")
+    rows, cols    = top_k(scores, k=10, threshold=1.5)
+    labels        = severity(scores[rows, cols], threshold=1.5)
+"""
+
+import warnings
+
+import numpy as np
+
+ZSCORE  = "zscore"
+ROBUST  = "robust"
+ROLLING = "rolling"
+METHODS = (ZSCORE, ROBUST, ROLLING)
+
+_MAD_SCALE = 0.6745      # makes MAD comparable to a standard deviation
+
+
+def _rolling(Y: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Trailing mean / sample std of the `window` rows before each row (NaN if fewer)."""
+    n, k  = Y.shape
+    csum  = np.vstack([np.zeros((1, k)), np.cumsum(Y, axis=0)])
+    csq   = np.vstack([np.zeros((1, k)), np.cumsum(Y ** 2, axis=0)])
+    mean  = np.full((n, k), np.nan)
+    std   = np.full((n, k), np.nan)
+    if n > window >= 2:
+        s   = csum[window:n] - csum[:n - window]          # sums of rows t-window..t-1
+        sq  = csq[window:n]  - csq[:n - window]
+        m   = s / window
+        mean[window:] = m
+        std[window:]  = np.sqrt(np.maximum(sq - window * m ** 2, 0) / (window - 1))
+    return mean, std
+
+
+def baseline(Y: np.ndarray, method: str = ZSCORE, window: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reference (center, scale) each cell is compared with, broadcastable to Y:
+    per-column (mean, std) for zscore, (median, MAD / 0.6745) for robust,
+    per-cell trailing (mean, std) for rolling.
+    """
+    if method == ROLLING:
+        return _rolling(np.nan_to_num(Y), window)
+
+    with warnings.catch_warnings():
+        # All-NaN / single-value columns → NaN center or scale, never flagged
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if method == ROBUST:
+            center = np.nanmedian(Y, axis=0)
+            mad    = np.nanmedian(np.abs(Y - center), axis=0)
+            return center, mad / _MAD_SCALE
+        return np.nanmean(Y, axis=0), np.nanstd(Y, axis=0, ddof=1)
+
+
+def score(Y: np.ndarray, method: str = ZSCORE, window: int = 3) -> np.ndarray:
+    """
+    Anomaly scores, same shape as Y. Raises ValueError for an unknown method.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown anomaly method: {method}")
+    Y             = np.asarray(Y, dtype=float)
+    center, scale = baseline(Y, method, window)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = (Y - center) / scale
+    scores[~np.isfinite(scores)] = np.nan
+    return scores
+
+
+def top_k(scores: np.ndarray, k: int, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (row, column) indices of the k largest |scores| at or above threshold,
+    strongest first. argpartition keeps this O(cells) for large matrices.
+    """
+    flat    = np.abs(scores).ravel()
+    flat    = np.where(np.isnan(flat), -np.inf, flat)
+    flagged = int(np.count_nonzero(flat >= threshold))
+    k       = min(k, flagged)
+    if k <= 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    idx = np.argpartition(-flat, k - 1)[:k]
+    idx = idx[np.argsort(-flat[idx], kind="stable")]
+    return np.unravel_index(idx, scores.shape)
+
+
+def severity(scores: np.ndarray, threshold: float) -> np.ndarray:
+    """"mild" | "moderate" | "severe" by how far |score| exceeds the threshold."""
+    distance = np.abs(scores) - threshold
+    return np.select([distance < 0.5, distance < 1.0], ["mild", "moderate"], "severe")
@@ -0,0 +1,148 @@
+"""
+cmn/tools/tool/sales/engine.py
+==============================
+Long-lived DuckDB engine behind the sales_data tool.
+
+The tool used to open a fresh duckdb.connect(), register the DataFrame and
+convert the result to pandas on every call — connection setup dominated
+its latency. SalesEngine instead:
+
+- loads the sales rows once into a native DuckDB table
+- keeps a bounded pool of cursors on that database (DuckDB connections
+  are not safe to share across threads); a query checks one out for its
+  duration and returns it, so cursors outlive the Streamlit script thread
+  and the per-call tool threads that use them
+- PREPAREs every query shape once per pooled cursor and EXECUTEs it
+  afterwards — across turns, not just within one
+- fetches results as Arrow and converts straight to Python records
+
+Query shapes use "(? = 'all' OR col = ?)" style filters so optional
+filters do not multiply the number of statements.
+
+DuckDB's Python API cannot bind parameters to EXECUTE, so arguments are
+rendered as SQL literals by _sql_literal() (finite numbers / escaped strings;
+NaN and infinities become NULL).
+
+Usage
+-----
+    engine  = SalesEngine(df)
+    engine.register_query("monthly", "SELECT ... WHERE year = $1")
+    records = engine.records("monthly", [2024])
+"""
+
+import logging
+import math
+import numbers
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+def _sql_literal(value) -> str:
+    """Render a query argument as a DuckDB literal for EXECUTE."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, numbers.Number):
+        if not math.isfinite(float(value)):
+            return "NULL"                   # nan / inf have no SQL literal
+        return repr(int(value)) if float(value).is_integer() else repr(float(value))
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class SalesEngine:
+    """
+    One DuckDB database with a native `sales` table, shared by all threads.
+    Thread-safe: queries run on cursors checked out of a pool of at most
+    pool_size, each with its own prepared statements; callers beyond that
+    wait for a cursor to come back.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, database: str = ":memory:",
+                 config: Optional[dict] = None, pool_size: int = 4):
+        self._con      = duckdb.connect(database, config=config or {})
+        self._queries  = {}                 # name → SQL with $1..$n params
+        self._pool     = queue.LifoQueue()  # idle (cursor, prepared names); LIFO keeps hot ones warm
+        self._created  = 0
+        self.pool_size = pool_size
+        self._lock     = threading.Lock()
+        if df is not None:
+            self.load_table("sales", df)
+
+    # ── Setup ─────────────────────────────────────────────────────────────────
+
+    def load_table(self, name: str, df: pd.DataFrame) -> None:
+        """(Re)create table `name` from a DataFrame as a native DuckDB table."""
+        with self._lock:
+            self._con.register("_load_src", df)
+            self._con.execute(f'CREATE OR REPLACE TABLE "{name}" AS SELECT * FROM _load_src')
+            self._con.unregister("_load_src")
+        logger.info("SalesEngine: loaded table %s (%d rows)", name, len(df))
+
+    def execute(self, statement: str, frames: Optional[dict] = None) -> None:
+        """
+        Run a setup / write statement (CREATE VIEW, INSERT, COPY, ...) on the
+        shared database. frames (name → DataFrame) are registered for the
+        duration of the statement.
+        """
+        with self._lock:
+            for name, df in (frames or {}).items():
+                self._con.register(name, df)
+            try:
+                self._con.execute(statement)
+            finally:
+                for name in frames or {}:
+                    self._con.unregister(name)
+
+    def register_query(self, name: str, sql: str) -> None:
+        """
+        Register a query shape. Use $1..$n placeholders; it is prepared
+        lazily, once per pooled cursor.
+        """
+        self._queries[name] = sql
+
+    @contextmanager
+    def _checkout(self):
+        """Borrow an idle (cursor, prepared) pair, creating one while under pool_size."""
+        try:
+            entry = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                entry = None
+                if self._created < self.pool_size:
+                    entry = (self._con.cursor(), set())
+                    self._created += 1
+            if entry is None:
+                entry = self._pool.get()
+        try:
+            yield entry
+        finally:
+            self._pool.put(entry)
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def arrow(self, name: str, params: list) -> pa.Table:
+        """Run a registered query; returns an Arrow table."""
+        args = ", ".join(_sql_literal(p) for p in params)
+        with self._checkout() as (cursor, prepared):
+            if name not in prepared:
+                cursor.execute(f"PREPARE {name} AS {self._queries[name]}")
+                prepared.add(name)
+            return cursor.execute(f"EXECUTE {name}({args})").fetch_arrow_table()
+
+    def records(self, name: str, params: list) -> list[dict]:
+        """Run a registered query; returns a list of row dicts."""
+        return self.arrow(name, params).to_pylist()
+
+    def sql(self, sql: str, params: Optional[list] = None) -> pa.Table:
+        """Ad-hoc parameterised query (? placeholders), fetched as Arrow."""
+        with self._checkout() as (cursor, _):
+            return cursor.execute(sql, params or []).fetch_arrow_table()
@@ -0,0 +1,285 @@
+"""
+cmn/tools/tool/sales/forecast.py
+================================
+Vectorized forecasting engine behind the sales_forecast tool.
+
+Every method fits a whole matrix of series at once: Y has one column per
+series (metric, or metric × region / category) and one row per month, so
+asking for five metrics across four regions is still a single pass of
+NumPy array operations instead of twenty model fits.
+
+Methods
+-------
+linear          : least-squares trend y = intercept + slope · month, solved
+                  in closed form for all columns; missing months (NaN) are
+                  masked out per column
+seasonal_naive  : each future month repeats the same calendar month of the
+                  last observed season (needs ≥ 1 season of data; R² is
+                  NaN until a second season allows an in-sample score)
+holt_winters    : additive Holt-Winters (level + trend + season). Smoothing
+                  parameters are chosen per column by a grid search that is
+                  evaluated for all grid points and columns in one loop over
+                  time (needs ≥ 2 seasons; falls back to seasonal_naive)
+
+Fits are cached by a fingerprint of (method, months, values), so repeating a
+forecast for the same data — e.g. a different horizon — skips fitting.
+
+Usage
+-----
+    engine = ForecastEngine.default()
+    fit    = engine.fit(months, Y, method="linear")     # Y: (n_months, n_series)
+    fit.predict(3)                                     # → (3, n_series)
+    fit.slope, fit.intercept, fit.r2                   # per series
+"""
+
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+
+LINEAR         = "linear"
+SEASONAL_NAIVE = "seasonal_naive"
+HOLT_WINTERS   = "holt_winters"
+METHODS        = (LINEAR, SEASONAL_NAIVE, HOLT_WINTERS)
+
+SEASON = 12
+
+# Holt-Winters smoothing grid (alpha, beta, gamma) — 48 combinations
+_HW_GRID = np.array(list(itertools.product(
+    (0.1, 0.3, 0.5, 0.8),
+    (0.01, 0.1, 0.3),
+    (0.05, 0.2, 0.4, 0.7),
+)))
+
+
+################################################################################
+# SECTION: Fit
+################################################################################
+
+@dataclass
+class Fit:
+    """
+    A fitted model for k series. slope / intercept / r2 have shape (k,);
+    for the seasonal methods slope is the trend per month and intercept
+    the level at the last observed month. r2 is NaN where the method
+    could not be scored in-sample.
+    """
+    method:    str
+    x_last:    int
+    slope:     np.ndarray
+    intercept: np.ndarray
+    r2:        np.ndarray
+    params:    dict = field(default_factory=dict)   # method-specific state
+
+    def predict(self, periods: int) -> np.ndarray:
+        """Forecast the next `periods` months for every series → (periods, k)."""
+        h = np.arange(1, periods + 1)[:, None]
+
+        if self.method == LINEAR:
+            return self.intercept + self.slope * (self.x_last + h)
+
+        last_season = self.params["season"]                 # (SEASON, k)
+        if self.method == SEASONAL_NAIVE:
+            return last_season[(h[:, 0] - 1) % SEASON]
+
+        # Holt-Winters: level + h·trend + season of the target month
+        return self.intercept + h * self.slope + last_season[(h[:, 0] - 1) % SEASON]
+
+
+def _r2(Y: np.ndarray, fitted: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Masked, column-wise R² (1.0 for a perfectly fitted constant series)."""
+    n      = np.maximum(mask.sum(axis=0), 1)
+    mean   = np.where(mask, Y, 0).sum(axis=0) / n
+    ss_res = np.where(mask, (Y - fitted) ** 2, 0).sum(axis=0)
+    ss_tot = np.where(mask, (Y - mean) ** 2, 0).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = 1 - ss_res / ss_tot
+    return np.where(ss_tot > 0, r2, np.where(ss_res == 0, 1.0, 0.0))
+
+
+################################################################################
+# SECTION: Methods
+################################################################################
+
+def fit_linear(x: np.ndarray, Y: np.ndarray) -> Fit:
+    """Closed-form least squares per column, ignoring NaN cells."""
+    mask = ~np.isnan(Y)
+    w    = mask.astype(float)
+    Yz   = np.where(mask, Y, 0.0)
+    xc   = x[:, None]
+
+    sw  = w.sum(axis=0)
+    sx  = (w * xc).sum(axis=0)
+    sxx = (w * xc ** 2).sum(axis=0)
+    sy  = Yz.sum(axis=0)
+    sxy = (Yz * xc).sum(axis=0)
+
+    denom = sw * sxx - sx ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope     = np.where(denom != 0, (sw * sxy - sx * sy) / denom, 0.0)
+        intercept = np.where(sw > 0, (sy - slope * sx) / sw, 0.0)
+
+    fitted = intercept + slope * xc
+    return Fit(LINEAR, int(x[-1]), slope, intercept, _r2(Y, fitted, mask))
+
+
+def _fill_gaps(x: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    """Replace NaN cells by the column's linear trend (seasonal methods need full rows)."""
+    if not np.isnan(Y).any():
+        return Y
+    trend = fit_linear(x, Y)
+    return np.where(np.isnan(Y), trend.intercept + trend.slope * x[:, None], Y)
+
+
+def fit_seasonal_naive(x: np.ndarray, Y: np.ndarray) -> Fit:
+    Y      = _fill_gaps(x, Y)
+    trend  = fit_linear(x, Y)
+    # In-sample: each month predicted by the same month one season earlier.
+    # With a single season there is nothing to score — the trend's R² would
+    # describe a different model.
+    fitted = np.full_like(Y, np.nan)
+    fitted[SEASON:] = Y[:-SEASON]
+    mask   = ~np.isnan(fitted)
+    r2     = _r2(Y, fitted, mask) if mask.any() else np.full(Y.shape[1], np.nan)
+    return Fit(SEASONAL_NAIVE, int(x[-1]), trend.slope, Y[-1], r2,
+               {"season": Y[-SEASON:]})
+
+
+def fit_holt_winters(x: np.ndarray, Y: np.ndarray) -> Fit:
+    """
+    Additive Holt-Winters with (alpha, beta, gamma) picked per column from
+    _HW_GRID by one-step-ahead SSE. State arrays have shape (grid, k), so
+    all grid points and columns advance together, one month at a time.
+    """
+    Y     = _fill_gaps(x, Y)
+    n, k  = Y.shape
+    g     = len(_HW_GRID)
+    alpha = _HW_GRID[:, 0:1]
+    beta  = _HW_GRID[:, 1:2]
+    gamma = _HW_GRID[:, 2:3]
+
+    # Initial state from the first two seasons; seasonal indices are the
+    # first season's deviations from its own (detrended) mean
+    first, second = Y[:SEASON].mean(axis=0), Y[SEASON:2 * SEASON].mean(axis=0)
+    slope0  = (second - first) / SEASON
+    ramp    = (np.arange(SEASON) - (SEASON - 1) / 2)[:, None] * slope0
+    season0 = Y[:SEASON] - first - ramp
+    level   = np.broadcast_to(first - slope0 * (SEASON + 1) / 2, (g, k)).copy()
+    trend   = np.broadcast_to(slope0, (g, k)).copy()
+    season  = np.broadcast_to(season0[:, None, :], (SEASON, g, k)).copy()
+    sse    = np.zeros((g, k))
+    preds  = np.empty((n, g, k))
+
+    for t in range(n):
+        s          = season[t % SEASON]
+        preds[t]   = level + trend + s
+        sse       += (Y[t] - preds[t]) ** 2
+        new_level  = alpha * (Y[t] - s) + (1 - alpha) * (level + trend)
+        trend      = beta * (new_level - level) + (1 - beta) * trend
+        season[t % SEASON] = gamma * (Y[t] - new_level) + (1 - gamma) * s
+        level      = new_level
+
+    best = sse.argmin(axis=0)                        # (k,)
+    cols = np.arange(k)
+    # Seasonal components ordered so row j is the season for step j + 1
+    order  = (n + np.arange(SEASON)) % SEASON
+    fitted = preds[:, best, cols]
+    return Fit(
+        HOLT_WINTERS, int(x[-1]),
+        slope     = trend[best, cols],
+        intercept = level[best, cols],
+        r2        = _r2(Y, fitted, np.ones_like(Y, dtype=bool)),
+        params    = {
+            "season": season[order][:, best, cols],
+            "alpha":  _HW_GRID[best, 0],
+            "beta":   _HW_GRID[best, 1],
+            "gamma":  _HW_GRID[best, 2],
+        },
+    )
+
+
+################################################################################
+# SECTION: Engine
+################################################################################
+
+class ForecastEngine:
+    """
+    Dispatches to the fit functions and keeps an LRU cache of fitted models
+    keyed by a fingerprint of the input. Thread-safe.
+    """
+
+    _default      = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._fits       = OrderedDict()
+        self._lock       = threading.Lock()
+        self.hits        = 0
+        self.misses      = 0
+
+    @classmethod
+    def default(cls) -> "ForecastEngine":
+        """The process-wide engine (created on first use)."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @staticmethod
+    def fingerprint(method: str, x: np.ndarray, Y: np.ndarray) -> str:
+        digest = hashlib.sha256(method.encode())
+        digest.update(np.ascontiguousarray(x, dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(Y, dtype=float).tobytes())
+        digest.update(repr(Y.shape).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def resolve_method(method: str, n_months: int) -> str:
+        """The method that will actually run for n_months of history."""
+        if method == HOLT_WINTERS and n_months < 2 * SEASON:
+            method = SEASONAL_NAIVE
+        if method == SEASONAL_NAIVE and n_months < SEASON:
+            method = LINEAR
+        return method
+
+    def fit(self, x, Y, method: str = LINEAR) -> Fit:
+        """
+        Fit every column of Y (n_months × k) against months x (n_months,).
+        Months must be consecutive for the seasonal methods.
+        Raises ValueError for an unknown method.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown forecast method: {method}")
+        x = np.asarray(x, dtype=float)
+        Y = np.asarray(Y, dtype=float).reshape(len(x), -1)
+        method = self.resolve_method(method, len(x))
+
+        key = self.fingerprint(method, x, Y)
+        with self._lock:
+            fit = self._fits.get(key)
+            if fit is not None:
+                self._fits.move_to_end(key)
+                self.hits += 1
+                return fit
+            self.misses += 1
+
+        fit = {LINEAR: fit_linear, SEASONAL_NAIVE: fit_seasonal_naive,
+               HOLT_WINTERS: fit_holt_winters}[method](x, Y)
+
+        with self._lock:
+            self._fits[key] = fit
+            while len(self._fits) > self.max_entries:
+                self._fits.popitem(last=False)
+        return fit
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fits.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._fits), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,138 @@
+"""
+cmn/tools/tool/sales/generate.py
+================================
+Synthetic sales data generator for the Parquet-backed sales store.
+
+Writes Hive-partitioned Parquet (sales/year=YYYY/month=M/*.parquet) with the
+same columns as the mock frame in bedrock_converse_tools_tool_sales.py, so
+ParquetSalesStore and benchmarks can run at 1M / 10M / 100M rows.
+
+Generation runs entirely inside DuckDB (range() + hash()), so it is
+deterministic for a given seed and needs no pandas memory. Each random
+column hashes its own value (i * 8 + salt + column): multi-argument
+hash() results share their low bits, which would correlate the columns.
+
+Usage
+-----
+    python -m cmn.tools.tool.sales.generate --rows 10_000_000 --out data/sales
+
+    from cmn.tools.tool.sales.generate import generate_sales_parquet
+    generate_sales_parquet("data/sales", rows=1_000_000)
+"""
+
+import argparse
+import logging
+import os
+import time
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+REGIONS    = ["North", "South"]
+CATEGORIES = ["Electronics", "Accessories"]
+
+_GENERATE_SQL = """
+    WITH base AS (
+        SELECT
+            {first_year} + (i % {years})                                            AS year,
+            1 + ((i // {years}) % 12)                                               AS month,
+            {regions}[(1 + hash(i * 8 + {salt} + 1) % {n_regions})::BIGINT]       AS region,
+            {categories}[(1 + hash(i * 8 + {salt} + 2) % {n_categories})::BIGINT] AS category,
+            1 + hash(i * 8 + {salt} + 3) % 20                                       AS units_sold,
+            (0.8 + (hash(i * 8 + {salt} + 4) % 400) / 1000.0)                       AS noise,
+            hash(i * 8 + {salt} + 5) % 100                                          AS return_roll
+        FROM range({rows}) t(i)
+    ),
+    priced AS (
+        SELECT
+            year,
+            month,
+            region,
+            category,
+            units_sold::BIGINT                                 AS units_sold,
+            (CASE WHEN return_roll < 6 THEN 1 ELSE 0 END)::BIGINT AS returns,
+            -- seasonal curve: slow first half, Q4 peak
+            round((CASE WHEN category = 'Electronics' THEN 300 ELSE 140 END)
+                  * units_sold * noise
+                  * (1 + 0.6 * power(month / 12.0, 3)))::BIGINT AS revenue,
+            (CASE WHEN category = 'Electronics' THEN 0.6 ELSE 0.5 END) AS cost_ratio
+        FROM base
+    ),
+    costed AS (
+        SELECT *, round(revenue * cost_ratio)::BIGINT AS cogs FROM priced
+    )
+    SELECT
+        year,
+        month,
+        revenue,
+        units_sold,
+        returns,
+        cogs,
+        region,
+        category,
+        revenue - cogs                                         AS gross_profit,
+        round((revenue - cogs) / revenue * 100, 2)::DOUBLE     AS profit_margin,
+        revenue - returns * (revenue / units_sold)             AS net_revenue,
+        strftime(make_date(year::INT, month::INT, 1), '%B')    AS month_name
+    FROM costed
+"""
+
+
+def _list_literal(values: list[str]) -> str:
+    return "[" + ", ".join("'" + v.replace("'", "''") + "'" for v in values) + "]"
+
+
+def generate_sales_parquet(
+    root:       str,
+    rows:       int,
+    first_year: int = 2023,
+    years:      int = 2,
+    seed:       int = 42,
+) -> str:
+    """
+    Write `rows` synthetic sales rows under root/sales, partitioned by
+    year and month. Existing files in root/sales are replaced.
+    Returns the sales directory.
+    """
+    sales_dir = os.path.join(root, "sales")
+    os.makedirs(root, exist_ok=True)
+
+    sql = _GENERATE_SQL.format(
+        first_year   = first_year,
+        years        = years,
+        salt         = seed * 1_000_003,
+        rows         = rows,
+        regions      = _list_literal(REGIONS),
+        categories   = _list_literal(CATEGORIES),
+        n_regions    = len(REGIONS),
+        n_categories = len(CATEGORIES),
+    )
+
+    start = time.perf_counter()
+    con   = duckdb.connect()
+    con.execute(
+        f"COPY ({sql}) TO '{sales_dir}' "
+        f"(FORMAT parquet, PARTITION_BY (year, month), OVERWRITE_OR_IGNORE, "
+        f"ROW_GROUP_SIZE 122880)"
+    )
+    con.close()
+    logger.info("Generated %d sales rows in %s (%.1fs)",
+                rows, sales_dir, time.perf_counter() - start)
+    return sales_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic sales Parquet data.")
+    parser.add_argument("--rows",  type=lambda v: int(v.replace("_", "")), default=1_000_000)
+    parser.add_argument("--out",   default="data/sales_parquet")
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--seed",  type=int, default=42)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    generate_sales_parquet(args.out, args.rows, years=args.years, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
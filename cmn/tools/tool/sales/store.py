@@ -0,0 +1,488 @@
+"""
+cmn/tools/tool/sales/store.py
+=============================
+Pluggable data backends for the sales tools (sales_data,
+sales_anomaly_detector, product_query).
+
+All backends expose the same tables to one SalesEngine — `sales`,
+`products`, `product_colors` — and share the same prepared query shapes,
+so the tools do not know where the rows live.
+
+Backends
+--------
+InMemorySalesStore   : the built-in mock frames, loaded as native tables
+                       (default, what the tools always used)
+ParquetSalesStore    : Hive-partitioned Parquet written by
+                       cmn/tools/tool/sales/generate.py:
+                           root/sales/year=YYYY/month=M/*.parquet
+                           root/products.parquet        (optional)
+                           root/product_colors.parquet  (optional)
+
+Rollup cube
+-----------
+By default each store materialises `sales_cube`: one row per
+year × month × region × category plus every region / category subtotal
+('all' in the rolled-up column), keyed by a primary key on those four
+columns. sales_data and sales_anomaly_detector then read a few hundred
+pre-aggregated rows instead of scanning the raw data; rollup=False keeps
+the raw aggregation (used by benchmarks/bench_sales.py for comparison).
+
+The cube is built once per store and refreshed incrementally: append()
+(and, for Parquet, refresh() after files were added externally) aggregates
+only the new rows and upserts them into the cube with
+INSERT ... ON CONFLICT DO UPDATE, adding to the existing sums. Averages
+are kept as sum + count so they stay exact under merges.
+
+Parquet scans
+-------------
+`sales` is a view over read_parquet(..., hive_partitioning=true). year and
+month come from the directory names, so the year / month filters of every
+query prune whole partitions before any file is opened; region / category
+filters are pushed into the scan and skip row groups by their min/max
+statistics. The Parquet metadata cache keeps footers of already-seen files
+in memory, so repeated queries only read the column chunks they need.
+
+Ad-hoc SQL
+----------
+query() (product_query — SQL written by the LLM) never runs on the store's
+database. It uses a separate in-memory sandbox holding copies of
+`products` and `product_colors` only, opened with external access
+(files, COPY, ATTACH, extensions) disabled and the configuration locked.
+
+Usage
+-----
+    store = default_store()            # env SALES_PARQUET_ROOT → Parquet
+    store.monthly(2024, "all", "North")
+    store.monthly_series(2024, group_by=("region",))
+    store.append(new_rows_df)          # rows + cube delta
+
+    SalesBedrockConverseTool(store=ParquetSalesStore("data/sales_parquet"))
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from cmn.tools.tool.sales.engine import SalesEngine
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("revenue", "units_sold", "returns", "gross_profit", "net_revenue")
+
+# Tables copied into the ad-hoc SQL sandbox
+CATALOG_TABLES = ("products", "product_colors")
+
+_SANDBOX_CONFIG = {"enable_external_access": False, "lock_configuration": True}
+
+
+################################################################################
+# SECTION: Query Shapes
+################################################################################
+
+# Optional filters are written as ($n = 'all' OR col = $n) so each query
+# type is a single prepared statement. Sums are cast to BIGINT so Arrow
+# returns plain ints rather than HUGEINT decimals.
+
+_MONTHLY_SQL = """
+    SELECT
+        year,
+        month,
+        month_name,
+        SUM(revenue)::BIGINT                       AS revenue,
+        SUM(units_sold)::BIGINT                    AS units_sold,
+        SUM(returns)::BIGINT                       AS returns,
+        SUM(gross_profit)::BIGINT                  AS gross_profit,
+        ROUND(AVG(profit_margin), 2)               AS profit_margin_pct,
+        ROUND(SUM(net_revenue),   2)               AS net_revenue,
+        SUM(SUM(revenue)) OVER (ORDER BY month)::BIGINT AS ytd_revenue
+    FROM sales
+    WHERE year = $1
+      AND ($2 = 'all' OR category = $2)
+      AND ($3 = 'all' OR region   = $3)
+    GROUP BY year, month, month_name
+    ORDER BY month
+"""
+
+# One row per region × category — identical to the raw rows for the mock
+# data, and bounded in size for generated data with many rows per month.
+_BY_MONTH_SQL = """
+    SELECT
+        year,
+        month,
+        month_name,
+        region,
+        category,
+        SUM(revenue)::BIGINT          AS revenue,
+        SUM(units_sold)::BIGINT       AS units_sold,
+        SUM(returns)::BIGINT          AS returns,
+        SUM(gross_profit)::BIGINT     AS gross_profit,
+        ROUND(AVG(profit_margin), 2)  AS profit_margin,
+        ROUND(SUM(net_revenue), 2)    AS net_revenue
+    FROM sales
+    WHERE year = $1
+      AND month = $2
+      AND ($3 = 'all' OR category = $3)
+      AND ($4 = 'all' OR region   = $4)
+    GROUP BY year, month, month_name, region, category
+    ORDER BY region, category
+"""
+
+# Every metric per month, one row per series. $4 / $5 (booleans) split the
+# series by region / category; otherwise the column holds the filter value.
+_SERIES_SQL = """
+    SELECT
+        month,
+        month_name,
+        CASE WHEN $4 THEN region   ELSE $2 END AS region,
+        CASE WHEN $5 THEN category ELSE $3 END AS category,
+        SUM(revenue)::DOUBLE       AS revenue,
+        SUM(units_sold)::DOUBLE    AS units_sold,
+        SUM(returns)::DOUBLE       AS returns,
+        SUM(gross_profit)::DOUBLE  AS gross_profit,
+        SUM(net_revenue)::DOUBLE   AS net_revenue
+    FROM sales
+    WHERE year = $1
+      AND ($2 = 'all' OR region   = $2)
+      AND ($3 = 'all' OR category = $3)
+    GROUP BY 1, 2, 3, 4
+    ORDER BY region, category, month
+"""
+
+
+# ── Rollup cube ───────────────────────────────────────────────────────────────
+
+_CUBE_DDL = """
+    CREATE OR REPLACE TABLE sales_cube (
+        year          BIGINT,
+        month         BIGINT,
+        month_name    VARCHAR,
+        region        VARCHAR,
+        category      VARCHAR,
+        revenue       BIGINT,
+        units_sold    BIGINT,
+        returns       BIGINT,
+        gross_profit  BIGINT,
+        net_revenue   DOUBLE,
+        margin_sum    DOUBLE,
+        row_count     BIGINT,
+        PRIMARY KEY (year, month, region, category)
+    )
+"""
+
+# Aggregates {source} over every region / category grouping and adds the
+# result to the cube. Each key appears once per statement, as ON CONFLICT
+# DO UPDATE requires.
+_CUBE_MERGE_SQL = """
+    INSERT INTO sales_cube
+    SELECT
+        year,
+        month,
+        ANY_VALUE(month_name),
+        COALESCE(region,   'all'),
+        COALESCE(category, 'all'),
+        SUM(revenue)::BIGINT,
+        SUM(units_sold)::BIGINT,
+        SUM(returns)::BIGINT,
+        SUM(gross_profit)::BIGINT,
+        SUM(net_revenue)::DOUBLE,
+        SUM(profit_margin)::DOUBLE,
+        COUNT(*)
+    FROM {source}
+    GROUP BY GROUPING SETS (
+        (year, month, region, category),
+        (year, month, region),
+        (year, month, category),
+        (year, month)
+    )
+    ON CONFLICT (year, month, region, category) DO UPDATE SET
+        revenue      = revenue      + EXCLUDED.revenue,
+        units_sold   = units_sold   + EXCLUDED.units_sold,
+        returns      = returns      + EXCLUDED.returns,
+        gross_profit = gross_profit + EXCLUDED.gross_profit,
+        net_revenue  = net_revenue  + EXCLUDED.net_revenue,
+        margin_sum   = margin_sum   + EXCLUDED.margin_sum,
+        row_count    = row_count    + EXCLUDED.row_count
+"""
+
+# Same result columns as the raw shapes above; filters become key lookups
+# because subtotals are stored under region / category = 'all'.
+_CUBE_MONTHLY_SQL = """
+    SELECT
+        year,
+        month,
+        month_name,
+        revenue,
+        units_sold,
+        returns,
+        gross_profit,
+        ROUND(margin_sum / row_count, 2)           AS profit_margin_pct,
+        ROUND(net_revenue, 2)                      AS net_revenue,
+        SUM(revenue) OVER (ORDER BY month)::BIGINT AS ytd_revenue
+    FROM sales_cube
+    WHERE year = $1
+      AND category = $2
+      AND region   = $3
+    ORDER BY month
+"""
+
+_CUBE_BY_MONTH_SQL = """
+    SELECT
+        year,
+        month,
+        month_name,
+        region,
+        category,
+        revenue,
+        units_sold,
+        returns,
+        gross_profit,
+        ROUND(margin_sum / row_count, 2)  AS profit_margin,
+        ROUND(net_revenue, 2)             AS net_revenue
+    FROM sales_cube
+    WHERE year = $1
+      AND month = $2
+      AND region   <> 'all'
+      AND category <> 'all'
+      AND ($3 = 'all' OR category = $3)
+      AND ($4 = 'all' OR region   = $4)
+    ORDER BY region, category
+"""
+
+_CUBE_SERIES_SQL = """
+    SELECT
+        month,
+        month_name,
+        region,
+        category,
+        revenue::DOUBLE       AS revenue,
+        units_sold::DOUBLE    AS units_sold,
+        returns::DOUBLE       AS returns,
+        gross_profit::DOUBLE  AS gross_profit,
+        net_revenue           AS net_revenue
+    FROM sales_cube
+    WHERE year = $1
+      AND (region   = $2 OR ($4 AND $2 = 'all'))
+      AND (category = $3 OR ($5 AND $3 = 'all'))
+      AND (NOT $4 OR region   <> 'all')
+      AND (NOT $5 OR category <> 'all')
+    ORDER BY region, category, month
+"""
+
+
+################################################################################
+# SECTION: Stores
+################################################################################
+
+class SalesStore:
+    """
+    Base class: owns a SalesEngine whose `sales`, `products` and
+    `product_colors` relations are set up by the subclass, and — with
+    rollup=True — the `sales_cube` built from them.
+    """
+
+    backend = "base"
+
+    def __init__(self, engine: Optional[SalesEngine] = None, rollup: bool = True,
+                 rollup_source: str = "sales"):
+        self.engine        = engine or SalesEngine()
+        self.rollup        = rollup
+        self._sandbox      = None
+        self._sandbox_lock = threading.Lock()
+
+        if rollup:
+            start = time.perf_counter()
+            self.engine.execute(_CUBE_DDL)
+            self._merge_rollup(rollup_source)
+            logger.info("%s: built sales_cube in %.0fms",
+                        type(self).__name__, (time.perf_counter() - start) * 1000)
+
+        monthly, by_month, series = (
+            (_CUBE_MONTHLY_SQL, _CUBE_BY_MONTH_SQL, _CUBE_SERIES_SQL) if rollup
+            else (_MONTHLY_SQL, _BY_MONTH_SQL, _SERIES_SQL)
+        )
+        self.engine.register_query("sales_monthly",  monthly)
+        self.engine.register_query("sales_by_month", by_month)
+        self.engine.register_query("sales_series",   series)
+
+    # ── Rollup ────────────────────────────────────────────────────────────────
+
+    def _merge_rollup(self, source: str, frames: Optional[dict] = None) -> None:
+        """Aggregate the rows of relation `source` into sales_cube."""
+        self.engine.execute(_CUBE_MERGE_SQL.format(source=source), frames)
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Add rows (same columns as `sales`) and fold them into the cube."""
+        raise NotImplementedError(f"{type(self).__name__} is read-only")
+
+    # ── Sales ─────────────────────────────────────────────────────────────────
+
+    def monthly(self, year: int, category: str = "all", region: str = "all") -> list[dict]:
+        """All months of a year, aggregated across region × category."""
+        return self.engine.records("sales_monthly", [year, category, region])
+
+    def by_month(self, year: int, month: int,
+                 category: str = "all", region: str = "all") -> list[dict]:
+        """One month broken down by region × category."""
+        return self.engine.records("sales_by_month", [year, month, category, region])
+
+    def monthly_series(self, year: int, region: str = "all", category: str = "all",
+                       group_by: tuple = ()) -> pa.Table:
+        """
+        Monthly sums of every metric (as DOUBLE), one series per
+        region / category value when listed in group_by, else one series
+        for the filter. Arrow columns: month, month_name, region, category,
+        *METRICS — ordered by series, then month.
+        """
+        return self.engine.arrow("sales_series", [
+            year, region, category, "region" in group_by, "category" in group_by,
+        ])
+
+    # ── Ad-hoc SQL ────────────────────────────────────────────────────────────
+
+    def _catalog(self) -> SalesEngine:
+        """The ad-hoc SQL sandbox, built on first use."""
+        with self._sandbox_lock:
+            if self._sandbox is None:
+                sandbox = SalesEngine(config=_SANDBOX_CONFIG)
+                for table in CATALOG_TABLES:
+                    sandbox.load_table(table, self.engine.sql(f"SELECT * FROM {table}").to_pandas())
+                self._sandbox = sandbox
+            return self._sandbox
+
+    def query(self, sql: str) -> list[dict]:
+        """
+        Run a single read-only statement (product_query) as records, in the
+        sandbox — sales data and files are out of reach.
+        DECIMAL columns (e.g. SUM of integers) come back as floats so the
+        result stays JSON-serialisable.
+        """
+        table = self._catalog().sql(sql)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_decimal(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+        return table.to_pylist()
+
+
+class InMemorySalesStore(SalesStore):
+    """The built-in mock sales and product frames as native DuckDB tables."""
+
+    backend = "memory"
+
+    def __init__(self, rollup: bool = True):
+        # Imported here: the tool modules import this module at load time
+        from cmn.tools.tool.bedrock_converse_tools_tool_sales   import _build_mock_sales
+        from cmn.tools.tool.bedrock_converse_tools_tool_product import _build_mock_products
+        products, product_colors = _build_mock_products()
+        engine = SalesEngine(_build_mock_sales())
+        engine.load_table("products",       products)
+        engine.load_table("product_colors", product_colors)
+        super().__init__(engine, rollup)
+
+    def append(self, df: pd.DataFrame) -> None:
+        self.engine.execute("INSERT INTO sales BY NAME SELECT * FROM _append_src",
+                            {"_append_src": df})
+        if self.rollup:
+            self._merge_rollup("_append_src", {"_append_src": df})
+
+
+class ParquetSalesStore(SalesStore):
+    """
+    Hive-partitioned Parquet under root (see generate.py). Product tables
+    fall back to the mock frames when root has no products*.parquet.
+
+    The cube remembers which files it has aggregated; refresh() folds in
+    files added since (by append() or an external writer).
+    """
+
+    backend = "parquet"
+
+    def __init__(self, root: str, rollup: bool = True):
+        self.sales_dir = os.path.join(root, "sales")
+        if not os.path.isdir(self.sales_dir):
+            raise FileNotFoundError(f"No sales partitions under {self.sales_dir}")
+        self.root  = root
+        self._glob = self._path(self.sales_dir, "*", "*", "*.parquet")
+
+        engine = SalesEngine()
+        engine.execute("SET enable_object_cache = true")
+        engine.execute("CREATE OR REPLACE VIEW sales AS SELECT * FROM read_parquet("
+                       f"'{self._glob}', hive_partitioning = true)")
+
+        missing = []
+        for table in ("products", "product_colors"):
+            path = os.path.join(root, f"{table}.parquet")
+            if os.path.exists(path):
+                engine.execute(f"CREATE OR REPLACE VIEW {table} AS "
+                               f"SELECT * FROM read_parquet('{self._path(path)}')")
+            else:
+                missing.append(table)
+        if missing:
+            from cmn.tools.tool.bedrock_converse_tools_tool_product import _build_mock_products
+            frames = dict(zip(("products", "product_colors"), _build_mock_products()))
+            for table in missing:
+                engine.load_table(table, frames[table])
+
+        # Aggregate exactly the files listed now, so refresh() can tell new ones
+        self._files = self._list_files(engine)
+        if not self._files:
+            raise FileNotFoundError(f"No Parquet files under {self.sales_dir}")
+        super().__init__(engine, rollup, self._scan(sorted(self._files)))
+        logger.info("ParquetSalesStore: %s (%d files)", root, len(self._files))
+
+    # ── Incremental refresh ───────────────────────────────────────────────────
+
+    def _list_files(self, engine: SalesEngine) -> set:
+        return {row["file"] for row in
+                engine.sql(f"SELECT file FROM glob('{self._glob}')").to_pylist()}
+
+    def _scan(self, files: list[str]) -> str:
+        paths = ", ".join("'" + f.replace("'", "''") + "'" for f in files)
+        return f"read_parquet([{paths}], hive_partitioning = true)"
+
+    def refresh(self) -> int:
+        """Fold Parquet files added since the last build / refresh into the cube."""
+        files = self._list_files(self.engine)
+        new   = sorted(files - self._files)
+        if new and self.rollup:
+            self._merge_rollup(self._scan(new))
+        self._files |= set(new)
+        if new:
+            logger.info("ParquetSalesStore: refreshed %d new file(s)", len(new))
+        return len(new)
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Write rows as new files into their year / month partitions, then refresh()."""
+        self.engine.execute(
+            f"COPY (SELECT * FROM _append_src) TO '{self._path(self.sales_dir)}' "
+            "(FORMAT parquet, PARTITION_BY (year, month), APPEND)",
+            {"_append_src": df},
+        )
+        self.refresh()
+
+    @staticmethod
+    def _path(*parts: str) -> str:
+        return os.path.join(*parts).replace("'", "''")
+
+
+# ── Process-wide default ──────────────────────────────────────────────────────
+
+_DEFAULT      = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_store() -> SalesStore:
+    """
+    The shared store used by tools constructed without one:
+    ParquetSalesStore(env SALES_PARQUET_ROOT) if set, else InMemorySalesStore.
+    """
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            root     = os.environ.get("SALES_PARQUET_ROOT")
+            _DEFAULT = ParquetSalesStore(root) if root else InMemorySalesStore()
+        return _DEFAULT
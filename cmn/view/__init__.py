@@ -1,9 +1,11 @@
 from cmn.view.mime_constants import mime_mapping_image, mime_mapping_document
 from cmn.view.guide_constants import CONVERSE_TOOL_GUIDE
+from cmn.view.stream_sink import StreamingMarkdown
 
 
 __all__ = [
     "mime_mapping_image",
     "mime_mapping_document",
-    "CONVERSE_TOOL_GUIDE"
+    "CONVERSE_TOOL_GUIDE",
+    "StreamingMarkdown",
 ]
@@ -0,0 +1,129 @@
+"""
+cmn/view/stream_sink.py
+=======================
+Coalescing, frame-rate-limited markdown renderer for streamed LLM text.
+
+Pages used to call result_area.write(result_text) on every delta. Each call
+re-sends and re-renders the entire growing answer, which is O(n²) in the
+length of the response and floods the websocket with one message per token.
+
+StreamingMarkdown instead:
+- buffers chunks and renders at most max_fps times per second, or sooner
+  once max_pending_chars have piled up
+- freezes completed paragraphs (blank-line boundaries outside code fences)
+  into their own element, so each frame only re-sends the unfinished tail
+- flushes once more in close() so nothing is left unrendered
+- records render_ms / renders per turn
+
+Usage
+-----
+    from cmn.view.stream_sink import StreamingMarkdown
+
+    result_area = st.empty()
+    sink        = StreamingMarkdown(result_area)
+
+    for chunk in chunks:
+        sink.write(chunk)                 # or on_text_delta=sink
+    sink.close()
+
+    answer = sink.text
+    st.caption(f"render {sink.render_ms:.0f}ms / {sink.renders} frames")
+"""
+
+import time
+
+_FENCE = "```"
+
+
+class StreamingMarkdown:
+    """
+    Streams markdown into a Streamlit placeholder (st.empty() or container).
+    Callable, so it can be passed directly as on_text_delta.
+    """
+
+    def __init__(self, placeholder, max_fps: float = 12.0, max_pending_chars: int = 400):
+        self.min_interval      = 1.0 / max_fps if max_fps else 0.0
+        self.max_pending_chars = max_pending_chars
+
+        self._root             = placeholder.container()
+        self._tail             = self._root.empty()
+        self._parts            = []     # chunks not yet joined into _text
+        self._text             = ""
+        self._committed        = 0      # chars of _text frozen into elements
+        self._pending          = 0      # chars written since the last render
+        self._last_flush       = 0.0
+
+        self.render_ms         = 0.0
+        self.renders           = 0
+        self.chunks            = 0
+
+    def __call__(self, chunk: str) -> None:
+        self.write(chunk)
+
+    @property
+    def text(self) -> str:
+        if self._parts:
+            self._text += "".join(self._parts)
+            self._parts = []
+        return self._text
+
+    # ── Streaming ─────────────────────────────────────────────────────────────
+
+    def write(self, chunk: str) -> None:
+        """Buffer chunk; render if a frame is due or enough text is pending."""
+        if not chunk:
+            return
+        self._parts.append(chunk)
+        self._pending += len(chunk)
+        self.chunks   += 1
+
+        if (self._pending >= self.max_pending_chars
+                or time.monotonic() - self._last_flush >= self.min_interval):
+            self.flush()
+
+    def flush(self, suffix: str = "") -> None:
+        """
+        Render everything written so far. suffix (e.g. a stop-reason notice)
+        is shown after the text for this frame only — it is not part of text.
+        """
+        start = time.perf_counter()
+        text  = self.text
+
+        split = self._paragraph_boundary(text)
+        if split > self._committed:
+            # Final render of the finished paragraphs, then start a new tail
+            self._tail.markdown(text[self._committed:split])
+            self._tail      = self._root.empty()
+            self._committed = split
+            self.renders   += 1
+
+        tail = text[self._committed:] + suffix
+        if tail:
+            self._tail.markdown(tail)
+            self.renders += 1
+
+        self._pending     = 0
+        self._last_flush  = time.monotonic()
+        self.render_ms   += (time.perf_counter() - start) * 1000
+
+    def close(self, suffix: str = "") -> str:
+        """Final flush. Returns the full text."""
+        if self._pending or suffix:
+            self.flush(suffix)
+        return self.text
+
+    # ── Helpers ───────────────────────────────────────────────────────────────
+
+    def _paragraph_boundary(self, text: str) -> int:
+        """
+        End of the last complete paragraph after the committed prefix,
+        i.e. just past the last blank line that is not inside a code fence.
+        Returns the committed offset if there is none.
+        """
+        idx = text.rfind("\n\n", self._committed)
+        while idx != -1:
+            # Committed prefixes always end outside a fence
+            if text.count(_FENCE, self._committed, idx) % 2 == 0:
+                return idx + 2
+            idx = text.rfind("\n\n", self._committed, idx)
+        return self._committed
@@ -1,15 +1,16 @@
 import cmn_settings
-import boto3
 import os
 import logging
 from contextlib import closing
 
 from botocore.exceptions import BotoCoreError, ClientError
 
+from cmn.bedrock.client_registry import ClientRegistry
+
 AWS_REGION = cmn_settings.AWS_REGION
 
-polly = boto3.client("polly", region_name=AWS_REGION)
-comprehend = boto3.client("comprehend", region_name=AWS_REGION)
+polly = ClientRegistry.default().get("polly", AWS_REGION)
+comprehend = ClientRegistry.default().get("comprehend", AWS_REGION)
 
 language_voice_map = {
     "ja": "Mizuki",
@@ -1,4 +1,3 @@
-import boto3
 import streamlit as st
 import cmn_auth
 import cmn_settings
@@ -12,12 +11,18 @@ from typing import List, Dict
 import faiss
 import numpy as np
 import pickle
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.bedrock.rate_limiter import BATCH, RateLimiter
 
 AWS_REGION = cmn_settings.AWS_REGION
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
+bedrock_runtime = RateLimiter.default().wrap(
+    ClientRegistry.default().get('bedrock-runtime', AWS_REGION))
+# Document ingestion queues behind interactive queries for the same quota
+bedrock_runtime_batch = RateLimiter.default().wrap(
+    ClientRegistry.default().get('bedrock-runtime', AWS_REGION), priority=BATCH)
 
 # Directory to store session data
 SESSION_DATA_DIR = Path("session_data")
@@ -56,8 +61,8 @@ class SessionRAG:
             self.index = faiss.IndexFlatL2(self.dimension)
             self.metadata = []
 
-    def get_embedding(self, text: str) -> np.ndarray:
-        """Get embedding from Amazon Titan"""
+    def get_embedding(self, text: str, batch: bool = False) -> np.ndarray:
+        """Get embedding from Amazon Titan (batch=True for ingestion)"""
         try:
             body = json.dumps({
                 "inputText": text,
@@ -65,7 +70,8 @@ class SessionRAG:
                 "normalize": True
             })
 
-            response = bedrock_runtime.invoke_model(
+            client = bedrock_runtime_batch if batch else bedrock_runtime
+            response = client.invoke_model(
                 modelId=EMBEDDING_MODEL_ID,
                 body=body,
                 contentType="application/json",
@@ -82,7 +88,7 @@ class SessionRAG:
 
     def add_document(self, text: str, metadata: Dict):
         """Add document to FAISS index"""
-        embedding = self.get_embedding(text)
+        embedding = self.get_embedding(text, batch=True)
         embedding = embedding.reshape(1, -1)
 
         self.index.add(embedding)
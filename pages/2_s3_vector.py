@@ -5,6 +5,8 @@ from typing import List, Dict, Any
 import time
 from datetime import datetime
 import cmn_settings
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.bedrock.rate_limiter import BATCH, RateLimiter
 
 # ============================================================================
 # CONFIGURATION
@@ -93,7 +95,10 @@ NON_FILTERABLE_KEYS = [
 @st.cache_resource
 def get_aws_clients():
     """Initialize and cache AWS clients"""
-    bedrock_client = boto3.client("bedrock-runtime", region_name=AWS_REGION)
+    # Embedding calls (bulk ingestion and queries) draw from the shared
+    # per-model quota at batch priority
+    bedrock_client = RateLimiter.default().wrap(
+        ClientRegistry.default().get("bedrock-runtime", AWS_REGION), priority=BATCH)
     s3vectors_client = boto3.client("s3vectors", region_name=AWS_REGION)
     return bedrock_client, s3vectors_client
 
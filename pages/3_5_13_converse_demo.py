@@ -1,5 +1,4 @@
 import streamlit as st
-import boto3
 import cmn_settings
 import cmn_constants
 import cmn_security
@@ -8,6 +7,8 @@ import logging
 from io import BytesIO
 
 from cmn.bedrock_models import FoundationModel
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.view.stream_sink import StreamingMarkdown
 from datetime import datetime
 
 from botocore.exceptions import ClientError, ReadTimeoutError
@@ -33,10 +34,11 @@ logging.basicConfig(level=logging.INFO)
 
 ####################################################################################
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
-bedrock_runtime_us_west_2 = boto3.client('bedrock-runtime', region_name="us-west-2")
-cloudwatch_logs = boto3.client('logs', region_name=AWS_REGION)
-polly = boto3.client("polly", region_name=AWS_REGION)
+clients = ClientRegistry.default()
+bedrock_runtime = clients.get('bedrock-runtime', AWS_REGION)
+bedrock_runtime_us_west_2 = clients.get('bedrock-runtime', "us-west-2")
+cloudwatch_logs = clients.get('logs', AWS_REGION)
+polly = clients.get("polly", AWS_REGION)
 
 ####################################################################################
 
@@ -659,10 +661,10 @@ with main_col:
 
 
                 #with st.chat_message("assistant", avatar=setAvatar("assistant")):
-                result_text = ""
                 with st.chat_message("assistant"):
                     result_container = st.container(border=True)
                     result_area = st.empty()
+                    sink = StreamingMarkdown(result_area)
                     stream = response.get('stream')
                     for event in stream:
 
@@ -674,9 +676,7 @@ with main_col:
                         if 'contentBlockDelta' in event:
                             # .get(): newer models can emit non-text deltas
                             # (e.g. reasoning blocks) which have no 'text' key
-                            text = event['contentBlockDelta']['delta'].get('text', '')
-                            result_text += f"{text}"
-                            result_area.write(result_text)
+                            sink.write(event['contentBlockDelta']['delta'].get('text', ''))
 
                         if 'messageStop' in event:
                             #'stopReason': 'end_turn'|'tool_use'|'max_tokens'|'stop_sequence'|'content_filtered'
@@ -687,8 +687,7 @@ with main_col:
                                 stop_reason_display = stop_reason
                                 if stop_reason == 'max_tokens':
                                     stop_reason_display = "Insufficient Tokens. Increaes MaxToken Settings."
-                                result_text_error = f"{result_text}\n\n:red[Generation Stopped: {stop_reason_display}]"
-                                result_area.write(result_text_error)
+                                sink.flush(suffix=f"\n\n:red[Generation Stopped: {stop_reason_display}]")
 
                         if 'metadata' in event:
                             metadata = event['metadata']
@@ -708,20 +707,16 @@ with main_col:
 
                         if "internalServerException" in event:
                             exception = event["internalServerException"]
-                            result_text += f"\n{exception}"
-                            result_area.write(result_text)
+                            sink.write(f"\n{exception}")
                         if "modelStreamErrorException" in event:
                             exception = event["modelStreamErrorException"]
-                            result_text += f"\n{exception}"
-                            result_area.write(result_text)
+                            sink.write(f"\n{exception}")
                         if "throttlingException" in event:
                             exception = event["throttlingException"]
-                            result_text += f"\n{exception}"
-                            result_area.write(result_text)
+                            sink.write(f"\n{exception}")
                         if "validationException" in event:
                             exception = event["validationException"]
-                            result_text += f"\n{exception}"
-                            result_area.write(result_text)
+                            sink.write(f"\n{exception}")
 
                     #col1, col2, col3 = st.columns([1,1,5])
 
@@ -735,6 +730,8 @@ with main_col:
                     #    #st.markdown('3')
                     #    pass
 
+                    result_text = sink.close()
+
                 message_assistant_latest = {"role": "assistant", "content": [{ "text": result_text }]}
 
                 st.session_state.menu_converse_messages.append(message_user_latest)
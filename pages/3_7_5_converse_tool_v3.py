@@ -136,10 +136,12 @@ import pandas as pd
 
 from cmn.view.mime_constants import mime_mapping_image, mime_mapping_document
 from cmn.view import CONVERSE_TOOL_GUIDE
+from cmn.view.stream_sink import StreamingMarkdown
 from cmn.view.processor.file_uploader_chat import render_file_uploader
 
-from cmn.bedrock.converse import ConversationManager, StreamResult
+from cmn.bedrock.converse import ConversationManager, ContextWindowManager, StreamResult
 from cmn.bedrock.client_manager import BedrockClientFactory
+from cmn.bedrock.rate_limiter import RateLimiter
 
 #from cmn.bedrock_converse_tools import CalculatorBedrockConverseTool
 #from cmn.bedrock_converse_tools_acronym import AcronymBedrockConverseTool
@@ -180,12 +182,12 @@ from cmn.tools.renderer import (
     PptxToolRenderer,
     PdfToolRenderer,
 )
-from cmn.tools.tool import ToolRegistry
+from cmn.tools.tool import ResultStore, ToolExecutor, ToolMetrics, ToolRegistry, ToolResultCache
 #from cmn.tools.tool import DateTimeBedrockConverseTool, HolidayBedrockConverseTool
 #from cmn.tools.tool import AwsDocsBedrockConverseTool
-from cmn.tools.tool import EDAProfileBedrockConverseTool
-from cmn.tools.tool import EDACorrelationBedrockConverseTool
-from cmn.tools.tool import EDAGroupBedrockConverseTool
+#from cmn.tools.tool import EDAProfileBedrockConverseTool
+#from cmn.tools.tool import EDACorrelationBedrockConverseTool
+#from cmn.tools.tool import EDAGroupBedrockConverseTool
 #from cmn.tools.tool import CalculatorBedrockConverseTool
 #from cmn.tools.tool import PptxBedrockConverseTool
 #from cmn.tools.tool import PdfBedrockConverseTool
@@ -193,6 +195,7 @@ from cmn.tools.tool import EDAGroupBedrockConverseTool
 
 AWS_REGION = cmn_settings.AWS_REGION
 MAX_MESSAGES = 100 * 2
+MAX_INPUT_TOKENS = 150_000
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -211,6 +214,10 @@ class InvocationStat:
     output_tokens: int = 0
     total_tokens:  int = 0
     latency_ms:    int = 0
+    cache_read:    int = 0
+    cache_write:   int = 0
+    ttft_ms:       float = 0.0
+    render_ms:     float = 0.0
     llm_calls:     int = 0
     tools_called:  list = field(default_factory=list)
 
@@ -220,6 +227,10 @@ class InvocationStat:
         self.output_tokens += m.output_tokens
         self.total_tokens  += m.total_tokens
         self.latency_ms    += m.latency_ms
+        self.cache_read    += m.cache_read_input_tokens
+        self.cache_write   += m.cache_write_input_tokens
+        if self.llm_calls == 0:
+            self.ttft_ms    = m.ttft_ms     # client-side TTFT of the turn
         self.llm_calls     += 1
 
     def record_tool(self, tool_name: str) -> None:
@@ -229,8 +240,13 @@ class InvocationStat:
         lines = [
             f"🔢 in={self.input_tokens} out={self.output_tokens} "
             f"total={self.total_tokens} latency={self.latency_ms}ms "
+            f"ttft={self.ttft_ms:.0f}ms "
             f"calls={self.llm_calls}"
         ]
+        if self.render_ms:
+            lines.append(f"🖥️ render={self.render_ms:.0f}ms")
+        if self.cache_read or self.cache_write:
+            lines.append(f"🗄️ cache read={self.cache_read} write={self.cache_write}")
         if self.tools_called:
             lines.append(f"🔧 tools: {', '.join(f'`{n}`' for n in self.tools_called)}")
         return "  \n".join(lines)
@@ -692,7 +708,11 @@ def get_tool_registry():
         # EDAGroupBedrockConverseTool(),
         PptxBedrockConverseTool(),
         PdfBedrockConverseTool(),
-    ])
+    ],
+        cache    = ToolResultCache.default(),
+        executor = ToolExecutor.default(),
+        metrics  = ToolMetrics.default(),
+    )
 
 
 bedrock_client = get_bedrock_client()
@@ -783,6 +803,19 @@ if len(st.session_state.invocation_stats) != len(st.session_state.messages):
 if "uploader_key" not in st.session_state:
     st.session_state.uploader_key = 0
 
+# Datasets tools pass to each other by data_ref — one store per conversation,
+# since tool_registry itself is shared across sessions (st.cache_resource)
+if "result_store" not in st.session_state:
+    st.session_state.result_store = ResultStore()
+
+# Token-budgeted history per session — re-created when the model changes so
+# the calibration (from reported input tokens) matches the selected model.
+if st.session_state.get("context_window_model") != opt_model_id:
+    st.session_state.context_window = ContextWindowManager(
+        max_input_tokens=MAX_INPUT_TOKENS,
+    )
+    st.session_state.context_window_model = opt_model_id
+
 st.markdown(f"{len(st.session_state.messages)}/{MAX_MESSAGES}")
 
 
@@ -849,6 +882,7 @@ uploaded_file, file_bytes, file_key, file_type, file_preview = render_file_uploa
 def on_button_clear_clicked():
     st.session_state.messages = []
     st.session_state.invocation_stats = []
+    st.session_state.result_store.clear()
     st.rerun()
 
 with st.bottom:
@@ -879,17 +913,17 @@ if prompt:
     st.chat_message("user").markdown(prompt)
 
     # ── Per-turn accumulators ─────────────────────────────────────────────────
-    # accumulated["text"] grows with every streamed chunk and tool annotation.
     # turn_stat collects token/latency metrics across all LLM calls in this turn
     # (there may be multiple calls when tools are used in a loop).
-    accumulated = {"text": ""}
     turn_stat   = InvocationStat()
 
     with st.chat_message("assistant"):
         # result_area  — st.empty() single-slot placeholder.
-        #                Overwritten on every streamed text chunk so the user
-        #                sees the response grow in place.
+        #                sink renders the growing response into it at a
+        #                limited frame rate (cmn/view/stream_sink.py);
+        #                sink.text holds every chunk and tool annotation.
         result_area      = st.empty()
+        sink             = StreamingMarkdown(result_area)
         # result_container — st.container() that accumulates widgets.
         #                    renderer_registry appends charts, tables and other
         #                    rich tool visualisations here without overwriting
@@ -900,8 +934,7 @@ if prompt:
 
         def on_text_delta(chunk: str):
             """Fired for every streamed text chunk."""
-            accumulated["text"] += chunk
-            result_area.markdown(accumulated["text"])
+            sink.write(chunk)
 
         # def on_stream_result(result: StreamResult):
         #     """Fired after each complete LLM response."""
@@ -924,11 +957,10 @@ if prompt:
         # Accumulates metrics into turn_stat for later storage in session state.
         def on_stream_result(result: StreamResult):
             turn_stat.accumulate(result)
-            if result.stop_reason_display:
-                result_area.markdown(
-                    f"{accumulated['text']}\n\n"
-                    f":red[Generation Stopped: {result.stop_reason_display}]"
-                )
+            # Always flush: throttled deltas may still be pending at the end of the response
+            suffix = (f"\n\n:red[Generation Stopped: {result.stop_reason_display}]"
+                      if result.stop_reason_display else "")
+            sink.flush(suffix=suffix)
             for err in result.errors:
                 st.error(err)
 
@@ -937,23 +969,26 @@ if prompt:
         # rendering (charts, tables etc.) to the renderer registry.
         def on_tool_invoked(tool_name: str, tool_args: dict, tool_result: Any):
             turn_stat.record_tool(tool_name)
-            accumulated["text"] += (
+            sink.write(
                 f"\n\n:blue[🔧 **Tool:** `{tool_name}`]\n"
                 f"```json\n{json.dumps(tool_args, indent=2)}\n```\n"
                 f"**Result:** `{tool_result}`\n\n"
             )
-            result_area.markdown(accumulated["text"])
+            sink.flush()
             renderer_registry.render(tool_name, tool_args, tool_result, result_container)
 
         manager = ConversationManager(
             bedrock_client=bedrock_client,
-            tool_registry=tool_registry,
+            tool_registry=tool_registry.with_results(st.session_state.result_store),
             model_id=opt_model_id,
             inference_config={
                 "temperature": opt_temperature,
                 "maxTokens":   opt_max_tokens,
             },
             system_prompts=[{"text": opt_system_msg}],
+            context_window=st.session_state.context_window,
+            rate_limiter=RateLimiter.default(),
+            prompt_caching=True,
         )
 
         with st.spinner("Processing...", show_time=True, width="content"):
@@ -963,6 +998,8 @@ if prompt:
                 on_stream_result=on_stream_result,
                 on_tool_invoked=on_tool_invoked,
             )
+        sink.close()
+        turn_stat.render_ms = sink.render_ms
 
         # ── Show live metrics for this turn directly below the response ───────
         # These are also stored in session state so they reappear on rerun.
@@ -972,7 +1009,7 @@ if prompt:
     # ── Persist to session state ──────────────────────────────────────────────
     assistant_message = {
         "role":    "assistant",
-        "content": [{"text": accumulated["text"]}],
+        "content": [{"text": sink.text}],
     }
     st.session_state.messages.append(user_message)
     st.session_state.invocation_stats.append(None)
@@ -0,0 +1,100 @@
+"""
+Tool Diagnostics - Version 3.7.6
+================================
+
+Live view of ToolMetrics.default(): per-tool wall / CPU time percentiles,
+payload sizes, error and cache-hit rates for every tool call made through
+a ToolRegistry with metrics=ToolMetrics.default() (the converse tool v3
+page) in this server process, since start-up or the last reset.
+
+Tools are listed by total wall time — the top rows are the ones that make
+conversation turns slow. For CloudWatch / offline analysis set
+TOOL_METRICS_EXPORT (see cmn/tools/tool/metrics.py).
+"""
+
+import streamlit as st
+import pandas as pd
+
+from cmn.tools.tool.executor import ToolExecutor
+from cmn.tools.tool.metrics  import FIELDS, ToolMetrics
+
+st.set_page_config(
+    page_title="Tool Diagnostics",
+    page_icon="⏱️",
+    layout="wide",
+)
+
+metrics = ToolMetrics.default()
+
+
+################################################################################
+# SECTION: Streamlit Sidebar / Options
+################################################################################
+
+with st.sidebar:
+    st.header("⚙️ Options")
+    if st.button("Refresh", use_container_width=True):
+        st.rerun()
+    if st.button("Reset metrics", use_container_width=True):
+        metrics.reset()
+        st.rerun()
+    exporters = [type(e).__name__ + (f" → {e.path}" if e.path else " → stdout") for e in metrics.exporters]
+    st.caption("Exporters: " + (", ".join(exporters) if exporters else "none (TOOL_METRICS_EXPORT unset)"))
+
+
+################################################################################
+# SECTION: Summary
+################################################################################
+
+st.title("⏱️ Tool Diagnostics")
+
+stats = metrics.stats()
+if not stats:
+    st.info("No tool calls recorded yet. Run a conversation on the converse tool page first.")
+    st.stop()
+
+summary = pd.DataFrame(stats).set_index("tool")
+
+total_calls = int(summary["calls"].sum())
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("Tool calls",     f"{total_calls:,}")
+c2.metric("Tool time",      f"{summary['total_s'].sum():,.1f} s")
+c3.metric("Errors",         f"{int(summary['errors'].sum()):,}")
+c4.metric("Cache hit rate", f"{(summary['cache_hit_pct'] * summary['calls']).sum() / total_calls:.1f} %")
+
+st.subheader("Per tool")
+st.dataframe(summary, use_container_width=True)
+
+st.subheader("Share of tool time")
+st.bar_chart(summary["total_s"], horizontal=True)
+
+
+################################################################################
+# SECTION: Histogram
+################################################################################
+
+st.subheader("Distribution")
+
+c1, c2 = st.columns(2)
+tool  = c1.selectbox("Tool", summary.index.tolist())
+field = c2.selectbox("Metric", FIELDS)
+
+buckets = pd.DataFrame(metrics.histogram(tool, field))
+if buckets.empty:
+    st.caption(f"No {field} values for {tool}.")
+else:
+    buckets["bucket"] = buckets["le"].map(lambda v: f"≤ {v:,.3g}")
+    st.bar_chart(buckets, x="bucket", y="count", sort=False)
+
+
+################################################################################
+# SECTION: Recent Calls / Executor
+################################################################################
+
+st.subheader("Recent calls")
+recent = pd.DataFrame(metrics.recent())
+recent["timestamp"] = pd.to_datetime(recent["timestamp"], unit="s")
+st.dataframe(recent, use_container_width=True, hide_index=True)
+
+with st.expander("Executor"):
+    st.json(ToolExecutor.default().stats())
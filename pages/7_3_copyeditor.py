@@ -5,6 +5,7 @@ import json
 import logging
 import cmn_auth
 import pyperclip
+from cmn.view.stream_sink import StreamingMarkdown
 
 from botocore.exceptions import ClientError
 
@@ -140,10 +141,10 @@ if prompt := st.chat_input():
             body = json.dumps(request))
 
         #with st.chat_message("assistant", avatar=setAvatar("assistant")):
-        result_text = ""
         with st.chat_message("assistant"):
             result_container = st.container(border=True)
             result_area = st.empty()
+            sink = StreamingMarkdown(result_area)
             stream = response["body"]
             for event in stream:
                 
@@ -166,10 +167,8 @@ if prompt := st.chat_input():
 
                     elif chunk['type'] == 'content_block_delta':
                         if chunk['delta']['type'] == 'text_delta':
-                            text = chunk['delta']['text']
                             #await msg.stream_token(f"{text}")
-                            result_text += f"{text}"
-                            result_area.write(result_text)
+                            sink.write(chunk['delta']['text'])
 
                     elif chunk['type'] == 'message_stop':
                         invocation_metrics = chunk['amazon-bedrock-invocationMetrics']
@@ -185,27 +184,23 @@ if prompt := st.chat_input():
 
                 elif event["internalServerException"]:
                     exception = event["internalServerException"]
-                    result_text += f"\n\{exception}"
-                    result_area.write(result_text)
+                    sink.write(f"\n\{exception}")
                 elif event["modelStreamErrorException"]:
                     exception = event["modelStreamErrorException"]
-                    result_text += f"\n\{exception}"
-                    result_area.write(result_text)
+                    sink.write(f"\n\{exception}")
                 elif event["modelTimeoutException"]:
                     exception = event["modelTimeoutException"]
-                    result_text += f"\n\{exception}"
-                    result_area.write(result_text)
+                    sink.write(f"\n\{exception}")
                 elif event["throttlingException"]:
                     exception = event["throttlingException"]
-                    result_text += f"\n\{exception}"
-                    result_area.write(result_text)
+                    sink.write(f"\n\{exception}")
                 elif event["validationException"]:
                     exception = event["validationException"]
-                    result_text += f"\n\{exception}"
-                    result_area.write(result_text)
+                    sink.write(f"\n\{exception}")
                 else:
-                    result_text += f"\n\nUnknown Token"
-                    result_area.write(result_text)
+                    sink.write(f"\n\nUnknown Token")
+
+            result_text = sink.close()
 
             st.button(key='copy_button', label='📄', type='primary', on_click=copy_button_clicked, args=[result_text])
             
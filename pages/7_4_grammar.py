@@ -6,6 +6,7 @@ import logging
 import cmn_auth
 import cmn_constants
 from cmn.bedrock_models import FoundationModel
+from cmn.view.stream_sink import StreamingMarkdown
 
 from botocore.exceptions import ClientError
 
@@ -168,14 +169,12 @@ if user_text and analyze_button:  # Only analyze when button is clicked
             with st.container():
                 st.subheader("Analysis Results")
 
-                result_text = ""
                 result_area = st.empty()
+                sink = StreamingMarkdown(result_area)
 
                 for event in response.get('stream'):
                     if 'contentBlockDelta' in event:
-                        text = event['contentBlockDelta']['delta']['text']
-                        result_text += text
-                        result_area.markdown(result_text)
+                        sink.write(event['contentBlockDelta']['delta']['text'])
 
                     # Handle metadata and usage statistics
                     if 'metadata' in event:
@@ -188,6 +187,8 @@ if user_text and analyze_button:  # Only analyze when button is clicked
                             # Log usage statistics
                             st.caption(f"Analysis statistics: {total_token_count} total tokens used")
 
+                result_text = sink.close()
+
             st.session_state.analysis_result = result_text
             st.session_state.analysis_stats = f"Analysis statistics: {total_token_count} total tokens used"
             st.session_state.analysis_complete = True
@@ -254,14 +255,12 @@ Remember: Keep the response in the SAME LANGUAGE as the input text."""
             # Process and display the revised text
             with st.container():
                 st.subheader("Quick Revision")
-                result_text = ""
                 result_area = st.empty()
+                sink = StreamingMarkdown(result_area)
 
                 for event in response.get('stream'):
                     if 'contentBlockDelta' in event:
-                        text = event['contentBlockDelta']['delta']['text']
-                        result_text += text
-                        result_area.markdown(result_text)
+                        sink.write(event['contentBlockDelta']['delta']['text'])
 
                     # Handle metadata and usage statistics
                     if 'metadata' in event:
@@ -274,6 +273,8 @@ Remember: Keep the response in the SAME LANGUAGE as the input text."""
                             # Log usage statistics
                             st.caption(f"Quick revision statistics: {total_token_count} total tokens used")
 
+                sink.close()
+
         except Exception as e:
             st.error(f"An error occurred during quick revision: {str(e)}")
             logger.error(f"Quick revision error: {str(e)}", exc_info=True)
@@ -327,14 +328,12 @@ Remember: Keep the response in the SAME LANGUAGE as the input text."""
                 # Process and display the revised text
                 with st.container():
                     st.subheader("Revised Text")
-                    result_text = ""
                     result_area = st.empty()
+                    sink = StreamingMarkdown(result_area)
 
                     for event in response.get('stream'):
                         if 'contentBlockDelta' in event:
-                            text = event['contentBlockDelta']['delta']['text']
-                            result_text += text
-                            result_area.markdown(result_text)
+                            sink.write(event['contentBlockDelta']['delta']['text'])
 
                         # Handle metadata and usage statistics
                         if 'metadata' in event:
@@ -347,6 +346,8 @@ Remember: Keep the response in the SAME LANGUAGE as the input text."""
                                 # Log usage statistics
                                 st.caption(f"Revision statistics: {total_token_count} total tokens used")
 
+                    sink.close()
+
             except Exception as e:
                 st.error(f"An error occurred during revision: {str(e)}")
                 logger.error(f"Revision error: {str(e)}", exc_info=True)
@@ -16,6 +16,9 @@ from datetime import datetime
 
 from botocore.exceptions import BotoCoreError, ClientError
 
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.bedrock.rate_limiter import RateLimiter
+
 AWS_REGION = cmn_settings.AWS_REGION
 
 logger = logging.getLogger(__name__)
@@ -30,8 +33,10 @@ logging.basicConfig(level=logging.INFO)
 
 ####################################################################################
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
-bedrock_runtime_oregon = boto3.client('bedrock-runtime', region_name="us-west-2")
+bedrock_runtime = RateLimiter.default().wrap(
+    ClientRegistry.default().get('bedrock-runtime', AWS_REGION))
+bedrock_runtime_oregon = RateLimiter.default().wrap(
+    ClientRegistry.default().get('bedrock-runtime', "us-west-2"))
 polly = boto3.client("polly", region_name=AWS_REGION)
 
 ####################################################################################
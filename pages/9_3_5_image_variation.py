@@ -1,5 +1,4 @@
 import streamlit as st
-import boto3
 import cmn_settings
 import cmn_constants
 import json
@@ -15,6 +14,9 @@ from datetime import datetime
 
 from botocore.exceptions import BotoCoreError, ClientError
 
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.bedrock.rate_limiter import RateLimiter
+
 AWS_REGION = cmn_settings.AWS_REGION
 
 logger = logging.getLogger(__name__)
@@ -29,7 +31,8 @@ logging.basicConfig(level=logging.INFO)
 
 ####################################################################################
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
+bedrock_runtime = RateLimiter.default().wrap(
+    ClientRegistry.default().get('bedrock-runtime', AWS_REGION))
 
 ####################################################################################
 
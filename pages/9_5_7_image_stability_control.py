@@ -1,5 +1,4 @@
 import streamlit as st
-import boto3
 import json
 import logging
 import base64
@@ -7,6 +6,8 @@ import io
 import os
 from PIL import Image
 from botocore.exceptions import BotoCoreError, ClientError
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.bedrock.rate_limiter import RateLimiter
 from datetime import datetime
 
 # Configuration
@@ -18,7 +19,8 @@ logging.basicConfig(level=logging.INFO)
 ####################################################################################
 
 # Initialize Bedrock client
-bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
+bedrock_runtime = RateLimiter.default().wrap(
+    ClientRegistry.default().get('bedrock-runtime', AWS_REGION))
 
 ####################################################################################
 
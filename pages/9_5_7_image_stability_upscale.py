@@ -1,11 +1,12 @@
 import streamlit as st
-import boto3
 import json
 import logging
 import base64
 import io
 from PIL import Image
 from botocore.exceptions import BotoCoreError, ClientError
+from cmn.bedrock.client_registry import ClientRegistry
+from cmn.bedrock.rate_limiter import RateLimiter
 from datetime import datetime
 
 # Configuration
@@ -16,7 +17,8 @@ logging.basicConfig(level=logging.INFO)
 
 ####################################################################################
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION)
+bedrock_runtime = RateLimiter.default().wrap(
+    ClientRegistry.default().get('bedrock-runtime', AWS_REGION))
 
 ####################################################################################
 